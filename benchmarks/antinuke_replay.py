@@ -0,0 +1,478 @@
+from __future__ import annotations
+
+import argparse
+import asyncio
+import contextlib
+import json
+import statistics
+import tempfile
+import time
+from dataclasses import asdict, dataclass, field
+from typing import TYPE_CHECKING, Literal, cast
+
+import discord
+
+from constants import QUARANTINE_ROLE_ID
+from core.audit_log import AUDIT_LOG
+from core.state.store import flush_all
+from events.systems.antinuke import AntiNukeSystem
+
+if TYPE_CHECKING:
+    from collections.abc import AsyncIterator, Callable, Coroutine
+
+    from bot import UtilityBot
+
+# ⸻⸻⸻⸻⸻⸻⸻⸻⸻⸻⸻⸻⸻⸻⸻⸻⸻⸻⸻
+# Anti-Nuke Replay Benchmark
+# ⸻⸻⸻⸻⸻⸻⸻⸻⸻⸻⸻⸻⸻⸻⸻⸻⸻⸻⸻
+#
+# Replays synthetic event storms through AntiNukeSystem with fake guild,
+# member and audit-log objects, so it runs offline:
+#
+#     python -m benchmarks.antinuke_replay
+#     python -m benchmarks.antinuke_replay --audit poll --json
+#
+# An attacker only gets an action through while one of their roles still
+# grants the permission it needs, so both quarantine and the burst freeze
+# count as containment.
+
+AuditMode = Literal["stream", "poll"]
+
+BOT_USER_ID  : int = 900
+ATTACKER_ID  : int = 901
+MODERATOR_ID : int = 902
+
+AUDIT_DELAY  : float = 0.05
+REST_LATENCY : float = 0.15
+
+# ⸻⸻⸻⸻⸻⸻⸻⸻⸻⸻⸻⸻⸻⸻⸻⸻⸻⸻⸻
+# Fake Discord Objects
+# ⸻⸻⸻⸻⸻⸻⸻⸻⸻⸻⸻⸻⸻⸻⸻⸻⸻⸻⸻
+
+class FakeRole:
+    def __init__(
+        self,
+        guild       : FakeGuild,
+        role_id     : int,
+        name        : str,
+        position    : int,
+        permissions : discord.Permissions,
+        *,
+        managed     : bool = False,
+    ) -> None:
+        self.guild       = guild
+        self.id          = role_id
+        self.name        = name
+        self.position    = position
+        self.permissions = permissions
+        self.managed     = managed
+
+    def __lt__(self, other : FakeRole) -> bool:
+        return self.position < other.position
+
+    def __ge__(self, other : FakeRole) -> bool:
+        return self.position >= other.position
+
+    async def edit(
+        self,
+        *,
+        permissions : discord.Permissions,
+        reason      : str | None = None,  # noqa: ARG002
+    ) -> None:
+        await self.guild.rest_call()
+        self.permissions = permissions
+        self.guild.replay.on_permissions_changed()
+
+class FakeMember:
+    def __init__(
+        self,
+        guild     : FakeGuild,
+        member_id : int,
+        roles     : list[FakeRole],
+    ) -> None:
+        self.guild   = guild
+        self.id      = member_id
+        self.name    = f"member-{member_id}"
+        self.mention = f"<@{member_id}>"
+        self.roles   = roles
+
+    @property
+    def top_role(self) -> FakeRole:
+        return max(self.roles, key = lambda role: role.position)
+
+    def can(self, permission : str) -> bool:
+        return any(
+            role.permissions.administrator or getattr(role.permissions, permission)
+            for role in self.roles
+        )
+
+    async def edit(
+        self,
+        *,
+        roles  : list[FakeRole] | None = None,
+        nick   : str | None            = None,  # noqa: ARG002
+        reason : str | None            = None,  # noqa: ARG002
+    ) -> None:
+        await self.guild.rest_call()
+        if roles is not None:
+            self.roles = [self.guild.default_role, *roles]
+        if any(role.id == QUARANTINE_ROLE_ID for role in self.roles):
+            self.guild.replay.on_quarantined(self.id)
+        self.guild.replay.on_permissions_changed()
+
+class FakeChannel:
+    def __init__(
+        self,
+        guild      : FakeGuild,
+        channel_id : int,
+    ) -> None:
+        self.guild = guild
+        self.id    = channel_id
+        self.name  = f"channel-{channel_id}"
+
+class FakeAuditEntry:
+    def __init__(
+        self,
+        guild  : FakeGuild,
+        action : discord.AuditLogAction,
+        user   : FakeMember,
+        target : FakeChannel | FakeRole,
+    ) -> None:
+        self.guild  = guild
+        self.action = action
+        self.user   = user
+        self.target = target
+
+class FakeGuild:
+    def __init__(
+        self,
+        replay   : Replay,
+        guild_id : int,
+    ) -> None:
+        self.replay        = replay
+        self.id            = guild_id
+        self.rest_latency  = REST_LATENCY
+        self.rest_calls    = 0
+        self.audit_entries : list[FakeAuditEntry] = []
+        self.default_role  = FakeRole(self, guild_id, "@everyone", 0, discord.Permissions.none())
+        self.roles         : list[FakeRole]           = [self.default_role]
+        self.members       : dict[int, FakeMember]    = {}
+        self.channels      : dict[int, FakeChannel]   = {}
+        self._next_id      = guild_id + 1
+
+    def snowflake(self) -> int:
+        self._next_id += 1
+        return self._next_id
+
+    def add_role(
+        self,
+        name        : str,
+        permissions : discord.Permissions,
+        *,
+        role_id     : int | None = None,
+        managed     : bool       = False,
+    ) -> FakeRole:
+        role = FakeRole(self, role_id or self.snowflake(), name, len(self.roles), permissions, managed = managed)
+        self.roles.append(role)
+        return role
+
+    def add_member(
+        self,
+        member_id : int,
+        roles     : list[FakeRole],
+    ) -> FakeMember:
+        member = FakeMember(self, member_id, [self.default_role, *roles])
+        self.members[member_id] = member
+        return member
+
+    def add_channel(self) -> FakeChannel:
+        channel = FakeChannel(self, self.snowflake())
+        self.channels[channel.id] = channel
+        return channel
+
+    @property
+    def me(self) -> FakeMember:
+        return self.members[BOT_USER_ID]
+
+    def get_member(self, member_id : int) -> FakeMember | None:
+        return self.members.get(member_id)
+
+    def get_role(self, role_id : int) -> FakeRole | None:
+        return next((role for role in self.roles if role.id == role_id), None)
+
+    def get_channel(self, channel_id : int) -> FakeChannel | None:
+        return self.channels.get(channel_id)
+
+    async def rest_call(self) -> None:
+        self.rest_calls += 1
+        await asyncio.sleep(self.rest_latency)
+
+    async def audit_logs(
+        self,
+        *,
+        limit  : int,
+        action : discord.AuditLogAction | None = None,
+    ) -> AsyncIterator[FakeAuditEntry]:
+        await self.rest_call()
+        entries = [entry for entry in reversed(self.audit_entries) if action is None or entry.action == action]
+        for entry in entries[:limit]:
+            yield entry
+
+class FakeCasesManager:
+    def __init__(self) -> None:
+        self.logged = 0
+
+    async def log_case(self, **_ : object) -> None:
+        self.logged += 1
+
+class FakeBot:
+    def __init__(self) -> None:
+        self.user          = discord.Object(BOT_USER_ID)
+        self.mod_data      : dict[str, dict[str, object]] = {}
+        self.cases_manager = FakeCasesManager()
+
+# ⸻⸻⸻⸻⸻⸻⸻⸻⸻⸻⸻⸻⸻⸻⸻⸻⸻⸻⸻
+# Replay
+# ⸻⸻⸻⸻⸻⸻⸻⸻⸻⸻⸻⸻⸻⸻⸻⸻⸻⸻⸻
+
+@dataclass(slots = True)
+class ReplayResult:
+    scenario           : str
+    audit              : str
+    events             : int
+    through            : int
+    blocked            : int
+    quarantined        : bool
+    frozen             : bool
+    time_to_quarantine : float | None
+    time_to_contain    : float | None
+    cpu_per_event_us   : float
+    rest_calls         : int
+    latencies          : list[float] = field(default_factory = list)
+
+    @property
+    def p50_handler_ms(self) -> float:
+        return statistics.median(self.latencies) * 1000 if self.latencies else 0.0
+
+class Replay:
+    def __init__(
+        self,
+        name        : str,
+        audit       : AuditMode,
+        guild_id    : int,
+        audit_delay : float,
+    ) -> None:
+        self.name         = name
+        self.audit        = audit
+        self.audit_delay  = audit_delay
+        self.guild        = FakeGuild(self, guild_id)
+        self.bot          = FakeBot()
+        self.started      = 0.0
+        self.quarantined  : float | None = None
+        self.contained    : float | None = None
+        self.events       = 0
+        self.through      = 0
+        self.blocked      = 0
+        self.latencies    : list[float]             = []
+        self._handlers    : set[asyncio.Task[None]] = set()
+        self.cog          : AntiNukeSystem
+
+        guild = self.guild
+        for index in range(40):
+            _ = guild.add_role(f"Filler {index}", discord.Permissions(send_messages = True))
+
+        self.quarantine_role = guild.add_role("Quarantine", discord.Permissions.none(), role_id = QUARANTINE_ROLE_ID)
+        self.member_role     = guild.add_role("Member", discord.Permissions(send_messages = True))
+        self.moderator_role  = guild.add_role("Moderator", discord.Permissions(manage_channels = True))
+        self.admin_role      = guild.add_role("Administrator", discord.Permissions(administrator = True))
+        self.bot_role        = guild.add_role("Utility Bot", discord.Permissions(administrator = True), managed = True)
+
+        for _index in range(40):
+            _ = guild.add_channel()
+
+        _ = guild.add_member(BOT_USER_ID, [self.bot_role])
+        self.attacker  = guild.add_member(ATTACKER_ID, [self.member_role, self.admin_role])
+        self.moderator = guild.add_member(MODERATOR_ID, [self.member_role, self.moderator_role])
+
+    def on_quarantined(self, member_id : int) -> None:
+        if member_id == ATTACKER_ID and self.quarantined is None:
+            self.quarantined = time.perf_counter() - self.started
+
+    def on_permissions_changed(self) -> None:
+        if self.contained is None and not self.attacker.can("manage_channels") and not self.attacker.can("manage_roles"):
+            self.contained = time.perf_counter() - self.started
+
+    def dispatch(self, handler : Coroutine[object, object, None]) -> None:
+        async def timed() -> None:
+            start = time.perf_counter()
+            await handler
+            self.latencies.append(time.perf_counter() - start)
+
+        task = asyncio.create_task(timed())
+        self._handlers.add(task)
+        task.add_done_callback(self._handlers.discard)
+
+    def record(
+        self,
+        actor  : FakeMember,
+        action : discord.AuditLogAction,
+        target : FakeChannel | FakeRole,
+    ) -> None:
+        entry = FakeAuditEntry(self.guild, action, actor, target)
+        self.guild.audit_entries.append(entry)
+        if self.audit == "stream":
+            _ = asyncio.get_running_loop().call_later(
+                self.audit_delay,
+                AUDIT_LOG.push,
+                cast("discord.AuditLogEntry", entry),
+            )
+
+    def act(
+        self,
+        actor      : FakeMember,
+        kind       : str,
+        permission : str,
+    ) -> None:
+        if not actor.can(permission):
+            self.blocked += 1
+            return
+
+        self.events += 1
+        if actor is self.attacker:
+            self.through += 1
+        guild = self.guild
+
+        if kind == "channel_delete":
+            channel = guild.channels.pop(next(iter(guild.channels)))
+            self.record(actor, discord.AuditLogAction.channel_delete, channel)
+            self.dispatch(self.cog.on_guild_channel_delete(cast("discord.abc.GuildChannel", channel)))
+        elif kind == "channel_create":
+            channel = guild.add_channel()
+            self.record(actor, discord.AuditLogAction.channel_create, channel)
+            self.dispatch(self.cog.on_guild_channel_create(cast("discord.abc.GuildChannel", channel)))
+        elif kind == "role_delete":
+            role = next(role for role in guild.roles if role.name.startswith("Filler"))
+            guild.roles.remove(role)
+            self.record(actor, discord.AuditLogAction.role_delete, role)
+            self.dispatch(self.cog.on_guild_role_delete(cast("discord.Role", role)))
+
+    async def run(self, steps : list[tuple[float, FakeMember, str, str]]) -> ReplayResult:
+        self.cog     = AntiNukeSystem(cast("UtilityBot", self.bot))
+        cpu_start    = time.process_time()
+        self.started = time.perf_counter()
+
+        for delay, actor, kind, permission in steps:
+            await asyncio.sleep(delay)
+            self.act(actor, kind, permission)
+
+        while self._handlers:
+            _ = await asyncio.wait(list(self._handlers))
+        while self.cog._freeze_tasks:  # noqa: SLF001
+            _ = await asyncio.wait(list(self.cog._freeze_tasks))  # noqa: SLF001
+
+        cpu = time.process_time() - cpu_start
+        await self.cog.cog_unload()
+        await flush_all()
+
+        return ReplayResult(
+            scenario           = self.name,
+            audit              = self.audit,
+            events             = self.events,
+            through            = self.through,
+            blocked            = self.blocked,
+            quarantined        = self.quarantined is not None,
+            frozen             = str(self.guild.id) in self.cog.frozen_roles,
+            time_to_quarantine = self.quarantined,
+            time_to_contain    = self.contained,
+            cpu_per_event_us   = cpu / max(self.events, 1) * 1_000_000,
+            rest_calls         = self.guild.rest_calls,
+            latencies          = self.latencies,
+        )
+
+# ⸻⸻⸻⸻⸻⸻⸻⸻⸻⸻⸻⸻⸻⸻⸻⸻⸻⸻⸻
+# Scenarios
+# ⸻⸻⸻⸻⸻⸻⸻⸻⸻⸻⸻⸻⸻⸻⸻⸻⸻⸻⸻
+
+Step = tuple[float, FakeMember, str, str]
+
+def channel_storm(replay : Replay) -> list[Step]:
+    return [(0.02, replay.attacker, "channel_delete", "manage_channels") for _ in range(30)]
+
+def role_storm(replay : Replay) -> list[Step]:
+    return [(0.02, replay.attacker, "role_delete", "manage_roles") for _ in range(30)]
+
+def mixed_storm(replay : Replay) -> list[Step]:
+    kinds = [("channel_delete", "manage_channels"), ("role_delete", "manage_roles"), ("channel_create", "manage_channels")]
+    return [(0.03, replay.attacker, *kinds[index % len(kinds)]) for index in range(30)]
+
+def slow_drip(replay : Replay) -> list[Step]:
+    return [(0.4, replay.attacker, "channel_delete", "manage_channels") for _ in range(8)]
+
+def benign(replay : Replay) -> list[Step]:
+    return [
+        (0.3, replay.moderator, "channel_create", "manage_channels"),
+        (0.3, replay.moderator, "channel_create", "manage_channels"),
+        (0.5, replay.moderator, "channel_delete", "manage_channels"),
+    ]
+
+SCENARIOS : dict[str, Callable[[Replay], list[Step]]] = {
+    "channel-storm" : channel_storm,
+    "role-storm"    : role_storm,
+    "mixed-storm"   : mixed_storm,
+    "slow-drip"     : slow_drip,
+    "benign"        : benign,
+}
+
+async def run_scenarios(
+    names       : list[str],
+    audit       : AuditMode,
+    audit_delay : float,
+) -> list[ReplayResult]:
+    results : list[ReplayResult] = []
+    for index, name in enumerate(names):
+        # A fresh guild per scenario keeps the shared audit-log correlator
+        # from answering one replay with another replay's entries.
+        replay = Replay(name, audit, 10_000_000 * (index + 1), audit_delay)
+        results.append(await replay.run(SCENARIOS[name](replay)))
+    return results
+
+def _ms(value : float | None) -> str:
+    return "-" if value is None else f"{value * 1000:.0f}"
+
+def format_results(results : list[ReplayResult]) -> str:
+    header = f"{'scenario':<14} {'audit':<6} {'events':>6} {'through':>7} {'blocked':>7} {'quarantine ms':>13} {'contain ms':>10} {'p50 handler ms':>14} {'cpu/event us':>12} {'rest':>5}"
+    lines  = [header, "-" * len(header)]
+    lines.extend(
+        f"{result.scenario:<14} {result.audit:<6} {result.events:>6} {result.through:>7} {result.blocked:>7} "
+        f"{_ms(result.time_to_quarantine):>13} {_ms(result.time_to_contain):>10} {result.p50_handler_ms:>14.1f} "
+        f"{result.cpu_per_event_us:>12.1f} {result.rest_calls:>5}"
+        for result in results
+    )
+    return "\n".join(lines)
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description = "Replay synthetic event storms through the anti-nuke system.")
+    _ = parser.add_argument("--scenario", choices = list(SCENARIOS), action = "append", help = "scenario to run (repeatable, default: all)")
+    _ = parser.add_argument("--audit", choices = ["stream", "poll"], default = "stream", help = "how audit-log entries reach the bot")
+    _ = parser.add_argument("--audit-delay", type = float, default = AUDIT_DELAY, help = "seconds between an event and its audit-log entry")
+    _ = parser.add_argument("--json", action = "store_true", help = "print machine-readable results")
+    args = parser.parse_args()
+
+    names = cast("list[str] | None", args.scenario) or list(SCENARIOS)
+
+    # The cog persists its state relative to the working directory, so keep
+    # replays out of the real data files.
+    with tempfile.TemporaryDirectory() as workdir, contextlib.chdir(workdir):
+        results = asyncio.run(run_scenarios(names, cast("AuditMode", args.audit), cast("float", args.audit_delay)))
+
+    if cast("bool", args.json):
+        payload = [
+            {**{key : value for key, value in asdict(result).items() if key != "latencies"}, "p50_handler_ms" : result.p50_handler_ms}
+            for result in results
+        ]
+        print(json.dumps(payload, indent = 4))  # noqa: T201
+    else:
+        print(format_results(results))  # noqa: T201
+
+if __name__ == "__main__":
+    main()
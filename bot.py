@@ -6,6 +6,7 @@ from discord.ext import commands
 from typing_extensions import override
 
 from core.cases import CasesManager
+from core.state.store import flush_all
 
 # ⸻⸻⸻⸻⸻⸻⸻⸻⸻⸻⸻⸻⸻⸻⸻⸻⸻⸻⸻
 # Bot Management
@@ -38,6 +39,8 @@ class UtilityBot(commands.Bot):
 
         log: logging.Logger = logging.getLogger("Utility Bot")
 
+        await self.cases_manager.open()
+
         priority_load : list[str] = [
             "events.systems.antinuke",
             "events.systems.verification",
@@ -57,4 +60,10 @@ class UtilityBot(commands.Bot):
             except Exception:
                 log.exception("Failed to load cog: %s", cog)
 
+    @override
+    async def close(self) -> None:
+        await flush_all()
+        await self.cases_manager.close()
+        await super().close()
+
 bot : UtilityBot = UtilityBot()
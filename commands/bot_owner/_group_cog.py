@@ -1,4 +1,5 @@
 import logging
+from typing import Literal
 
 import discord
 from discord import app_commands
@@ -7,6 +8,8 @@ from discord.ext import commands
 from testing import MemberSelectView
 
 from ._base import cog_autocomplete, get_cogs
+from .cases.export_cases import run_export_cases
+from .cases.import_cases import run_import_cases
 from .cogs.load import run_load
 from .cogs.pull_reload import run_pull_reload
 from .cogs.reload import run_reload
@@ -124,6 +127,44 @@ class BotOwnerCommands(
             get_cogs(),
         )
 
+    # ⸻⸻⸻⸻⸻⸻⸻⸻⸻⸻⸻⸻⸻⸻⸻⸻⸻⸻⸻
+    # /bot-owner export-cases Command
+    # ⸻⸻⸻⸻⸻⸻⸻⸻⸻⸻⸻⸻⸻⸻⸻⸻⸻⸻⸻
+
+    @app_commands.command(
+        name        = "export-cases",
+        description = "Export this server's cases as NDJSON or CSV.",
+    )
+    @app_commands.describe(fmt = "The export file format.")
+    @app_commands.rename(fmt = "format")
+    async def export_cases(
+        self,
+        interaction : discord.Interaction,
+        fmt         : Literal["ndjson", "csv"] = "ndjson",
+    ) -> None:
+        await run_export_cases(self.bot, interaction, fmt)
+
+    # ⸻⸻⸻⸻⸻⸻⸻⸻⸻⸻⸻⸻⸻⸻⸻⸻⸻⸻⸻
+    # /bot-owner import-cases Command
+    # ⸻⸻⸻⸻⸻⸻⸻⸻⸻⸻⸻⸻⸻⸻⸻⸻⸻⸻⸻
+
+    @app_commands.command(
+        name        = "import-cases",
+        description = "Import cases into this server from an NDJSON or CSV export.",
+    )
+    @app_commands.describe(
+        file = "The exported cases file.",
+        fmt  = "The file format. Detected from the file extension by default.",
+    )
+    @app_commands.rename(fmt = "format")
+    async def import_cases(
+        self,
+        interaction : discord.Interaction,
+        file        : discord.Attachment,
+        fmt         : Literal["ndjson", "csv"] | None = None,
+    ) -> None:
+        await run_import_cases(self.bot, interaction, file, fmt)
+
     # ⸻⸻⸻⸻⸻⸻⸻⸻⸻⸻⸻⸻⸻⸻⸻⸻⸻⸻⸻
     # .shutdown/.shut Command
     # ⸻⸻⸻⸻⸻⸻⸻⸻⸻⸻⸻⸻⸻⸻⸻⸻⸻⸻⸻
@@ -0,0 +1,71 @@
+from __future__ import annotations
+
+import tempfile
+from datetime import UTC, datetime
+from pathlib import Path
+from typing import TYPE_CHECKING, cast
+
+import discord
+
+import core.responses as cr
+from constants import BOT_OWNER_ID
+from core.case_transfer import TransferFormat, export_cases
+from core.responses import send_custom_message
+
+if TYPE_CHECKING:
+    from discord.ext import commands
+
+    from bot import UtilityBot
+
+# ⸻⸻⸻⸻⸻⸻⸻⸻⸻⸻⸻⸻⸻⸻
+# /bot-owner export-cases Logic
+# ⸻⸻⸻⸻⸻⸻⸻⸻⸻⸻⸻⸻⸻⸻
+
+async def run_export_cases(
+    bot         : commands.Bot,
+    interaction : discord.Interaction,
+    fmt         : TransferFormat,
+) -> None:
+    if interaction.user.id != BOT_OWNER_ID:
+        _ = await send_custom_message(
+            interaction,
+            msg_type = cr.error,
+            title    = "run command",
+            subtitle = "You are not authorized to run this command.",
+            footer   = "No permissions",
+        )
+        return
+
+    guild = interaction.guild
+    if not guild:
+        return
+
+    _ = await interaction.response.defer(ephemeral = True)
+
+    manager   = cast("UtilityBot", bot).cases_manager
+    timestamp = datetime.now(UTC).strftime("%Y%m%d-%H%M%S")
+
+    with tempfile.TemporaryDirectory() as tmp:
+        path  = Path(tmp) / f"cases-{guild.id}-{timestamp}.{fmt}"
+        total = await export_cases(manager, guild.id, path, fmt)
+
+        if path.stat().st_size > guild.filesize_limit:
+            _ = await send_custom_message(
+                interaction,
+                msg_type = cr.warning,
+                title    = "export cases",
+                subtitle = f"The export of **{total}** cases is larger than this server's upload limit.",
+                footer   = "Bad operation",
+            )
+            return
+
+        _ = await send_custom_message(
+            interaction,
+            msg_type = cr.success,
+            title    = "Exported cases",
+            subtitle = f"Exported **{total}** cases as `{fmt}`.",
+        )
+        _ = await interaction.followup.send(
+            file      = discord.File(path, filename = path.name),
+            ephemeral = True,
+        )
@@ -0,0 +1,100 @@
+from __future__ import annotations
+
+import tempfile
+from pathlib import Path
+from typing import TYPE_CHECKING, cast
+
+import discord
+
+import core.responses as cr
+from constants import BOT_OWNER_ID
+from core.case_transfer import TransferFormat, import_cases
+from core.responses import send_custom_message
+
+if TYPE_CHECKING:
+    from discord.ext import commands
+
+    from bot import UtilityBot
+
+# ⸻⸻⸻⸻⸻⸻⸻⸻⸻⸻⸻⸻⸻⸻
+# /bot-owner import-cases Logic
+# ⸻⸻⸻⸻⸻⸻⸻⸻⸻⸻⸻⸻⸻⸻
+
+async def run_import_cases(
+    bot         : commands.Bot,
+    interaction : discord.Interaction,
+    attachment  : discord.Attachment,
+    fmt         : TransferFormat | None,
+) -> None:
+    if interaction.user.id != BOT_OWNER_ID:
+        _ = await send_custom_message(
+            interaction,
+            msg_type = cr.error,
+            title    = "run command",
+            subtitle = "You are not authorized to run this command.",
+            footer   = "No permissions",
+        )
+        return
+
+    guild = interaction.guild
+    if not guild:
+        return
+
+    suffix = Path(attachment.filename).suffix.lower().lstrip(".")
+    if fmt is None:
+        if suffix not in ("ndjson", "jsonl", "csv"):
+            _ = await send_custom_message(
+                interaction,
+                msg_type = cr.warning,
+                title    = "import cases",
+                subtitle = "Could not detect the file format. Pass `format` explicitly.",
+                footer   = "Bad argument",
+            )
+            return
+        fmt = "csv" if suffix == "csv" else "ndjson"
+
+    _ = await interaction.response.defer(ephemeral = True)
+
+    manager = cast("UtilityBot", bot).cases_manager
+
+    with tempfile.TemporaryDirectory() as tmp:
+        path = Path(tmp) / "import"
+        try:
+            _ = await attachment.save(path)
+        except discord.HTTPException:
+            _ = await send_custom_message(
+                interaction,
+                msg_type          = cr.error,
+                title             = "import cases",
+                subtitle          = "Failed to download the attachment.",
+                footer            = "Bad operation",
+                contact_bot_owner = True,
+            )
+            return
+
+        try:
+            result = await import_cases(manager, guild.id, path, fmt)
+        except UnicodeDecodeError:
+            _ = await send_custom_message(
+                interaction,
+                msg_type = cr.warning,
+                title    = "import cases",
+                subtitle = "The file is not valid UTF-8 text.",
+                footer   = "Bad argument",
+            )
+            return
+
+    subtitle = (
+        f"Imported **{result['imported']}** cases. "
+        f"Skipped **{result['skipped']}** already present and "
+        f"**{result['invalid']}** invalid records."
+    )
+    if result["errors"]:
+        subtitle += "\n" + "\n".join(f"- {error}" for error in result["errors"])
+
+    _ = await send_custom_message(
+        interaction,
+        msg_type = cr.success if not result["invalid"] else cr.information,
+        title    = "Imported cases",
+        subtitle = subtitle,
+    )
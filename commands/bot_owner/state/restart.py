@@ -12,6 +12,7 @@ from discord.ext import commands
 import core.responses as cr
 from constants import DENIED_EMOJI
 from core.responses import send_custom_message
+from core.state.store import flush_all_sync
 
 
 # ⸻⸻⸻⸻⸻⸻⸻⸻⸻⸻⸻⸻⸻⸻
@@ -105,6 +106,8 @@ async def restart_bot(
             except TimeoutError:
                 log.exception("Some tasks did not cancel in time")
 
+        flush_all_sync()
+
         for handler in log.handlers:
             if hasattr(handler, "flush"):
                 handler.flush()
@@ -6,6 +6,7 @@ from discord.ext import commands
 import core.responses as cr
 from constants import BOT_OWNER_ID
 from core.responses import send_custom_message
+from core.state.store import flush_all
 
 # ⸻⸻⸻⸻⸻⸻⸻⸻⸻⸻⸻⸻⸻⸻
 # .shutdown Logic
@@ -35,4 +36,5 @@ async def run_shutdown(
         subtitle = "Shutting down bot...",
     )
 
+    await flush_all()
     await bot.close()
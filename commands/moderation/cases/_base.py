@@ -2,7 +2,7 @@ from __future__ import annotations
 
 import contextlib
 from datetime import UTC, datetime
-from typing import TYPE_CHECKING, ClassVar, NotRequired
+from typing import TYPE_CHECKING, ClassVar, NotRequired, Protocol
 
 import discord
 from discord import ButtonStyle
@@ -10,6 +10,8 @@ from discord.ui import Button, View
 from typing_extensions import TypedDict, override
 
 if TYPE_CHECKING:
+    from collections.abc import Awaitable
+
     from bot import UtilityBot
 
 from constants import (
@@ -31,6 +33,7 @@ from core.permissions import (
     is_senior_moderator,
 )
 from core.responses import send_custom_message
+from core.user_resolver import user_resolver
 
 # ⸻⸻⸻⸻⸻⸻⸻⸻⸻⸻⸻⸻⸻⸻⸻⸻⸻⸻⸻
 # TypedDicts
@@ -107,7 +110,7 @@ class ClassificationView(View):
             )
             return
 
-        case = self.cases_manager.get_case_by_id(self.case_id)
+        case = await self.cases_manager.get_case_by_id(self.case_id)
         if not case or not case.get("pending_visibility"):
             _ = await send_custom_message(
                 interaction,
@@ -118,7 +121,7 @@ class ClassificationView(View):
             )
             return
 
-        _ = self.cases_manager.approve_visibility(self.case_id)
+        _ = await self.cases_manager.approve_visibility(self.case_id)
 
         thread = interaction.channel
         if isinstance(thread, discord.Thread):
@@ -167,7 +170,7 @@ class ClassificationView(View):
             )
             return
 
-        case = self.cases_manager.get_case_by_id(self.case_id)
+        case = await self.cases_manager.get_case_by_id(self.case_id)
         if not case or not case.get("pending_visibility"):
             _ = await send_custom_message(
                 interaction,
@@ -178,7 +181,7 @@ class ClassificationView(View):
             )
             return
 
-        _ = self.cases_manager.deny_visibility(self.case_id)
+        _ = await self.cases_manager.deny_visibility(self.case_id)
 
         thread = interaction.channel
         if isinstance(thread, discord.Thread):
@@ -203,39 +206,102 @@ class ClassificationView(View):
 # Cases Paginators
 # ⸻⸻⸻⸻⸻⸻⸻⸻⸻⸻⸻⸻⸻⸻⸻⸻⸻⸻⸻
 
+class PageFetcher(Protocol):
+    def __call__(
+        self,
+        after_case_id : int | None,
+        limit         : int,
+        *,
+        ascending     : bool = False,
+    ) -> Awaitable[list[CaseData]]: ...
+
 class CaseQueryPaginator(View):
-    interaction : discord.Interaction
-    cases       : list[CaseData]
-    title       : str
-    color_map   : dict[str, discord.Color]
-    per_page    : int
-    page        : int
-    max_page    : int
+    interaction  : discord.Interaction
+    fetch_page   : PageFetcher
+    cases        : list[CaseData]
+    title        : str
+    color_map    : dict[str, discord.Color]
+    per_page     : int
+    page         : int
+    total        : int
+    max_page     : int
+    has_next     : bool
+    has_previous : bool
     def __init__(
         self,
         interaction : discord.Interaction,
-        cases       : list[CaseData],
+        fetch_page  : PageFetcher,
+        total       : int,
         title       : str,
         color_map   : dict[str, discord.Color],
     ) -> None:
         super().__init__(timeout = 120)
-        self.interaction = interaction
-        self.cases       = cases
-        self.title       = title
-        self.color_map   = color_map
-        self.per_page    = 5
-        self.page        = 0
-        self.max_page    = (len(cases) - 1) // self.per_page
-
+        self.interaction  = interaction
+        self.fetch_page   = fetch_page
+        self.cases        = []
+        self.title        = title
+        self.color_map    = color_map
+        self.per_page     = 5
+        self.page         = 0
+        self.total        = total
+        self.max_page     = max(0, (total - 1) // self.per_page)
+        self.has_next     = False
+        self.has_previous = False
+
+    async def start(self) -> None:
+        await self.load_first()
         self.update_buttons()
 
-    def update_buttons(self) -> None:
-        no_pagination_needed = len(self.cases) <= self.per_page
+    # Pages are keyset slices: ">" reads below the oldest case shown, "<"
+    # reads above the newest one, and ">>" reads the tail of the index
+    # directly instead of paging through everything before it.
+    async def load_first(self) -> None:
+        cases = await self.fetch_page(None, self.per_page + 1)
 
-        self.first_page.disabled    = no_pagination_needed or self.page == 0
-        self.previous_page.disabled = no_pagination_needed or self.page == 0
-        self.next_page.disabled     = no_pagination_needed or self.page >= self.max_page
-        self.last_page.disabled     = no_pagination_needed or self.page >= self.max_page
+        self.page         = 0
+        self.has_previous = False
+        self.has_next     = len(cases) > self.per_page
+        self.cases        = cases[:self.per_page]
+
+    async def load_next(self) -> None:
+        if not self.cases:
+            return
+        cases = await self.fetch_page(self.cases[-1]["case_id"], self.per_page + 1)
+        if not cases:
+            self.has_next = False
+            return
+
+        self.page         = min(self.page + 1, self.max_page)
+        self.has_previous = True
+        self.has_next     = len(cases) > self.per_page
+        self.cases        = cases[:self.per_page]
+
+    async def load_previous(self) -> None:
+        if not self.cases:
+            return
+        cases = await self.fetch_page(self.cases[0]["case_id"], self.per_page + 1, ascending = True)
+        if not cases:
+            await self.load_first()
+            return
+
+        self.has_next     = True
+        self.has_previous = len(cases) > self.per_page
+        self.page         = max(self.page - 1, 1) if self.has_previous else 0
+        self.cases        = cases[:self.per_page][::-1]
+
+    async def load_last(self) -> None:
+        cases = await self.fetch_page(None, self.per_page + 1, ascending = True)
+
+        self.has_next     = False
+        self.has_previous = len(cases) > self.per_page
+        self.page         = self.max_page if self.has_previous else 0
+        self.cases        = cases[:self.per_page][::-1]
+
+    def update_buttons(self) -> None:
+        self.first_page.disabled    = not self.has_previous
+        self.previous_page.disabled = not self.has_previous
+        self.next_page.disabled     = not self.has_next
+        self.last_page.disabled     = not self.has_next
 
     def _format_case_field(
         self,
@@ -292,17 +358,13 @@ class CaseQueryPaginator(View):
         return f"Case #{case['case_id']}", "\n".join(parts)
 
     def get_embed(self) -> discord.Embed:
-        start      = self.page * self.per_page
-        end        = start + self.per_page
-        page_cases = self.cases[start:end]
-
         embed = discord.Embed(
             title     = self.title,
             color     = COLOR_BLURPLE,
             timestamp = datetime.now(UTC),
         )
 
-        for case in page_cases:
+        for case in self.cases:
             name, value = self._format_case_field(case)
             _ = embed.add_field(
                 name   = name,
@@ -310,8 +372,7 @@ class CaseQueryPaginator(View):
                 inline = False,
             )
 
-        _ = embed.set_footer(text = f"Page {self.page + 1}/{self.max_page + 1} · {len(self.cases)} cases total",
-        )
+        _ = embed.set_footer(text = f"Page {self.page + 1}/{self.max_page + 1} · {self.total} cases total")
 
         return embed
 
@@ -331,7 +392,7 @@ class CaseQueryPaginator(View):
         interaction : discord.Interaction,
         _button     : Button[CaseQueryPaginator],
     ) -> None:
-        self.page = 0
+        await self.load_first()
         self.update_buttons()
         _ = await interaction.response.edit_message(embed = self.get_embed(), view = self)
 
@@ -344,8 +405,7 @@ class CaseQueryPaginator(View):
         interaction : discord.Interaction,
         _button     : Button[CaseQueryPaginator],
     ) -> None:
-        if self.page > 0:
-            self.page -= 1
+        await self.load_previous()
         self.update_buttons()
         _ = await interaction.response.edit_message(embed = self.get_embed(), view = self)
 
@@ -358,8 +418,7 @@ class CaseQueryPaginator(View):
         interaction : discord.Interaction,
         _button     : Button[CaseQueryPaginator],
     ) -> None:
-        if self.page < self.max_page:
-            self.page += 1
+        await self.load_next()
         self.update_buttons()
         _ = await interaction.response.edit_message(
             embed = self.get_embed(),
@@ -375,7 +434,7 @@ class CaseQueryPaginator(View):
         interaction : discord.Interaction,
         _button     : Button[CaseQueryPaginator],
     ) -> None:
-        self.page = self.max_page
+        await self.load_last()
         self.update_buttons()
         _ = await interaction.response.edit_message(
             embed = self.get_embed(),
@@ -538,6 +597,9 @@ class CasesMixin:
     def can_configure(self, member : discord.Member) -> bool:
         return is_director(member)
 
+    def can_view_stats(self, member : discord.Member) -> bool:
+        return is_director(member)
+
     def _visibility_level(self, member : discord.Member) -> int:
         if is_director(member):
             return 3
@@ -586,34 +648,34 @@ class CasesMixin:
             timestamp = created,
         )
 
-        mod_added = False
-        with contextlib.suppress(discord.NotFound, discord.HTTPException):
-            mod = await bot.fetch_user(case["moderator_id"])
+        target_user_id = case.get("target_user_id")
+        users          = await user_resolver(bot).resolve_many(
+            [case["moderator_id"], target_user_id] if target_user_id else [case["moderator_id"]],
+        )
+
+        mod = users[case["moderator_id"]]
+        if mod:
             _ = embed.add_field(
                 name   = "Moderator",
                 value  = mod.mention,
                 inline = True,
             )
-            mod_added = True
-        if not mod_added:
+        else:
             _ = embed.add_field(
                 name   = "Moderator",
                 value  = case["moderator_name"],
                 inline = True,
             )
 
-        target_user_id = case.get("target_user_id")
         if target_user_id:
-            user_added = False
-            with contextlib.suppress(discord.NotFound, discord.HTTPException):
-                user = await bot.fetch_user(target_user_id)
+            user = users[target_user_id]
+            if user:
                 _ = embed.add_field(
                     name   = "User",
                     value  = f"{user.mention} ({user.id})",
                     inline = True,
                 )
-                user_added = True
-            if not user_added:
+            else:
                 target_user_name = case.get("target_user_name")
                 _ = embed.add_field(
                     name   = "User",
@@ -24,6 +24,7 @@ from .configure import run_configure
 from .delete_entry import run_delete_entry
 from .edit_entry import run_edit_entry
 from .query import run_query
+from .stats import STATS_MAX_DAYS, run_stats
 from .view import run_view
 
 # ⸻⸻⸻⸻⸻⸻⸻⸻⸻⸻⸻⸻⸻⸻⸻⸻⸻⸻⸻
@@ -65,7 +66,7 @@ class CasesCommands(CasesMixin, commands.GroupCog, name = "cases", description =
         user          = "Filter by user.",
         moderator     = "Filter by moderator.",
         case_type     = "Filter by case type.",
-        contains      = "Search reason or content.",
+        contains      = "Search reason or content. All words must match; word prefixes work.",
         after         = "Only cases after this date (ISO format: YYYY-MM-DD).",
         before        = "Only cases before this date (ISO format: YYYY-MM-DD).",
         include_notes = "Include note entries. Default: true.",
@@ -108,6 +109,22 @@ class CasesCommands(CasesMixin, commands.GroupCog, name = "cases", description =
             mass_only     = mass_only,
         )
 
+    # ⸻⸻⸻⸻⸻⸻⸻⸻⸻⸻⸻⸻⸻⸻
+    # /cases stats Command
+    # ⸻⸻⸻⸻⸻⸻⸻⸻⸻⸻⸻⸻⸻⸻
+
+    @app_commands.command(
+        name        = "stats",
+        description = "View moderation statistics for this server.",
+    )
+    @app_commands.describe(days = "Only count the last N days. Default: all time.")
+    async def cases_stats(
+        self        : CasesCommands,
+        interaction : discord.Interaction,
+        days        : app_commands.Range[int, 1, STATS_MAX_DAYS] | None = None,
+    ) -> None:
+        await run_stats(self, interaction, days)
+
     # ⸻⸻⸻⸻⸻⸻⸻⸻⸻⸻⸻⸻⸻⸻
     # /cases view Command
     # ⸻⸻⸻⸻⸻⸻⸻⸻⸻⸻⸻⸻⸻⸻
@@ -90,7 +90,7 @@ async def run_add_note(
         )
 
     if case_id is not None:
-        existing_case = self.cases_manager.get_case_by_id(case_id)
+        existing_case = await self.cases_manager.get_case_by_id(case_id)
         if existing_case is None or existing_case.get("guild_id") != guild.id:
             _ = errors.add_field(
                 title     = "add note",
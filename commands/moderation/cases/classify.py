@@ -45,7 +45,7 @@ async def run_classify(
     if not guild:
         return
 
-    case = self.cases_manager.get_case_by_id(case_id)
+    case = await self.cases_manager.get_case_by_id(case_id)
 
     if not case or case["guild_id"] != guild.id:
         await send_custom_message(
@@ -59,7 +59,7 @@ async def run_classify(
 
     if is_director(actor):
         label = visibility.replace("_", " ").title()
-        _ = self.cases_manager.set_visibility(case_id, visibility)
+        _ = await self.cases_manager.set_visibility(case_id, visibility)
         await send_custom_message(
             interaction,
             msg_type = "success",
@@ -114,7 +114,7 @@ async def run_classify(
 
     label = visibility.replace("_", " ").title()
 
-    _ = self.cases_manager.request_visibility(case_id, visibility)
+    _ = await self.cases_manager.request_visibility(case_id, visibility)
 
     view           = ClassificationView(case_id, self.cases_manager)
     thread_name    = f"DR: Classification Request by {actor.display_name}"
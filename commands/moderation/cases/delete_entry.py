@@ -37,7 +37,7 @@ async def run_delete_entry(
     if not guild:
         return
 
-    case = self.cases_manager.get_case_by_id(case_id)
+    case = await self.cases_manager.get_case_by_id(case_id)
 
     if not case or case["guild_id"] != guild.id:
         await send_custom_message(
@@ -49,7 +49,7 @@ async def run_delete_entry(
         )
         return
 
-    _ = self.cases_manager.delete_case(case_id)
+    _ = await self.cases_manager.delete_case(case_id)
 
     await send_custom_message(
         interaction,
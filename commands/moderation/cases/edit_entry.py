@@ -28,7 +28,7 @@ async def run_edit_entry(
     if not guild:
         return
 
-    case   = self.cases_manager.get_case_by_id(case_id)
+    case   = await self.cases_manager.get_case_by_id(case_id)
     errors = multi_custom_message(interaction)
 
     if not case or case["guild_id"] != guild.id:
@@ -69,7 +69,7 @@ async def run_edit_entry(
         await errors.send()
         return
 
-    _ = self.cases_manager.edit_case(case_id, content)
+    _ = await self.cases_manager.edit_case(case_id, content)
 
     await send_custom_message(
         interaction,
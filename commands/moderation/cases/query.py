@@ -94,7 +94,35 @@ async def run_query(
 
     _ = await interaction.response.defer(ephemeral = True)
 
-    cases : list[dict[str, Any]] = self.cases_manager.get_cases(
+    def is_visible(case : dict[str, Any]) -> bool:
+        if mass_only and not (
+            isinstance(case.get("metadata"), dict) and case["metadata"].get("mass_action")
+        ):
+            return False
+        return self.can_see_case(actor, case)
+
+    async def fetch_page(
+        after_case_id : int | None,
+        limit         : int,
+        *,
+        ascending     : bool = False,
+    ) -> list[dict[str, Any]]:
+        return await self.cases_manager.iter_cases(
+            guild_id      = guild.id,
+            user_id       = user.id if user else None,
+            moderator_id  = moderator.id if moderator else None,
+            case_type     = case_type,
+            contains      = contains,
+            after         = after_dt,
+            before        = before_dt,
+            include_notes = include_notes,
+            after_case_id = after_case_id,
+            ascending     = ascending,
+            limit         = limit,
+            predicate     = is_visible,
+        )
+
+    total = await self.cases_manager.count_cases(
         guild_id      = guild.id,
         user_id       = user.id if user else None,
         moderator_id  = moderator.id if moderator else None,
@@ -105,15 +133,20 @@ async def run_query(
         include_notes = include_notes,
     )
 
-    if mass_only:
-        cases = [
-            c for c in cases
-            if isinstance(c.get("metadata"), dict) and c["metadata"].get("mass_action")
-        ]
+    title_parts: list[str] = []
+    if user:
+        title_parts.append(f"for {user.name}")
+    if moderator:
+        title_parts.append(f"by {moderator.name}")
+    if case_type:
+        title_parts.append(f"({case_type.replace('_', ' ').title()})")
+
+    title = "Cases " + " ".join(title_parts) if title_parts else "All Cases"
 
-    cases = [c for c in cases if self.can_see_case(actor, c)]
+    view = CaseQueryPaginator(interaction, fetch_page, total, title, self.COLOR_MAP)
+    await view.start()
 
-    if not cases:
+    if not view.cases:
         filters: list[str] = []
         if user:
             filters.append(f"user {user.mention}")
@@ -131,15 +164,4 @@ async def run_query(
         await interaction.followup.send(embed = embed, ephemeral = True)
         return
 
-    title_parts: list[str] = []
-    if user:
-        title_parts.append(f"for {user.name}")
-    if moderator:
-        title_parts.append(f"by {moderator.name}")
-    if case_type:
-        title_parts.append(f"({case_type.replace('_', ' ').title()})")
-
-    title = "Cases " + " ".join(title_parts) if title_parts else "All Cases"
-
-    view = CaseQueryPaginator(interaction, cases, title, self.COLOR_MAP)
     await interaction.followup.send(embed = view.get_embed(), view = view, ephemeral = True)
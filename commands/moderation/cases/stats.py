@@ -0,0 +1,123 @@
+from __future__ import annotations
+
+from datetime import UTC, datetime, timedelta
+from typing import TYPE_CHECKING
+
+import discord
+
+if TYPE_CHECKING:
+    from ._group_cog import CasesCommands
+
+from constants import COLOR_BLURPLE, COLOR_GREEN
+from core.case_stats import SECONDS_PER_DAY
+from core.responses import send_custom_message
+
+# ⸻⸻⸻⸻⸻⸻⸻⸻⸻⸻⸻⸻⸻⸻
+# /cases stats Logic
+# ⸻⸻⸻⸻⸻⸻⸻⸻⸻⸻⸻⸻⸻⸻
+
+STATS_RECENT_DAYS  : int = 7
+STATS_RECENT_WEEKS : int = 8
+STATS_MAX_DAYS     : int = 3650
+
+def _day_label(day : int) -> str:
+    return datetime.fromtimestamp(day * SECONDS_PER_DAY, UTC).strftime("%Y-%m-%d")
+
+def _week_label(week : int) -> str:
+    return _day_label(week * 7 - 3)
+
+async def run_stats(
+    self        : CasesCommands,
+    interaction : discord.Interaction,
+    days        : int | None,
+) -> None:
+    actor = interaction.user
+    if not isinstance(actor, discord.Member):
+        return
+
+    if not self.can_view_stats(actor):
+        await send_custom_message(
+            interaction,
+            msg_type = "error",
+            title    = "run command",
+            subtitle = "You are not authorized to run this command.",
+            footer   = "No permissions",
+        )
+        return
+
+    guild = interaction.guild
+    if not guild:
+        return
+
+    since = datetime.now(UTC) - timedelta(days = days - 1) if days is not None else None
+    if since is not None:
+        since = since.replace(hour = 0, minute = 0, second = 0, microsecond = 0)
+
+    stats = self.cases_manager.get_stats(guild.id, since)
+
+    if not stats["total"]:
+        embed = discord.Embed(
+            description = "No moderation actions recorded for this period.",
+            color       = COLOR_GREEN,
+        )
+        await interaction.response.send_message(embed = embed, ephemeral = True)
+        return
+
+    title = f"Moderation Statistics — Last {days} Days" if days is not None else "Moderation Statistics"
+    embed = discord.Embed(
+        title     = title,
+        color     = COLOR_BLURPLE,
+        timestamp = datetime.now(UTC),
+    )
+
+    _ = embed.add_field(
+        name   = "Total Actions",
+        value  = str(stats["total"]),
+        inline = True,
+    )
+    _ = embed.add_field(
+        name   = "Repeat Offenders",
+        value  = str(stats["repeat_offenders"]),
+        inline = True,
+    )
+    _ = embed.add_field(
+        name   = "By Type",
+        value  = "\n".join(
+            f"**{case_type.replace('_', ' ').title()}:** {count}"
+            for case_type, count in stats["by_type"]
+        ),
+        inline = False,
+    )
+    _ = embed.add_field(
+        name   = "Top Moderators",
+        value  = "\n".join(f"<@{user_id}> — {count}" for user_id, count in stats["by_moderator"]),
+        inline = True,
+    )
+
+    if stats["top_offenders"]:
+        _ = embed.add_field(
+            name   = "Top Repeat Offenders",
+            value  = "\n".join(f"<@{user_id}> — {count}" for user_id, count in stats["top_offenders"]),
+            inline = True,
+        )
+
+    _ = embed.add_field(
+        name   = "Daily",
+        value  = "\n".join(
+            f"`{_day_label(day)}` — {count}"
+            for day, count in stats["by_day"][-STATS_RECENT_DAYS:]
+        ),
+        inline = False,
+    )
+    _ = embed.add_field(
+        name   = "Weekly",
+        value  = "\n".join(
+            f"Week of `{_week_label(week)}` — {count}"
+            for week, count in stats["by_week"][-STATS_RECENT_WEEKS:]
+        ),
+        inline = True,
+    )
+
+    _ = embed.set_footer(text = "Notes are not counted as actions.")
+
+    await interaction.response.send_message(embed = embed, ephemeral = True)
@@ -40,7 +40,7 @@ async def run_view(
 
     _ = await interaction.response.defer(ephemeral = True)
 
-    case = self.cases_manager.get_case_by_id(case_id)
+    case = await self.cases_manager.get_case_by_id(case_id)
 
     if not case or case["guild_id"] != guild.id:
         await send_custom_message(
@@ -64,7 +64,7 @@ async def run_view(
 
     embed = await self.build_case_embed(self.bot, guild, case)
 
-    notes         = self.cases_manager.get_related_notes(case_id, guild.id)
+    notes         = await self.cases_manager.get_related_notes(case_id, guild.id)
     visible_notes = [n for n in notes if self.can_see_case(actor, n)]
 
     if not visible_notes:
@@ -2,7 +2,7 @@ import asyncio
 import contextlib
 import json
 from collections.abc import Awaitable, Callable
-from datetime import UTC, datetime, timedelta
+from datetime import UTC, datetime
 from pathlib import Path
 from typing import TYPE_CHECKING, cast
 
@@ -25,7 +25,11 @@ from discord.ui import (
 from typing_extensions import override
 
 from core.cases import CasesManager, CaseType
+from core.mass_moderation import MASS_ACTION_CONCURRENCY, MassActionExecutor
+from core.rate_limits import RATE_LIMIT_DAY, RATE_LIMIT_HOUR, RateLimitTracker
 from core.responses import multi_custom_message, send_custom_message
+from core.role_swap import plan_role_swap
+from core.state.store import StateStore
 
 if TYPE_CHECKING:
     from bot import UtilityBot
@@ -50,6 +54,9 @@ from core.permissions import (
     is_senior_moderator,
 )
 
+MODERATION_STORE = StateStore(Path("moderation_data.json"), indent = 4)
+RATE_LIMITS      = RateLimitTracker(Path("data/rate_limits"))
+
 PROTECTED_ROLE_IDS = [
     STAFF_ROLE_ID,
     ADMINISTRATORS_ROLE_ID,
@@ -73,6 +80,38 @@ QUARANTINE_DAILY_LIMIT  = 20
 SEVERE_HOURLY_LIMIT     = 4
 SEVERE_DAILY_LIMIT      = 8
 
+ACTION_RATE_LIMITS : dict[str, tuple[int, int, str]] = {
+    "ban"        : (BAN_HOURLY_LIMIT, BAN_DAILY_LIMIT, "bans"),
+    "kick"       : (KICK_HOURLY_LIMIT, KICK_DAILY_LIMIT, "kicks"),
+    "timeout"    : (TIMEOUT_HOURLY_LIMIT, TIMEOUT_DAILY_LIMIT, "timeouts"),
+    "quarantine" : (QUARANTINE_HOURLY_LIMIT, QUARANTINE_DAILY_LIMIT, "quarantines"),
+}
+
+SEVERE_ACTIONS : frozenset[str] = frozenset({"ban", "kick", "quarantine"})
+
+BulkModerationCallback = Callable[
+    [
+        discord.Interaction,
+        list[tuple[discord.Member, dict[str, object]]],
+    ],
+    Awaitable[list[tuple[bool, str]]],
+]
+
+# Purges scan the same channel history, so they stay one member at a time.
+SEQUENTIAL_MASS_ACTIONS : frozenset[str] = frozenset({"purge"})
+
+async def send_action_result(
+    interaction : discord.Interaction,
+    embed       : discord.Embed,
+) -> None:
+    # The action has already been applied by the time its confirmation is
+    # sent, so a failed send must not surface as a failed (and retried) action.
+    with contextlib.suppress(discord.HTTPException):
+        if interaction.response.is_done():
+            _ = await interaction.followup.send(embed = embed, ephemeral = True)
+        else:
+            _ = await interaction.response.send_message(embed = embed, ephemeral = True)
+
 # ⸻⸻⸻⸻⸻⸻⸻⸻⸻⸻⸻⸻⸻⸻⸻⸻⸻⸻⸻
 # Moderation Base
 # ⸻⸻⸻⸻⸻⸻⸻⸻⸻⸻⸻⸻⸻⸻⸻⸻⸻⸻⸻
@@ -242,8 +281,12 @@ class ModerationBase(commands.Cog):
     ) -> None:
         self.bot = bot
 
-        if not hasattr(bot, "mod_data"):
-            bot.mod_data = self._load_data()
+        _ = self.ensure_data(bot)
+
+        legacy_limits = self.data.pop("rate_limits", None)
+        if isinstance(legacy_limits, dict):
+            RATE_LIMITS.migrate(cast(dict[str, dict[str, list[str]]], legacy_limits))
+            self.save_data()
 
     @property
     def data(self) -> dict[
@@ -256,38 +299,49 @@ class ModerationBase(commands.Cog):
     def cases_manager(self) -> CasesManager:
         return self.bot.cases_manager
 
-    def _load_data(self) -> dict[str, object]:
-        if Path("moderation_data.json").exists():
-            with contextlib.suppress(json.JSONDecodeError), Path("moderation_data.json").open() as f:
-                data_json = cast(
-                    object,
-                    json.load(f),
-                )
-                if isinstance(
+    @classmethod
+    def ensure_data(cls, bot : "UtilityBot") -> dict[str, object]:
+        # Anything that saves moderation_data.json has to start from the file,
+        # or the first save replaces it with whatever was set in memory.
+        if not bot.mod_data:
+            bot.mod_data = cls._load_data()
+        return bot.mod_data
+
+    @classmethod
+    def _load_data(cls) -> dict[str, object]:
+        with contextlib.suppress(json.JSONDecodeError):
+            data_json = cast(
+                object,
+                MODERATION_STORE.read(),
+            )
+            if isinstance(
+                data_json,
+                dict,
+            ):
+                return cast(
+                    dict[
+                        str,
+                        object,
+                    ],
                     data_json,
-                    dict,
-                ):
-                    return cast(
-                        dict[
-                            str,
-                            object,
-                        ],
-                        data_json,
-                    )
-        return self._get_default_data()
-
-    def _get_default_data(self) -> dict[str, object]:
+                )
+        return cls._get_default_data()
+
+    @staticmethod
+    def _get_default_data() -> dict[str, object]:
         return {
             "bans"        : {},
             "timeouts"    : {},
             "kicks"       : {},
-            "rate_limits" : {},
             "quarantined" : {},
         }
 
     def save_data(self) -> None:
-        with Path("moderation_data.json").open("w") as f:
-            json.dump(self.data, f, indent = 4)
+        MODERATION_STORE.save(self.data)
+
+    async def persist_data(self) -> None:
+        self.save_data()
+        await MODERATION_STORE.flush()
 
     def ensure_data_section(
         self,
@@ -329,77 +383,6 @@ class ModerationBase(commands.Cog):
         except ValueError:
             return None
 
-    def _ensure_rate_limit_entry(
-        self,
-        user_id : str,
-    ) -> None:
-        if "rate_limits" not in self.data:
-            self.data["rate_limits"] = {}
-
-        raw_limits = self.data.get("rate_limits")
-        if not isinstance(raw_limits, dict):
-            self.data["rate_limits"] = {}
-            raw_limits = self.data["rate_limits"]
-
-        rate_limits = cast(
-            dict[
-                str,
-                dict[
-                    str,
-                    list[str],
-                ],
-            ],
-            raw_limits,
-        )
-
-        if user_id not in rate_limits:
-            rate_limits[user_id] = {}
-
-        rl : dict[
-            str,
-            list[str],
-        ] = rate_limits[user_id]
-        for key in (
-            "ban_hourly"       , "ban_daily",
-            "kick_hourly"      , "kick_daily",
-            "timeout_hourly"   , "timeout_daily",
-            "quarantine_hourly", "quarantine_daily",
-            "severe_hourly"    , "severe_daily",
-        ):
-            if key not in rl:
-                rl[key] = []
-
-    def clean_old_rate_limits(
-        self,
-        user_id : str,
-    ) -> None:
-        now = datetime.now(UTC)
-        self._ensure_rate_limit_entry(user_id)
-
-        raw_limits = self.data.get("rate_limits")
-        if not isinstance(raw_limits, dict):
-            return
-
-        rate_limits = cast(
-            dict[
-                str,
-                dict[
-                    str,
-                    list[str],
-                ],
-            ],
-            raw_limits,
-        )
-        rl : dict[
-            str,
-            list[str],
-        ] = rate_limits[user_id]
-
-        for key in ("ban_hourly", "kick_hourly", "timeout_hourly", "quarantine_hourly", "severe_hourly"):
-            rl[key] = [ts for ts in rl[key] if datetime.fromisoformat(ts) > now - timedelta(hours=1)]
-        for key in ("ban_daily", "kick_daily", "timeout_daily", "quarantine_daily", "severe_daily"):
-            rl[key] = [ts for ts in rl[key] if datetime.fromisoformat(ts) > now - timedelta(days=1)]
-
     def check_rate_limit(
         self,
         user_id : str,
@@ -408,36 +391,22 @@ class ModerationBase(commands.Cog):
         bool,
         str,
     ]:
-        self.clean_old_rate_limits(user_id)
+        moderator_id = int(user_id)
 
-        rate_limits = cast(dict[str, dict[str, list[str]]], self.data["rate_limits"])
-        rl = rate_limits[user_id]
-
-        if len(rl["severe_hourly"]) >= SEVERE_HOURLY_LIMIT:
+        if RATE_LIMITS.count(moderator_id, "severe", RATE_LIMIT_HOUR) >= SEVERE_HOURLY_LIMIT:
             return False, f"Severe action hourly limit exceeded ({SEVERE_HOURLY_LIMIT} bans/kicks/quarantines per hour)"
-        if len(rl["severe_daily"]) >= SEVERE_DAILY_LIMIT:
+        if RATE_LIMITS.count(moderator_id, "severe", RATE_LIMIT_DAY) >= SEVERE_DAILY_LIMIT:
             return False, f"Severe action daily limit exceeded ({SEVERE_DAILY_LIMIT} bans/kicks/quarantines per day)"
 
-        if action == "ban":
-            if len(rl["ban_hourly"]) >= BAN_HOURLY_LIMIT:
-                return False, f"Ban hourly limit exceeded ({BAN_HOURLY_LIMIT} bans per hour)"
-            if len(rl["ban_daily"]) >= BAN_DAILY_LIMIT:
-                return False, f"Ban daily limit exceeded ({BAN_DAILY_LIMIT} bans per day)"
-        elif action == "kick":
-            if len(rl["kick_hourly"]) >= KICK_HOURLY_LIMIT:
-                return False, f"Kick hourly limit exceeded ({KICK_HOURLY_LIMIT} kicks per hour)"
-            if len(rl["kick_daily"]) >= KICK_DAILY_LIMIT:
-                return False, f"Kick daily limit exceeded ({KICK_DAILY_LIMIT} kicks per day)"
-        elif action == "timeout":
-            if len(rl["timeout_hourly"]) >= TIMEOUT_HOURLY_LIMIT:
-                return False, f"Timeout hourly limit exceeded ({TIMEOUT_HOURLY_LIMIT} timeouts per hour)"
-            if len(rl["timeout_daily"]) >= TIMEOUT_DAILY_LIMIT:
-                return False, f"Timeout daily limit exceeded ({TIMEOUT_DAILY_LIMIT} timeouts per day)"
-        elif action == "quarantine":
-            if len(rl["quarantine_hourly"]) >= QUARANTINE_HOURLY_LIMIT:
-                return False, f"Quarantine hourly limit exceeded ({QUARANTINE_HOURLY_LIMIT} quarantines per hour)"
-            if len(rl["quarantine_daily"]) >= QUARANTINE_DAILY_LIMIT:
-                return False, f"Quarantine daily limit exceeded ({QUARANTINE_DAILY_LIMIT} quarantines per day)"
+        limits = ACTION_RATE_LIMITS.get(action)
+        if limits is None:
+            return True, ""
+
+        hourly_limit, daily_limit, noun = limits
+        if RATE_LIMITS.count(moderator_id, action, RATE_LIMIT_HOUR) >= hourly_limit:
+            return False, f"{action.title()} hourly limit exceeded ({hourly_limit} {noun} per hour)"
+        if RATE_LIMITS.count(moderator_id, action, RATE_LIMIT_DAY) >= daily_limit:
+            return False, f"{action.title()} daily limit exceeded ({daily_limit} {noun} per day)"
 
         return True, ""
 
@@ -446,42 +415,11 @@ class ModerationBase(commands.Cog):
         user_id : str,
         action  : str,
     ) -> None:
-        now = datetime.now(UTC).isoformat()
-        self._ensure_rate_limit_entry(user_id)
-
-        rate_limits = cast(
-            dict[
-                str,
-                dict[
-                    str,
-                    list[str],
-                ],
-            ],
-            self.data["rate_limits"],
-        )
-        rl : dict[
-            str,
-            list[str],
-        ] = rate_limits[user_id]
-
-        if action in ("ban", "kick", "quarantine"):
-            rl["severe_hourly"].append(now)
-            rl["severe_daily"].append(now)
-
-        if action == "ban":
-            rl["ban_hourly"].append(now)
-            rl["ban_daily"].append(now)
-        elif action == "kick":
-            rl["kick_hourly"].append(now)
-            rl["kick_daily"].append(now)
-        elif action == "timeout":
-            rl["timeout_hourly"].append(now)
-            rl["timeout_daily"].append(now)
-        elif action == "quarantine":
-            rl["quarantine_hourly"].append(now)
-            rl["quarantine_daily"].append(now)
+        if action not in ACTION_RATE_LIMITS:
+            return
 
-        self.save_data()
+        actions = [action, "severe"] if action in SEVERE_ACTIONS else [action]
+        RATE_LIMITS.add(int(user_id), actions)
 
     def has_protected_role(
         self,
@@ -595,7 +533,8 @@ class ModerationBase(commands.Cog):
         if not quarantine_role:
             return
 
-        saved_roles = [role.id for role in moderator.roles if role.id != guild.id]
+        swap        = plan_role_swap(moderator, add = [quarantine_role])
+        saved_roles = swap.removed
 
         if "quarantined" not in self.data or not isinstance(self.data["quarantined"], dict):
             self.data["quarantined"] = {}
@@ -616,12 +555,10 @@ class ModerationBase(commands.Cog):
             "quarantined_by" : self.bot.user.id,
             "reason"         : "UB Anti-Nuke: exceeded moderation rate limits",
         }
-        self.save_data()
+        await self.persist_data()
 
         try:
-            roles_to_remove = [role for role in moderator.roles if role.id != guild.default_role.id]
-            await moderator.remove_roles(*roles_to_remove, reason = "UB Anti-Nuke: Exceeded rate limits")
-            await moderator.add_roles(quarantine_role, reason = "UB Anti-Nuke: Exceeded rate limits")
+            await swap.apply(reason = "UB Anti-Nuke: Exceeded rate limits")
 
             bot_member = guild.get_member(self.bot.user.id)
             if bot_member:
@@ -723,8 +660,10 @@ class MassModerationView(LayoutView):
             ]
         ],
     ]
+    bulk_callback     : BulkModerationCallback | None = None
     page              : int
     locked            : bool = False
+    progress          : str | None = None
     values            : dict[
         int,
         dict[
@@ -767,6 +706,7 @@ class MassModerationView(LayoutView):
                 ]
             ],
         ],
+        bulk_callback     : BulkModerationCallback | None = None,
     ) -> None:
         super().__init__(timeout = 300)
         self.base              = base
@@ -777,8 +717,10 @@ class MassModerationView(LayoutView):
         self.with_duration     = with_duration
         self.precheck_callback = precheck_callback
         self.execute_callback  = execute_callback
+        self.bulk_callback     = bulk_callback
         self.page              = 0
         self.locked            = False
+        self.progress          = None
         self.values            = {
             member.id : {
                 "reason"   : None,
@@ -826,6 +768,8 @@ class MassModerationView(LayoutView):
             _ = self.add_item(Section(TextDisplay(member.mention), accessory = button))
 
         _ = self.add_item(Separator(visible = True))
+        if self.progress:
+            _ = self.add_item(TextDisplay(f"-# {self.progress}"))
 
         global_button : Button[LayoutView] = Button(label = "Global", style = ButtonStyle.primary, disabled = self.locked)
         run_button    : Button[LayoutView] = Button(label = "Execute", style = ButtonStyle.danger, disabled = self.locked)
@@ -859,32 +803,38 @@ class MassModerationView(LayoutView):
             self.locked = True
             await self.update(interaction)
 
-            results : list[tuple[discord.Member, bool, str]] = []
-
-            for member in self.members:
-                if self.precheck_callback:
-                    can_run, precheck_msg = self.precheck_callback(actor, member)
-                    if not can_run:
-                        results.append((member, False, precheck_msg))
-                        continue
-
-                if self.action_key in {"ban", "kick", "timeout", "quarantine"} and not is_director(actor):
-                    can_proceed, error_msg = self.base.check_rate_limit(str(actor.id), self.action_key)
-                    if not can_proceed:
-                        guild = interaction.guild
-                        if guild:
-                            await self.base.auto_quarantine_moderator(actor, guild)
-                        results.append((member, False, f"Rate limited: {error_msg}"))
-                        current_index = self.members.index(member)
-
-                        results.extend([(m, False, "Skipped: mass run stopped due to rate limit") for m in self.members[current_index + 1:]])
-
-                        break
+            def admit(_member : discord.Member) -> tuple[bool, str]:
+                if self.action_key not in ACTION_RATE_LIMITS or is_director(actor):
+                    return True, ""
+                can_proceed, error_msg = self.base.check_rate_limit(str(actor.id), self.action_key)
+                if can_proceed:
                     self.base.add_rate_limit_entry(str(actor.id), self.action_key)
+                return can_proceed, error_msg
+
+            async def on_progress(done : int, total : int) -> None:
+                self.progress = f"Running mass {self.action_label.lower()}: {done}/{total} processed"
+                await self.update(interaction)
+
+            precheck = self.precheck_callback
+            executor : MassActionExecutor[discord.Member] = MassActionExecutor(
+                lambda member : self.execute_callback(interaction, member, self.values[member.id]),
+                precheck    = (lambda member : precheck(actor, member)) if precheck else None,
+                admit       = admit,
+                on_progress = on_progress,
+                concurrency = 1 if self.action_key in SEQUENTIAL_MASS_ACTIONS else MASS_ACTION_CONCURRENCY,
+            )
+            bulk = self.bulk_callback
+            if bulk is not None:
+                report = await executor.execute_batch(
+                    self.members,
+                    lambda members : bulk(interaction, [(member, self.values[member.id]) for member in members]),
+                )
+            else:
+                report = await executor.execute(self.members)
+            results = report.results
 
-                ok, message = await self.execute_callback(interaction, member, self.values[member.id])
-                results.append((member, ok, message))
-                await asyncio.sleep(1.2)
+            if report.stopped is not None and interaction.guild:
+                await self.base.auto_quarantine_moderator(actor, interaction.guild)
 
             succeeded = [r for r in results if r[1]]
             failed    = [r for r in results if not r[1]]
@@ -973,6 +923,7 @@ class MemberPickerView(View):
             ]
         ],
     ]
+    bulk_callback     : BulkModerationCallback | None = None
     def __init__(
         self,
         base              : ModerationBase,
@@ -1006,6 +957,7 @@ class MemberPickerView(View):
                 ]
             ],
         ],
+        bulk_callback     : BulkModerationCallback | None = None,
     ) -> None:
         super().__init__(timeout = 180)
         self.base              = base
@@ -1014,6 +966,7 @@ class MemberPickerView(View):
         self.with_duration     = with_duration
         self.precheck_callback = precheck_callback
         self.execute_callback  = execute_callback
+        self.bulk_callback     = bulk_callback
         self.active_view : MassModerationView | None = None
 
     @discord.ui.select(
@@ -1081,5 +1034,6 @@ class MemberPickerView(View):
             with_duration     = self.with_duration,
             precheck_callback = self.precheck_callback,
             execute_callback  = self.execute_callback,
+            bulk_callback     = self.bulk_callback,
         )
         _ = await interaction.response.send_message(view = self.active_view, ephemeral = True)
@@ -148,13 +148,18 @@ class ModerationCommands(
         name        = "bans",
         description = "View all banned members.",
     )
+    @app_commands.describe(
+        search = "Filter by user ID or name.",
+    )
     async def bans(
         self,
         interaction : discord.Interaction,
+        search      : str | None = None,
     ) -> None:
         await run_bans(
             self,
             interaction,
+            search,
         )
 
     # ⸻⸻⸻⸻⸻⸻⸻⸻⸻⸻⸻⸻⸻⸻
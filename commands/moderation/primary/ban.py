@@ -10,10 +10,13 @@ if TYPE_CHECKING:
 
 from constants import COLOR_BLACK
 from core.cases import CaseType
+from core.mass_moderation import MassActionExecutor
 from core.permissions import is_director
 from core.responses import send_custom_message
 
-from ._base import MemberPickerView
+from ._base import MemberPickerView, send_action_result
+
+BULK_BAN_LIMIT : int = 200
 
 # ⸻⸻⸻⸻⸻⸻⸻⸻⸻⸻⸻⸻⸻⸻
 # /moderation ban Logic
@@ -56,6 +59,7 @@ async def run_ban(
                 delete_messages or 0,
                 cast(discord.Attachment, data.get("proof")) if data.get("proof") is not None else None,
             ),
+            bulk_callback    = lambda i, targets: _execute_bulk_ban(base, i, actor, targets, delete_messages or 0),
         )
         _ = await interaction.response.send_message(view = picker, ephemeral = True)
         return
@@ -207,14 +211,106 @@ async def _execute_ban(
     except discord.Forbidden:
         return False, "I lack permissions to ban members: `Ban Members`"
     else:
-        if interaction.response.is_done():
-            await interaction.followup.send(
-                embed     = embed,
-                ephemeral = True
-            )
-        else:
-            _ = await interaction.response.send_message(
-                embed     = embed,
-                ephemeral = True
-            )
+        await send_action_result(interaction, embed)
         return True, "ok"
+
+async def _execute_bulk_ban(
+    base            : ModerationBase,
+    interaction     : discord.Interaction,
+    actor           : discord.Member,
+    targets         : list[tuple[discord.Member, dict[str, object]]],
+    delete_messages : int,
+) -> list[tuple[bool, str]]:
+    guild = interaction.guild
+    if not guild:
+        return [(False, "No guild context.")] * len(targets)
+    bot_member = guild.me
+    if not bot_member.guild_permissions.ban_members:
+        return [(False, "I lack permissions to ban members: `Ban Members`")] * len(targets)
+
+    def reason_of(data : dict[str, object]) -> str:
+        return str(cast(object, data.get("reason"))) if data.get("reason") is not None else "No reason provided"
+
+    if not bot_member.guild_permissions.manage_guild:
+        # The bulk endpoint also needs Manage Server; fall back to banning
+        # each member on its own.
+        fallback : MassActionExecutor[tuple[discord.Member, dict[str, object]]] = MassActionExecutor(
+            lambda target : _execute_ban(
+                base,
+                interaction,
+                actor,
+                target[0],
+                reason_of(target[1]),
+                delete_messages,
+                cast(discord.Attachment, target[1].get("proof")) if target[1].get("proof") is not None else None,
+            ),
+        )
+        report = await fallback.execute(targets)
+        return [(ok, message) for _target, ok, message in report.results]
+
+    delete_seconds = max(0, min(7, delete_messages)) * 86400
+    outcomes       : dict[int, tuple[bool, str]]     = {}
+    groups         : dict[str, list[discord.Member]] = {}
+    for member, data in targets:
+        if member.top_role >= bot_member.top_role:
+            outcomes[member.id] = (False, "Target user is above or equal to my highest role.")
+            continue
+        groups.setdefault(reason_of(data), []).append(member)
+
+    for reason, members in groups.items():
+        for start in range(0, len(members), BULK_BAN_LIMIT):
+            chunk = members[start:start + BULK_BAN_LIMIT]
+            try:
+                result = await guild.bulk_ban(
+                    chunk,
+                    reason                 = f"Banned by {actor}: {reason}",
+                    delete_message_seconds = delete_seconds,
+                )
+            except discord.Forbidden:
+                outcomes.update({member.id : (False, "I lack permissions to ban members: `Ban Members`") for member in chunk})
+                continue
+            except discord.HTTPException as e:
+                outcomes.update({member.id : (False, str(e)) for member in chunk})
+                continue
+
+            banned = {user.id for user in result.banned}
+            outcomes.update({
+                member.id : (True, "ok") if member.id in banned else (False, "Discord rejected the ban.")
+                for member in chunk
+            })
+
+    banned_targets = [(member, data) for member, data in targets if outcomes[member.id][0]]
+    if not banned_targets:
+        return [outcomes[member.id] for member, _data in targets]
+
+    bans = base.ensure_data_section("bans")
+    now  = datetime.now(UTC).isoformat()
+    for member, data in banned_targets:
+        bans[str(member.id)] = {
+            "banned_at" : now,
+            "banned_by" : actor.id,
+            "reason"    : reason_of(data),
+        }
+    base.save_data()
+
+    entries : list[dict[str, object]] = []
+    for member, data in banned_targets:
+        proof = cast(discord.Attachment | None, data.get("proof"))
+        entries.append({
+            "target_user" : member,
+            "reason"      : reason_of(data),
+            "metadata"    : {"proof_url" : proof.url} if proof else {},
+        })
+
+    _ = await base.cases_manager.log_cases(
+        guild     = guild,
+        case_type = CaseType.BAN,
+        moderator = actor,
+        entries   = entries,
+        metadata  = {
+            "delete_message_days" : max(0, min(7, delete_messages)),
+            "bulk_ban"            : True,
+        },
+    )
+
+    return [outcomes[member.id] for member, _data in targets]
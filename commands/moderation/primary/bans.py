@@ -9,6 +9,7 @@ if TYPE_CHECKING:
     from ._base import ModerationBase
 
 from constants import COLOR_BLACK, COLOR_GREEN
+from core.ban_index import BAN_INDEX
 from core.responses import send_custom_message
 
 from ._base import ModerationListPaginator
@@ -20,6 +21,7 @@ from ._base import ModerationListPaginator
 async def run_bans(
     base        : ModerationBase,
     interaction : discord.Interaction,
+    search      : str | None = None,
 ) -> None:
     actor = interaction.user
     if not isinstance(actor, discord.Member):
@@ -42,31 +44,7 @@ async def run_bans(
     _ = await interaction.response.defer(ephemeral = True)
 
     try:
-        bans = [entry async for entry in guild.bans(limit=None)]
-
-        if not bans:
-            embed = discord.Embed(
-                description = "No members are currently banned.",
-                color       = COLOR_GREEN,
-            )
-            await interaction.followup.send(embed = embed, ephemeral = True)
-            return
-
-        fields: list[tuple[str, str]] = []
-        for ban_entry in bans:
-            user     = ban_entry.user
-            ban_data = base.data.get("bans", {}).get(str(user.id))
-            if ban_data:
-                banned_at = datetime.fromisoformat(ban_data["banned_at"])
-                reason    = ban_data["reason"]
-                value     = f"Banned: {discord.utils.format_dt(banned_at, 'R')}\nReason: {reason}"
-            else:
-                value = f"Reason: {ban_entry.reason}"
-            fields.append((f"{user} ({user.id})", value))
-
-        view = ModerationListPaginator(interaction, "Banned Members", COLOR_BLACK, fields)
-        await interaction.followup.send(embed = view.get_embed(), view = view, ephemeral = True)
-
+        await BAN_INDEX.ensure(guild)
     except discord.Forbidden:
         await send_custom_message(
             interaction,
@@ -76,3 +54,29 @@ async def run_bans(
             footer            = "Bad configuration",
             contact_bot_owner = True,
         )
+        return
+
+    bans = BAN_INDEX.search(guild.id, search.strip()) if search else BAN_INDEX.entries(guild.id)
+
+    if not bans:
+        embed = discord.Embed(
+            description = f"No banned members match `{search}`." if search else "No members are currently banned.",
+            color       = COLOR_GREEN,
+        )
+        await interaction.followup.send(embed = embed, ephemeral = True)
+        return
+
+    stored : dict[str, dict[str, str]] = base.data.get("bans", {})
+    fields : list[tuple[str, str]]     = []
+    for user_id, name, ban_reason in bans:
+        ban_data = stored.get(str(user_id))
+        if ban_data:
+            banned_at = datetime.fromisoformat(ban_data["banned_at"])
+            reason    = ban_data["reason"]
+            value     = f"Banned: {discord.utils.format_dt(banned_at, 'R')}\nReason: {reason}"
+        else:
+            value = f"Reason: {ban_reason}"
+        fields.append((f"{name} ({user_id})", value))
+
+    view = ModerationListPaginator(interaction, "Banned Members", COLOR_BLACK, fields)
+    await interaction.followup.send(embed = view.get_embed(), view = view, ephemeral = True)
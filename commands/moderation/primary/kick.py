@@ -17,7 +17,7 @@ from core.cases import CaseType
 from core.permissions import is_director
 from core.responses import send_custom_message
 
-from ._base import MemberPickerView
+from ._base import MemberPickerView, send_action_result
 
 # ⸻⸻⸻⸻⸻⸻⸻⸻⸻⸻⸻⸻⸻⸻
 # /moderation kick Logic
@@ -208,14 +208,5 @@ async def _execute_kick(
     except discord.Forbidden:
         return False, "I lack permissions to kick members: `Kick Members`"
     else:
-        if interaction.response.is_done():
-            await interaction.followup.send(
-                embed     = embed,
-                ephemeral = True,
-            )
-        else:
-            _ = await interaction.response.send_message(
-                embed     = embed,
-                ephemeral = True,
-            )
+        await send_action_result(interaction, embed)
         return True, "ok"
@@ -4,19 +4,23 @@ from datetime import UTC, datetime
 from typing import (
     TYPE_CHECKING,
     Any,
+    cast,
 )
 
 import discord
 
 if TYPE_CHECKING:
+    from core.role_swap import RoleSwap
+
     from ._base import ModerationBase
 
 from constants import COLOR_ORANGE, QUARANTINE_ROLE_ID
 from core.cases import CaseType
 from core.permissions import is_director
 from core.responses import send_custom_message
+from core.role_swap import apply_role_swaps, plan_role_swap
 
-from ._base import MemberPickerView
+from ._base import MemberPickerView, send_action_result
 
 # ⸻⸻⸻⸻⸻⸻⸻⸻⸻⸻⸻⸻⸻⸻
 # /moderation quarantine Logic
@@ -56,6 +60,7 @@ async def run_quarantine(
             execute_callback = lambda i, m, data: _execute_quarantine(
                 base, i, actor, m, str(data["reason"]), data.get("proof"),
             ),
+            bulk_callback    = lambda i, targets: _execute_bulk_quarantine(base, i, actor, targets),
         )
         _ = await interaction.response.send_message(view = picker, ephemeral = True)
         return
@@ -161,10 +166,8 @@ async def _execute_quarantine(
     if quarantine_role >= bot_member.top_role:
         return False, "Quarantine role is above or equal to my highest role."
 
-    saved_roles = [
-        role.id for role in member.roles
-        if role.id not in (guild.default_role.id, QUARANTINE_ROLE_ID)
-    ]
+    swap        = plan_role_swap(member, add = [quarantine_role])
+    saved_roles = swap.removed
 
     quarantined[str(member.id)] = {
         "roles"          : saved_roles,
@@ -172,12 +175,10 @@ async def _execute_quarantine(
         "quarantined_by" : actor.id,
         "reason"         : reason,
     }
-    base.save_data()
+    await base.persist_data()
 
     try:
-        roles_to_remove = [role for role in member.roles if role.id != guild.default_role.id]
-        await member.remove_roles(*roles_to_remove, reason = f"Quarantined by {actor}")
-        await member.add_roles(quarantine_role, reason = f"Quarantined by {actor}: {reason}")
+        await swap.apply(reason = f"Quarantined by {actor}: {reason}")
 
         metadata : dict[str, Any] = {"roles_saved" : len(saved_roles)}
         if proof:
@@ -229,8 +230,95 @@ async def _execute_quarantine(
             base.save_data()
         return False, err
     else:
-        if interaction.response.is_done():
-            await interaction.followup.send(embed = embed, ephemeral = True)
-        else:
-            _ = await interaction.response.send_message(embed = embed, ephemeral = True)
+        await send_action_result(interaction, embed)
         return True, "ok"
+
+async def _execute_bulk_quarantine(
+    base        : ModerationBase,
+    interaction : discord.Interaction,
+    actor       : discord.Member,
+    targets     : list[tuple[discord.Member, dict[str, object]]],
+) -> list[tuple[bool, str]]:
+    guild = interaction.guild
+    if not guild:
+        return [(False, "No guild context.")] * len(targets)
+
+    quarantine_role = guild.get_role(QUARANTINE_ROLE_ID)
+    if not quarantine_role:
+        return [(False, "The quarantine role could not be found.")] * len(targets)
+    bot_member = guild.me
+    if not bot_member.guild_permissions.manage_roles:
+        return [(False, "I lack permissions to manage member roles: `Manage Roles`")] * len(targets)
+    if quarantine_role >= bot_member.top_role:
+        return [(False, "Quarantine role is above or equal to my highest role.")] * len(targets)
+
+    quarantined = base.ensure_data_section("quarantined")
+    outcomes    : dict[int, tuple[bool, str]]                               = {}
+    planned     : list[tuple[discord.Member, dict[str, object], RoleSwap]] = []
+    for member, data in targets:
+        if str(member.id) in quarantined:
+            outcomes[member.id] = (False, "Member is already quarantined.")
+        elif member.top_role >= bot_member.top_role:
+            outcomes[member.id] = (False, "Target user is above or equal to my highest role.")
+        else:
+            planned.append((member, data, plan_role_swap(member, add = [quarantine_role])))
+
+    if not planned:
+        return [outcomes[member.id] for member, _data in targets]
+
+    # Every member's saved roles reach disk before any role is touched, so a
+    # crash mid-run still leaves enough to restore them.
+    now = datetime.now(UTC).isoformat()
+    for member, data, swap in planned:
+        quarantined[str(member.id)] = {
+            "roles"          : swap.removed,
+            "quarantined_at" : now,
+            "quarantined_by" : actor.id,
+            "reason"         : str(data["reason"]),
+        }
+    await base.persist_data()
+
+    groups : dict[str, list[RoleSwap]] = {}
+    for _member, data, swap in planned:
+        groups.setdefault(str(data["reason"]), []).append(swap)
+
+    errors : dict[int, BaseException | None] = {}
+    for reason, swaps in groups.items():
+        results = await apply_role_swaps(swaps, reason = f"Quarantined by {actor}: {reason}")
+        errors.update({swap.member.id : error for swap, error in zip(swaps, results, strict = True)})
+
+    entries : list[dict[str, object]] = []
+    for member, data, swap in planned:
+        error = errors[member.id]
+        if error is None:
+            outcomes[member.id] = (True, "ok")
+            proof = cast("discord.Attachment | None", data.get("proof"))
+            metadata : dict[str, object] = {"roles_saved" : len(swap.removed)}
+            if proof:
+                metadata["proof_url"] = proof.url
+            entries.append({
+                "target_user" : member,
+                "reason"      : str(data["reason"]),
+                "metadata"    : metadata,
+            })
+            continue
+
+        del quarantined[str(member.id)]
+        outcomes[member.id] = (
+            (False, "I lack permissions to manage member roles: `Manage Roles`")
+            if isinstance(error, discord.Forbidden)
+            else (False, str(error))
+        )
+
+    if len(entries) != len(planned):
+        base.save_data()
+
+    if entries:
+        _ = await base.cases_manager.log_cases(
+            guild     = guild,
+            case_type = CaseType.QUARANTINE_ADD,
+            moderator = actor,
+            entries   = entries,
+        )
+
+    return [outcomes[member.id] for member, _data in targets]
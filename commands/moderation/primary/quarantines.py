@@ -1,7 +1,7 @@
 from __future__ import annotations
 
-from datetime import datetime
-from typing import TYPE_CHECKING
+from datetime import UTC, datetime
+from typing import TYPE_CHECKING, cast
 
 import discord
 
@@ -9,6 +9,7 @@ if TYPE_CHECKING:
     from ._base import ModerationBase
 
 from constants import COLOR_GREEN, COLOR_ORANGE
+from core.moderation_index import MODERATION_INDEX, quarantine_registry
 from core.responses import send_custom_message
 
 from ._base import ModerationListPaginator
@@ -35,7 +36,14 @@ async def run_quarantines(
         )
         return
 
-    if not base.data.get("quarantined"):
+    guild = interaction.guild
+    if guild is None:
+        return
+
+    registry    = quarantine_registry(base.data)
+    quarantined = MODERATION_INDEX.quarantined(guild, registry)
+
+    if not quarantined:
         embed = discord.Embed(
             description = "No members are currently quarantined.",
             color       = COLOR_GREEN,
@@ -43,21 +51,18 @@ async def run_quarantines(
         _ = await interaction.response.send_message(embed = embed, ephemeral = True)
         return
 
-    guild = interaction.guild
-    if guild is None:
-        return
-
     _ = await interaction.response.defer(ephemeral = True)
 
     fields: list[tuple[str, str]] = []
-    for user_id, entry in base.data["quarantined"].items():
-        target         = guild.get_member(int(user_id))
-        member_name    = target.mention if target else f"Unknown User ({user_id})"
-        quarantined_at = datetime.fromisoformat(entry["quarantined_at"])
+    for quarantined_at, member_id in quarantined:
+        target      = guild.get_member(member_id)
+        member_name = target.mention if target else f"Unknown User ({member_id})"
+        entry       = cast("dict[str, list[int]] | None", registry.get(str(member_id)))
+        saved_roles = f"Saved roles: {len(entry['roles'])}" if entry else "Saved roles: none recorded"
         fields.append((
             member_name,
-            f"Quarantined: {discord.utils.format_dt(quarantined_at, 'R')}\n"
-            f"Saved roles: {len(entry['roles'])}",
+            f"Quarantined: {discord.utils.format_dt(datetime.fromtimestamp(quarantined_at, UTC), 'R')}\n"
+            f"{saved_roles}",
         ))
 
     view = ModerationListPaginator(interaction, "Quarantined Members", COLOR_ORANGE, fields)
@@ -13,7 +13,7 @@ from core.cases import CaseType
 from core.permissions import is_director
 from core.responses import send_custom_message
 
-from ._base import MemberPickerView
+from ._base import MemberPickerView, send_action_result
 
 # ⸻⸻⸻⸻⸻⸻⸻⸻⸻⸻⸻⸻⸻⸻
 # /moderation timeout Logic
@@ -262,14 +262,5 @@ async def _execute_timeout(
     except discord.Forbidden:
         return False, "I lack permissions to timeout members: `Moderate Members`"
     else:
-        if interaction.response.is_done():
-            await interaction.followup.send(
-                embed     = embed,
-                ephemeral = True,
-            )
-        else:
-            _ = await interaction.response.send_message(
-                embed     = embed,
-                ephemeral = True,
-            )
+        await send_action_result(interaction, embed)
         return True, "ok"
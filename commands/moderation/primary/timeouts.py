@@ -1,6 +1,6 @@
 from __future__ import annotations
 
-from datetime import datetime
+from datetime import UTC, datetime
 from typing import TYPE_CHECKING
 
 import discord
@@ -9,6 +9,7 @@ if TYPE_CHECKING:
     from ._base import ModerationBase
 
 from constants import COLOR_GREEN, COLOR_YELLOW
+from core.moderation_index import MODERATION_INDEX, quarantine_registry
 from core.responses import send_custom_message
 
 from ._base import ModerationListPaginator
@@ -41,9 +42,9 @@ async def run_timeouts(
 
     _ = await interaction.response.defer(ephemeral = True)
 
-    timed_out_members = [m for m in guild.members if m.is_timed_out()]
+    timed_out = MODERATION_INDEX.timed_out(guild, quarantine_registry(base.data))
 
-    if not timed_out_members:
+    if not timed_out:
         embed = discord.Embed(
             description = "No members are currently timed out.",
             color       = COLOR_GREEN,
@@ -52,23 +53,23 @@ async def run_timeouts(
         return
 
     fields : list[tuple[str, str]] = []
-    for member in timed_out_members:
-        timeout_data = base.data.get("timeouts", {}).get(str(member.id))
+    for expires, member_id in timed_out:
+        member       = guild.get_member(member_id)
+        expires_at   = datetime.fromtimestamp(expires, UTC)
+        timeout_data = base.data.get("timeouts", {}).get(str(member_id))
 
-        if timeout_data and member.timed_out_until:
+        if timeout_data:
             timed_out_at = datetime.fromisoformat(timeout_data["timed_out_at"])
             reason       = timeout_data["reason"]
             value        = (
                 f"Timed out: {discord.utils.format_dt(timed_out_at, 'R')}\n"
-                f"Expires: {discord.utils.format_dt(member.timed_out_until, 'R')}\n"
+                f"Expires: {discord.utils.format_dt(expires_at, 'R')}\n"
                 f"Reason: {reason}"
             )
-        elif member.timed_out_until:
-            value = f"Expires: {discord.utils.format_dt(member.timed_out_until, 'R')}"
         else:
-            value = "No data available"
+            value = f"Expires: {discord.utils.format_dt(expires_at, 'R')}"
 
-        fields.append((f"{member} ({member.id})", value))
+        fields.append((f"{member or 'Unknown User'} ({member_id})", value))
 
     view = ModerationListPaginator(interaction, "Timed Out Members", COLOR_YELLOW, fields)
     await interaction.followup.send(embed = view.get_embed(), view = view, ephemeral = True)
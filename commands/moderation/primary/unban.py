@@ -8,8 +8,10 @@ import discord
 if TYPE_CHECKING:
     from ._base import ModerationBase
 
+from core.ban_index import BAN_INDEX
 from core.cases import CaseType
 from core.responses import send_custom_message
+from core.user_resolver import user_resolver
 
 # ⸻⸻⸻⸻⸻⸻⸻⸻⸻⸻⸻⸻⸻⸻
 # /moderation un-ban Logic
@@ -105,18 +107,14 @@ async def _execute_unban(
 
     if not user_to_unban:
         try:
-            bans = [entry async for entry in guild.bans(limit=None)]
-            for ban_entry in bans:
-                if (
-                    str(ban_entry.user.id) == cleaned or
-                    str(ban_entry.user) == cleaned or
-                    ban_entry.user.name == cleaned
-                ):
-                    user_to_unban = ban_entry.user
-                    break
+            await BAN_INDEX.ensure(guild)
         except discord.Forbidden:
             return False, "I lack permissions to view banned members: `Ban Members`"
 
+        found = BAN_INDEX.find(guild.id, cleaned)
+        if found is not None:
+            user_to_unban = await user_resolver(base.bot).resolve(found[0])
+
     if not user_to_unban:
         return False, "Could not find banned user"
 
@@ -14,8 +14,9 @@ if TYPE_CHECKING:
 from constants import COLOR_GREEN, CONTESTED_EMOJI, QUARANTINE_ROLE_ID
 from core.cases import CaseType
 from core.responses import send_custom_message
+from core.role_swap import swap_roles
 
-from ._base import MemberPickerView
+from ._base import MemberPickerView, send_action_result
 
 # ⸻⸻⸻⸻⸻⸻⸻⸻⸻⸻⸻⸻⸻⸻
 # /moderation unquarantine Logic
@@ -130,9 +131,6 @@ async def _execute_unquarantine(
         return False, "Quarantine role is above or equal to my highest role."
 
     try:
-        if quarantine_role and quarantine_role in member.roles:
-            await member.remove_roles(quarantine_role, reason = f"Unquarantined by {actor}: {reason}")
-
         roles_to_add:    list[discord.Role] = []
         roles_not_found: list[int]          = []
 
@@ -145,8 +143,12 @@ async def _execute_unquarantine(
             else:
                 roles_not_found.append(role_id)
 
-        if roles_to_add:
-            await member.add_roles(*roles_to_add, reason = f"Unquarantined by {actor}: {reason}")
+        _ = await swap_roles(
+            member,
+            remove = [quarantine_role] if quarantine_role else [],
+            add    = roles_to_add,
+            reason = f"Unquarantined by {actor}: {reason}",
+        )
 
         quarantined = base.ensure_data_section("quarantined")
         if str(member.id) in quarantined:
@@ -207,8 +209,5 @@ async def _execute_unquarantine(
     except discord.Forbidden:
         return False, "I lack permissions to manage member roles: `Manage Roles`"
     else:
-        if interaction.response.is_done():
-            await interaction.followup.send(embed = embed, ephemeral = True)
-        else:
-            _ = await interaction.response.send_message(embed = embed, ephemeral = True)
+        await send_action_result(interaction, embed)
         return True, "ok"
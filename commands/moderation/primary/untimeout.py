@@ -12,7 +12,7 @@ from constants import COLOR_GREEN
 from core.cases import CaseType
 from core.responses import send_custom_message
 
-from ._base import MemberPickerView
+from ._base import MemberPickerView, send_action_result
 
 # ⸻⸻⸻⸻⸻⸻⸻⸻⸻⸻⸻⸻⸻⸻
 # /moderation un-timeout Logic
@@ -160,14 +160,5 @@ async def _execute_untimeout(
     except discord.Forbidden:
         return False, "I lack permissions to timeout members: `Moderate Members`"
     else:
-        if interaction.response.is_done():
-            await interaction.followup.send(
-                embed     = embed,
-                ephemeral = True,
-            )
-        else:
-            _ = await interaction.response.send_message(
-                embed     = embed,
-                ephemeral = True,
-            )
+        await send_action_result(interaction, embed)
         return True, "ok"
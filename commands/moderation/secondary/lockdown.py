@@ -20,6 +20,7 @@ from constants import (
 from core.cases import CasesManager, CaseType
 from core.permissions import is_director
 from core.responses import send_custom_message
+from core.state.store import StateStore
 
 EXEMPT_CATEGORIES = [
     1433851234661695609,
@@ -56,24 +57,25 @@ class LockdownData(TypedDict):
     ]
 
 class LockdownCommands(commands.Cog):
-    bot       : "UtilityBot"
-    data_file : str
-    data      : LockdownData
+    bot   : "UtilityBot"
+    store : StateStore
+    data  : LockdownData
     def __init__(self, bot : "UtilityBot") -> None:
-        self.bot       = bot
-        self.data_file = "lockdown_data.json"
-        self.data      = self.load_data()
+        self.bot   = bot
+        self.store = StateStore(Path("lockdown_data.json"), indent = 4)
+        self.data  = self.load_data()
 
     @property
     def cases_manager(self) -> CasesManager:
         return self.bot.cases_manager
 
     def load_data(self) -> LockdownData:
-        if Path(self.data_file).exists():
-            with contextlib.suppress(json.JSONDecodeError), Path(self.data_file).open() as f:
+        with contextlib.suppress(json.JSONDecodeError):
+            data = self.store.read()
+            if data is not None:
                 return cast(
                     LockdownData,
-                    json.load(f),
+                    data,
                 )
         return self.get_default_data()
 
@@ -87,8 +89,7 @@ class LockdownCommands(commands.Cog):
         }
 
     def save_data(self) -> None:
-        with Path(self.data_file).open("w") as f:
-            json.dump(self.data, f, indent = 4)
+        self.store.save(self.data)
 
     def can_manage_lockdown(self, member : discord.Member) -> bool:
         return is_director(member)
@@ -102,6 +102,13 @@ class AntiNukeCommands(commands.Cog):
                 inline = True,
             )
 
+        if interaction.guild and str(interaction.guild.id) in self.antinuke_system.frozen_roles:
+            _ = embed.add_field(
+                name   = "Containment",
+                value  = "Active — dangerous permissions are frozen",
+                inline = False,
+            )
+
         _ = embed.set_footer(text = "Directors are exempt from all limits")
         _ = await interaction.response.send_message(
             embed     = embed,
@@ -307,6 +314,47 @@ class AntiNukeCommands(commands.Cog):
             title    = f"set anti-nuke alert channel to {channel.mention}",
         )
 
+    @antinuke_group.command(
+        name        = "release",
+        description = "Restore role permissions frozen by burst containment.",
+    )
+    async def antinuke_release(
+        self,
+        interaction : discord.Interaction,
+    ) -> None:
+        actor = interaction.user
+        if not isinstance(actor, discord.Member) or interaction.guild is None:
+            return
+
+        if not self.is_director(actor):
+            _ = await send_custom_message(
+                interaction,
+                msg_type = "error",
+                title    = "run command",
+                subtitle = "You are not authorized to run this command.",
+                footer   = "No permissions",
+            )
+            return
+
+        if str(interaction.guild.id) not in self.antinuke_system.frozen_roles:
+            _ = await send_custom_message(
+                interaction,
+                msg_type = "warning",
+                title    = "release containment",
+                subtitle = "Burst containment is not active.",
+                footer   = "Bad operation",
+            )
+            return
+
+        _ = await interaction.response.defer(ephemeral = True)
+        restored = await self.antinuke_system.release_freeze(interaction.guild)
+
+        _ = await send_custom_message(
+            interaction,
+            msg_type = "success",
+            title    = f"released containment and restored {restored} role(s)",
+        )
+
 async def setup(bot : commands.Bot) -> None:
     antinuke_system = bot.get_cog("AntiNukeSystem")
     if antinuke_system is None:
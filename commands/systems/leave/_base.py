@@ -1,6 +1,5 @@
 import contextlib
 import enum
-import json
 import re
 from datetime import UTC, datetime
 from datetime import date as date_type
@@ -28,12 +27,14 @@ from constants import (
 )
 from core.permissions import is_director, is_staff
 from core.responses import send_custom_message
+from core.state.store import StateStore
 
 # ⸻⸻⸻⸻⸻⸻⸻⸻⸻⸻⸻⸻⸻⸻⸻⸻⸻⸻⸻
 # Leave Base
 # ⸻⸻⸻⸻⸻⸻⸻⸻⸻⸻⸻⸻⸻⸻⸻⸻⸻⸻⸻
 
-DATA_FILE = "leave_data.json"
+DATA_FILE  = "leave_data.json"
+DATA_STORE = StateStore(Path(DATA_FILE), indent = 2)
 
 ALL_STAFF_ROLE_IDS : list[int] = [
     STAFF_ROLE_ID,
@@ -58,14 +59,11 @@ class LeaveType(enum.Enum):
     hard_clean = "hard_clean"
 
 def load_data() -> dict[str, Any]:
-    if not Path(DATA_FILE).exists():
-        return {}
-    with Path(DATA_FILE).open() as f:
-        return json.load(f)
+    data = DATA_STORE.read()
+    return data if data is not None else {}
 
 def save_data(data: dict[str, Any]) -> None:
-    with Path(DATA_FILE).open("w") as f:
-        json.dump(data, f, indent = 2)
+    DATA_STORE.save(data)
 
 def extract_name(nickname : str) -> str:
     if "|" in nickname:
@@ -7,9 +7,11 @@ from discord.ext import commands, tasks
 from typing_extensions import override
 
 from constants import PERSONAL_LEAVE_ROLE_ID
+from core.role_swap import plan_role_swap, swap_roles
 
 from ._base import (
     ALL_STAFF_ROLE_IDS,
+    DATA_STORE,
     LeaveType,
     build_leave_nick,
     extract_name,
@@ -124,19 +126,22 @@ class LeaveCommands(commands.Cog):
             if stored_timer_secs is not None else None
         )
 
+        swap = plan_role_swap(member, remove = roles_to_remove, add = [personal_leave_role])
+
+        entry["original_nick"] = original_full_nick
+        entry["removed_roles"] = swap.removed
+        self.data[user_id_str] = entry
+        save_data(self.data)
+        await DATA_STORE.flush()
+
         try:
-            if roles_to_remove:
-                await member.remove_roles(*roles_to_remove, reason = "UB Leave: Scheduled leave automation")
-            await member.add_roles(personal_leave_role, reason = "UB Leave: Scheduled leave automation")
-            _ = await member.edit(nick=new_nick)
+            await swap.apply(reason = "UB Leave: Scheduled leave automation", nick = new_nick)
         except discord.HTTPException:
             return
 
         entry["begin_date"]    = None
         entry["timer_seconds"] = None
         entry["timer_end"]     = new_timer_end
-        entry["original_nick"] = original_full_nick
-        entry["removed_roles"] = [r.id for r in roles_to_remove]
         self.data[user_id_str] = entry
         save_data(self.data)
 
@@ -166,20 +171,19 @@ class LeaveCommands(commands.Cog):
                 if restored_role is not None:
                     roles_to_restore.append(restored_role)
 
-        try:
-            if personal_leave_role in member.roles:
-                await member.remove_roles(personal_leave_role, reason = "UB Leave: Scheduled leave automation")
-
-            current_nick   = member.nick or member.name
-            base_name      = extract_name(stored_name)
-            expected_long  = f"P. Leave | {base_name}"
-            expected_short = f"PL | {base_name}"
+        current_nick   = member.nick or member.name
+        base_name      = extract_name(stored_name)
+        expected_long  = f"P. Leave | {base_name}"
+        expected_short = f"PL | {base_name}"
 
-            if current_nick in (expected_long, expected_short):
-                _ = await member.edit(nick=stored_name)
-
-            if roles_to_restore:
-                await member.add_roles(*roles_to_restore, reason = "UB Leave: Scheduled leave automation")
+        try:
+            _ = await swap_roles(
+                member,
+                remove = [personal_leave_role],
+                add    = roles_to_restore,
+                nick   = stored_name if current_nick in (expected_long, expected_short) else None,
+                reason = "UB Leave: Scheduled leave automation",
+            )
         except discord.HTTPException:
             return
 
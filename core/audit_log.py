@@ -0,0 +1,187 @@
+from __future__ import annotations
+
+import asyncio
+import logging
+import time
+from collections import deque
+from typing import TYPE_CHECKING
+
+import discord
+from discord.ext import commands
+
+if TYPE_CHECKING:
+    from collections.abc import Callable, Iterable
+
+log = logging.getLogger("Utility Bot")
+
+# ⸻⸻⸻⸻⸻⸻⸻⸻⸻⸻⸻⸻⸻⸻⸻⸻⸻⸻⸻
+# Audit Log Correlation
+# ⸻⸻⸻⸻⸻⸻⸻⸻⸻⸻⸻⸻⸻⸻⸻⸻⸻⸻⸻
+
+AuditKey = tuple[int, discord.AuditLogAction, int | None]
+
+AUDIT_ENTRY_TTL      : float = 15.0
+AUDIT_WAIT_TIMEOUT   : float = 0.5
+AUDIT_SECURITY_WAIT  : float = 3.0
+AUDIT_FALLBACK_LIMIT : int   = 10
+
+class _Waiter:
+    __slots__ = ("future", "predicate")
+
+    def __init__(
+        self,
+        future    : asyncio.Future[discord.AuditLogEntry],
+        predicate : Callable[[discord.AuditLogEntry], bool] | None,
+    ) -> None:
+        self.future    = future
+        self.predicate = predicate
+
+    def offer(self, entry : discord.AuditLogEntry) -> None:
+        if self.future.done() or (self.predicate is not None and not self.predicate(entry)):
+            return
+        self.future.set_result(entry)
+
+def target_id_of(entry : discord.AuditLogEntry) -> int | None:
+    return getattr(entry.target, "id", None)
+
+class AuditLogCorrelator:
+    _entries   : dict[AuditKey, tuple[float, discord.AuditLogEntry]]
+    _expiry    : deque[tuple[float, AuditKey]]
+    _waiters   : dict[AuditKey, list[_Waiter]]
+    _streaming : set[int]
+
+    def __init__(self) -> None:
+        self._entries   = {}
+        self._expiry    = deque()
+        self._waiters   = {}
+        self._streaming = set()
+
+    def push(self, entry : discord.AuditLogEntry) -> None:
+        now = time.monotonic()
+        self._prune(now)
+        self._streaming.add(entry.guild.id)
+
+        target_id = target_id_of(entry)
+        keys      : list[AuditKey] = [(entry.guild.id, entry.action, None)]
+        if target_id is not None:
+            keys.append((entry.guild.id, entry.action, target_id))
+
+        for key in keys:
+            self._entries[key] = (now, entry)
+            self._expiry.append((now, key))
+            for waiter in self._waiters.get(key, []):
+                waiter.offer(entry)
+
+    def reset(self) -> None:
+        # Entries may have been missed while disconnected, so fall back to
+        # polling until the gateway proves it is delivering again.
+        self._streaming.clear()
+
+    def _prune(self, now : float) -> None:
+        while self._expiry and now - self._expiry[0][0] > AUDIT_ENTRY_TTL:
+            stamp, key = self._expiry.popleft()
+            current    = self._entries.get(key)
+            if current is not None and current[0] == stamp:
+                del self._entries[key]
+
+    def recent(
+        self,
+        guild_id  : int,
+        actions   : Iterable[discord.AuditLogAction],
+        target_id : int | None = None,
+        predicate : Callable[[discord.AuditLogEntry], bool] | None = None,
+    ) -> discord.AuditLogEntry | None:
+        self._prune(time.monotonic())
+        found : tuple[float, discord.AuditLogEntry] | None = None
+        for action in actions:
+            current = self._entries.get((guild_id, action, target_id))
+            if current is None or (predicate is not None and not predicate(current[1])):
+                continue
+            if found is None or current[0] > found[0]:
+                found = current
+        return found[1] if found is not None else None
+
+    async def fetch(
+        self,
+        guild     : discord.Guild,
+        actions   : discord.AuditLogAction | tuple[discord.AuditLogAction, ...],
+        target_id : int | None = None,
+        *,
+        predicate : Callable[[discord.AuditLogEntry], bool] | None = None,
+        wait      : float = AUDIT_WAIT_TIMEOUT,
+        fallback  : bool  = False,
+    ) -> discord.AuditLogEntry | None:
+        wanted = (actions,) if isinstance(actions, discord.AuditLogAction) else actions
+
+        entry = self.recent(guild.id, wanted, target_id, predicate)
+        if entry is not None:
+            return entry
+
+        waiter = _Waiter(asyncio.get_running_loop().create_future(), predicate)
+        keys   = [(guild.id, action, target_id) for action in wanted]
+        for key in keys:
+            self._waiters.setdefault(key, []).append(waiter)
+
+        try:
+            return await asyncio.wait_for(waiter.future, wait)
+        except TimeoutError:
+            pass
+        finally:
+            for key in keys:
+                waiters = self._waiters.get(key, [])
+                if waiter in waiters:
+                    waiters.remove(waiter)
+                if not waiters:
+                    _ = self._waiters.pop(key, None)
+
+        # A push that lands between the timeout and here is still cached.
+        entry = self.recent(guild.id, wanted, target_id, predicate)
+        if entry is not None:
+            return entry
+
+        # Logging consumers trust a streaming gateway and give up; security
+        # consumers (fallback) always confirm over REST.
+        if guild.id in self._streaming and not fallback:
+            return None
+        return await self._poll(guild, wanted, target_id, predicate)
+
+    async def _poll(
+        self,
+        guild     : discord.Guild,
+        actions   : tuple[discord.AuditLogAction, ...],
+        target_id : int | None,
+        predicate : Callable[[discord.AuditLogEntry], bool] | None,
+    ) -> discord.AuditLogEntry | None:
+        entries = (
+            guild.audit_logs(limit = AUDIT_FALLBACK_LIMIT, action = actions[0]) if len(actions) == 1
+            else guild.audit_logs(limit = AUDIT_FALLBACK_LIMIT)
+        )
+        try:
+            async for entry in entries:
+                if entry.action not in actions:
+                    continue
+                if target_id is not None and target_id_of(entry) != target_id:
+                    continue
+                if predicate is not None and not predicate(entry):
+                    continue
+                return entry
+        except discord.HTTPException:
+            log.exception("Error fetching audit log")
+        return None
+
+AUDIT_LOG : AuditLogCorrelator = AuditLogCorrelator()
+
+class AuditLogListener(commands.Cog):
+    def __init__(self, bot : commands.Bot) -> None:
+        self.bot = bot
+
+    @commands.Cog.listener("on_audit_log_entry_create")
+    async def on_audit_log_entry_create(self, entry : discord.AuditLogEntry) -> None:
+        AUDIT_LOG.push(entry)
+
+    @commands.Cog.listener("on_disconnect")
+    async def on_disconnect(self) -> None:
+        AUDIT_LOG.reset()
+
+async def setup(bot : commands.Bot) -> None:
+    await bot.add_cog(AuditLogListener(bot))
@@ -0,0 +1,243 @@
+from __future__ import annotations
+
+import asyncio
+import logging
+import time
+from pathlib import Path
+from typing import TYPE_CHECKING, TypedDict, cast
+
+import discord
+from discord.ext import commands, tasks
+from typing_extensions import override
+
+from core.audit_log import AUDIT_LOG
+from core.state.store import StateStore
+
+if TYPE_CHECKING:
+    from collections.abc import Iterable
+
+log = logging.getLogger("Utility Bot")
+
+# ⸻⸻⸻⸻⸻⸻⸻⸻⸻⸻⸻⸻⸻⸻⸻⸻⸻⸻⸻
+# Ban Index
+# ⸻⸻⸻⸻⸻⸻⸻⸻⸻⸻⸻⸻⸻⸻⸻⸻⸻⸻⸻
+
+BAN_RECONCILE_INTERVAL : float = 6 * 3600.0
+BAN_RECONCILE_STAGGER  : float = 5.0
+BAN_SEARCH_LIMIT       : int   = 25
+
+BanEntry = tuple[int, str, str | None]
+
+class GuildBans(TypedDict):
+    reconciled_at : float
+    bans          : dict[str, list[str | None]]
+
+class BanIndex:
+    store    : StateStore
+    _guilds  : dict[int, dict[int, tuple[str, str | None]]]
+    _synced  : dict[int, float]
+    _locks   : dict[int, asyncio.Lock]
+    _journal : dict[int, dict[int, tuple[str, str | None] | None]]
+
+    def __init__(self, path : Path) -> None:
+        self.store    = StateStore(path, self._snapshot)
+        self._guilds  = {}
+        self._synced  = {}
+        self._locks   = {}
+        self._journal = {}
+
+        raw = cast("dict[str, GuildBans] | None", self.store.read()) or {}
+        for guild_id, data in raw.items():
+            self._guilds[int(guild_id)] = {
+                int(user_id) : (cast("str", entry[0]), entry[1])
+                for user_id, entry in data["bans"].items()
+            }
+            self._synced[int(guild_id)] = data["reconciled_at"]
+
+    def _snapshot(self) -> dict[str, GuildBans]:
+        return {
+            str(guild_id) : {
+                "reconciled_at" : self._synced.get(guild_id, 0.0),
+                "bans"          : {str(user_id) : [name, reason] for user_id, (name, reason) in bans.items()},
+            }
+            for guild_id, bans in self._guilds.items()
+        }
+
+    def is_seeded(self, guild_id : int) -> bool:
+        return guild_id in self._synced
+
+    def is_stale(self, guild_id : int, now : float | None = None) -> bool:
+        now = time.time() if now is None else now
+        return now - self._synced.get(guild_id, 0.0) >= BAN_RECONCILE_INTERVAL
+
+    def add(
+        self,
+        guild_id : int,
+        user     : discord.abc.User,
+        reason   : str | None = None,
+    ) -> None:
+        bans = self._guilds.setdefault(guild_id, {})
+        if reason is None and user.id in bans:
+            reason = bans[user.id][1]
+        bans[user.id] = (str(user), reason)
+        self._record(guild_id, user.id, bans[user.id])
+        self.store.mark_dirty()
+
+    def remove(self, guild_id : int, user_id : int) -> None:
+        self._record(guild_id, user_id, None)
+        bans = self._guilds.get(guild_id)
+        if bans is not None and bans.pop(user_id, None) is not None:
+            self.store.mark_dirty()
+
+    def set_reason(
+        self,
+        guild_id : int,
+        user_id  : int,
+        reason   : str,
+    ) -> None:
+        bans = self._guilds.get(guild_id, {})
+        if user_id not in bans:
+            return
+        bans[user_id] = (bans[user_id][0], reason)
+        self._record(guild_id, user_id, bans[user_id])
+        self.store.mark_dirty()
+
+    def _record(
+        self,
+        guild_id : int,
+        user_id  : int,
+        entry    : tuple[str, str | None] | None,
+    ) -> None:
+        journal = self._journal.get(guild_id)
+        if journal is not None:
+            journal[user_id] = entry
+
+    def entries(self, guild_id : int) -> list[BanEntry]:
+        return [(user_id, name, reason) for user_id, (name, reason) in self._guilds.get(guild_id, {}).items()]
+
+    def find(self, guild_id : int, identifier : str) -> BanEntry | None:
+        bans = self._guilds.get(guild_id, {})
+        if identifier.isdigit() and int(identifier) in bans:
+            name, reason = bans[int(identifier)]
+            return int(identifier), name, reason
+
+        for user_id, (name, reason) in bans.items():
+            if identifier in (name, name.split("#")[0]):
+                return user_id, name, reason
+        return None
+
+    def search(
+        self,
+        guild_id : int,
+        query    : str,
+        limit    : int = BAN_SEARCH_LIMIT,
+    ) -> list[BanEntry]:
+        exact = self.find(guild_id, query)
+        if exact is not None:
+            return [exact]
+
+        needle  = query.casefold()
+        matches : list[BanEntry] = []
+        for user_id, (name, reason) in self._guilds.get(guild_id, {}).items():
+            if needle in name.casefold() or query in str(user_id):
+                matches.append((user_id, name, reason))
+                if len(matches) >= limit:
+                    break
+        return matches
+
+    def replace(self, guild_id : int, entries : Iterable[discord.BanEntry]) -> None:
+        self._guilds[guild_id] = {entry.user.id : (str(entry.user), entry.reason) for entry in entries}
+        self._synced[guild_id] = time.time()
+        self.store.mark_dirty()
+
+    async def reconcile(self, guild : discord.Guild) -> None:
+        lock = self._locks.setdefault(guild.id, asyncio.Lock())
+        async with lock:
+            # Bans and unbans that arrive while the list is being fetched are
+            # journalled and replayed on top of the fetched snapshot.
+            journal = self._journal[guild.id] = {}
+            try:
+                entries = [entry async for entry in guild.bans(limit = None)]
+            finally:
+                _ = self._journal.pop(guild.id, None)
+
+            self.replace(guild.id, entries)
+            bans = self._guilds[guild.id]
+            for user_id, entry in journal.items():
+                if entry is None:
+                    _ = bans.pop(user_id, None)
+                else:
+                    bans[user_id] = entry
+            log.info("Reconciled %s bans for guild %s", len(bans), guild.id)
+
+    async def ensure(self, guild : discord.Guild) -> None:
+        if not self.is_seeded(guild.id):
+            await self.reconcile(guild)
+
+BAN_INDEX : BanIndex = BanIndex(Path("data/ban_index.json"))
+
+class BanIndexListener(commands.Cog):
+    bot   : commands.Bot
+    _gate : asyncio.Lock
+
+    def __init__(self, bot : commands.Bot) -> None:
+        self.bot   = bot
+        self._gate = asyncio.Lock()
+        _ = self.reconcile_bans.start()
+
+    @override
+    async def cog_unload(self) -> None:
+        self.reconcile_bans.cancel()
+
+    async def _reconcile(self, guild : discord.Guild) -> None:
+        # Full ban fetches run one guild at a time with a gap between them,
+        # and only for snapshots that have gone stale.
+        async with self._gate:
+            if not BAN_INDEX.is_stale(guild.id):
+                return
+            try:
+                await BAN_INDEX.reconcile(guild)
+            except discord.Forbidden:
+                log.debug("Skipping ban reconcile for guild %s: missing Ban Members", guild.id)
+            except discord.HTTPException:
+                log.exception("Failed to reconcile bans for guild %s", guild.id)
+            await asyncio.sleep(BAN_RECONCILE_STAGGER)
+
+    @tasks.loop(minutes = 30)
+    async def reconcile_bans(self) -> None:
+        for guild in self.bot.guilds:
+            if BAN_INDEX.is_stale(guild.id):
+                await self._reconcile(guild)
+
+    @reconcile_bans.before_loop
+    async def before_reconcile_bans(self) -> None:
+        await self.bot.wait_until_ready()
+
+    # A guild coming back after an outage longer than the reconcile interval
+    # is refreshed without waiting for the next loop pass.
+    @commands.Cog.listener("on_guild_available")
+    async def on_guild_available(self, guild : discord.Guild) -> None:
+        await self._reconcile(guild)
+
+    @commands.Cog.listener("on_member_ban")
+    async def on_member_ban(
+        self,
+        guild : discord.Guild,
+        user  : discord.User | discord.Member,
+    ) -> None:
+        BAN_INDEX.add(guild.id, user)
+
+        entry = await AUDIT_LOG.fetch(guild, discord.AuditLogAction.ban, user.id)
+        if entry is not None and entry.reason:
+            BAN_INDEX.set_reason(guild.id, user.id, entry.reason)
+
+    @commands.Cog.listener("on_member_unban")
+    async def on_member_unban(
+        self,
+        guild : discord.Guild,
+        user  : discord.User,
+    ) -> None:
+        BAN_INDEX.remove(guild.id, user.id)
+
+async def setup(bot : commands.Bot) -> None:
+    await bot.add_cog(BanIndexListener(bot))
@@ -0,0 +1,351 @@
+from __future__ import annotations
+
+import asyncio
+import gzip
+import heapq
+import io
+import json
+import logging
+from collections import OrderedDict
+from typing import TYPE_CHECKING, Any, TypedDict
+
+import numpy as np
+
+from core.case_index import CaseIndex, to_epoch
+from core.case_record import CaseRecord, from_micros
+from core.case_stats import IGNORED_TYPES, day_of
+from core.case_storage import write_bytes_atomic, write_text_atomic
+
+if TYPE_CHECKING:
+    from collections.abc import AsyncIterator, Awaitable, Callable, Container, Iterable, Iterator
+    from datetime import datetime
+    from pathlib import Path
+
+    from core.case_stats import CaseStats
+    from core.cases import CaseData
+
+    SegmentSource = Callable[[], Awaitable[Iterator[tuple[int, CaseRecord]]]]
+
+log = logging.getLogger("Utility Bot")
+
+# ⸻⸻⸻⸻⸻⸻⸻⸻⸻⸻⸻⸻⸻⸻⸻⸻⸻⸻⸻
+# Case Archive Management
+# ⸻⸻⸻⸻⸻⸻⸻⸻⸻⸻⸻⸻⸻⸻⸻⸻⸻⸻⸻
+
+SEGMENT_CACHE_SIZE : int             = 4
+STAT_COLUMNS       : tuple[str, ...] = ("case_ids", "guild_ids", "days", "types", "moderators", "targets")
+
+StatColumns = dict[str, "np.ndarray[Any, Any]"]
+
+class SegmentInfo(TypedDict):
+    name        : str
+    month       : str
+    count       : int
+    min_case_id : int
+    max_case_id : int
+    min_created : float
+    max_created : float
+    guild_ids   : list[int]
+    user_ids    : list[int]
+    related_ids : list[int]
+
+class ArchiveManifest(TypedDict):
+    segments : list[SegmentInfo]
+    deleted  : list[int]
+
+class ArchivedSegment:
+    info  : SegmentInfo
+    cases : dict[int, CaseRecord]
+    index : CaseIndex
+
+    def __init__(
+        self,
+        info  : SegmentInfo,
+        cases : Iterable[CaseRecord],
+    ) -> None:
+        self.info  = info
+        self.cases = {case.case_id : case for case in cases}
+        self.index = CaseIndex()
+        self.index.rebuild(self.cases.values())
+
+def month_of(case : CaseRecord) -> str:
+    return from_micros(case.created_at)[:7]
+
+async def merge_cases(
+    sources   : list[tuple[int, SegmentSource]],
+    *,
+    ascending : bool = False,
+) -> AsyncIterator[tuple[int, CaseRecord]]:
+    # Every source yields ids in walk order and never past its bound, so a
+    # source is only opened once the merge reaches it. Earlier sources win
+    # when the same id shows up more than once.
+    sign    = 1 if ascending else -1
+    heap    : list[tuple[int, int, CaseRecord, Iterator[tuple[int, CaseRecord]]]] = []
+    pending = sorted(enumerate(sources), key = lambda s : sign * s[1][0])
+    last    : int | None = None
+
+    def push(priority : int, source : Iterator[tuple[int, CaseRecord]]) -> None:
+        item = next(source, None)
+        if item is not None:
+            heapq.heappush(heap, (sign * item[0], priority, item[1], source))
+
+    while heap or pending:
+        while pending and (not heap or sign * pending[0][1][0] <= heap[0][0]):
+            priority, (_, factory) = pending.pop(0)
+            push(priority, await factory())
+        if not heap:
+            return
+        key, priority, case, source = heapq.heappop(heap)
+        if sign * key != last:
+            last = sign * key
+            yield last, case
+        push(priority, source)
+
+class CaseArchive:
+    directory     : Path
+    manifest_path : Path
+    segments      : list[SegmentInfo]
+    deleted       : set[int]
+    _user_sets    : dict[str, frozenset[int]]
+    _columns      : dict[str, StatColumns]
+    _cache        : OrderedDict[str, ArchivedSegment]
+    _lock         : asyncio.Lock
+
+    def __init__(self, directory : Path) -> None:
+        self.directory     = directory
+        self.manifest_path = directory / "manifest.json"
+        self.segments      = []
+        self.deleted       = set()
+        self._user_sets    = {}
+        self._columns      = {}
+        self._cache        = OrderedDict()
+        self._lock         = asyncio.Lock()
+
+    def _read_manifest(self) -> tuple[ArchiveManifest | None, dict[str, StatColumns]]:
+        try:
+            with self.manifest_path.open() as f:
+                manifest : ArchiveManifest = json.load(f)
+        except FileNotFoundError:
+            return None, {}
+
+        columns : dict[str, StatColumns] = {}
+        for info in manifest.get("segments", []):
+            try:
+                with np.load(self._columns_path(info["name"])) as loaded:
+                    columns[info["name"]] = {key : loaded[key] for key in STAT_COLUMNS}
+            except (OSError, KeyError, ValueError):
+                log.exception("Failed to load archived statistics for segment %s", info["name"])
+        return manifest, columns
+
+    async def load(self) -> None:
+        manifest, columns = await asyncio.to_thread(self._read_manifest)
+        if manifest is None:
+            return
+
+        self.segments   = manifest.get("segments", [])
+        self.deleted    = set(manifest.get("deleted", []))
+        self._user_sets = {info["name"] : frozenset(info["user_ids"]) for info in self.segments}
+        self._columns   = columns
+        self._cache.clear()
+
+    def _segment_path(self, name : str) -> Path:
+        return self.directory / f"{name}.ndjson.gz"
+
+    def _columns_path(self, name : str) -> Path:
+        return self.directory / f"{name}.stats.npz"
+
+    async def _write_manifest(self) -> None:
+        manifest : ArchiveManifest = {
+            "segments" : self.segments,
+            "deleted"  : sorted(self.deleted),
+        }
+        _ = await asyncio.to_thread(write_text_atomic, self.manifest_path, json.dumps(manifest))
+
+    async def add_segments(self, cases : Iterable[CaseRecord]) -> list[SegmentInfo]:
+        by_month : dict[str, list[CaseRecord]] = {}
+        for case in cases:
+            by_month.setdefault(month_of(case), []).append(case)
+
+        written : list[SegmentInfo] = []
+        async with self._lock:
+            self.directory.mkdir(exist_ok = True)
+            for month, month_cases in sorted(by_month.items()):
+                month_cases.sort(key = lambda c : c.case_id)
+                part  = sum(1 for info in self.segments if info["month"] == month) + 1
+                name  = f"{month}-{part}"
+                epoch = [case.epoch for case in month_cases]
+                info  : SegmentInfo = {
+                    "name"        : name,
+                    "month"       : month,
+                    "count"       : len(month_cases),
+                    "min_case_id" : month_cases[0].case_id,
+                    "max_case_id" : month_cases[-1].case_id,
+                    "min_created" : min(epoch),
+                    "max_created" : max(epoch),
+                    "guild_ids"   : sorted({case.guild_id for case in month_cases}),
+                    "user_ids"    : sorted({
+                        case.target_user_id for case in month_cases
+                        if case.target_user_id is not None
+                    }),
+                    "related_ids" : sorted({
+                        case.related_case_id for case in month_cases
+                        if case.related_case_id is not None
+                    }),
+                }
+
+                payload = [case.to_data() for case in month_cases]
+                columns = _columns_of(month_cases)
+                await asyncio.to_thread(self._write_segment, name, payload, columns)
+
+                self.segments.append(info)
+                self._columns[name] = columns
+                self._user_sets[name] = frozenset(info["user_ids"])
+                written.append(info)
+
+            await self._write_manifest()
+
+        return written
+
+    def _write_segment(
+        self,
+        name    : str,
+        payload : list[CaseData],
+        columns : StatColumns,
+    ) -> None:
+        text = "".join(json.dumps(case, separators = (",", ":")) + "\n" for case in payload)
+        write_bytes_atomic(self._segment_path(name), gzip.compress(text.encode()))
+        write_bytes_atomic(self._columns_path(name), _encode_columns(columns))
+
+    async def mark_deleted(self, case_id : int) -> None:
+        async with self._lock:
+            self.deleted.add(case_id)
+            await self._write_manifest()
+
+    def covers(self, case_id : int) -> list[SegmentInfo]:
+        return [
+            info for info in self.segments
+            if info["min_case_id"] <= case_id <= info["max_case_id"]
+        ]
+
+    def candidates(
+        self,
+        guild_id      : int,
+        user_id       : int      | None = None,
+        after         : datetime | None = None,
+        before        : datetime | None = None,
+        after_case_id : int      | None = None,
+        *,
+        ascending     : bool            = False,
+    ) -> list[SegmentInfo]:
+        after_epoch  = to_epoch(after)  if after  is not None else None
+        before_epoch = to_epoch(before) if before is not None else None
+        return [
+            info for info in self.segments
+            if guild_id in info["guild_ids"]
+            and (user_id is None or user_id in self._user_sets[info["name"]])
+            and (after_epoch is None or info["max_created"] > after_epoch)
+            and (before_epoch is None or info["min_created"] < before_epoch)
+            and (after_case_id is None or (
+                info["max_case_id"] > after_case_id if ascending
+                else info["min_case_id"] < after_case_id
+            ))
+        ]
+
+    def _cached(self, info : SegmentInfo) -> ArchivedSegment | None:
+        cached = self._cache.get(info["name"])
+        if cached is not None:
+            self._cache.move_to_end(info["name"])
+        return cached
+
+    def _read_segment(self, info : SegmentInfo) -> ArchivedSegment:
+        with gzip.open(self._segment_path(info["name"]), "rt") as f:
+            return ArchivedSegment(info, (CaseRecord.from_data(json.loads(line)) for line in f if line.strip()))
+
+    def _remember(self, loaded : ArchivedSegment) -> ArchivedSegment:
+        self._cache[loaded.info["name"]] = loaded
+        while len(self._cache) > SEGMENT_CACHE_SIZE:
+            _ = self._cache.popitem(last = False)
+        return loaded
+
+    async def segment(self, info : SegmentInfo) -> ArchivedSegment:
+        # Decompression runs off the event loop; only the cache is touched here.
+        cached = self._cached(info)
+        if cached is not None:
+            return cached
+        return self._remember(await asyncio.to_thread(self._read_segment, info))
+
+    async def get_case(self, case_id : int) -> CaseRecord | None:
+        if case_id in self.deleted:
+            return None
+        # Only segments whose id range covers the case are opened.
+        for info in reversed(self.covers(case_id)):
+            loaded = await self.segment(info)
+            case   = loaded.cases.get(case_id)
+            if case is not None:
+                return case
+        return None
+
+    async def related_notes(
+        self,
+        case_id  : int,
+        guild_id : int,
+        exclude  : Container[int],
+    ) -> list[CaseRecord]:
+        notes : dict[int, CaseRecord] = {}
+        for info in reversed(self.segments):
+            if case_id not in info["related_ids"] or guild_id not in info["guild_ids"]:
+                continue
+            loaded = await self.segment(info)
+            for i in loaded.index.guild(guild_id).by_related.get(case_id, []):
+                if i in exclude or i in self.deleted or i in notes:
+                    continue
+                if loaded.cases[i].type.value == "note":
+                    notes[i] = loaded.cases[i]
+        return [notes[i] for i in sorted(notes)]
+
+    async def iter_guild_cases(
+        self,
+        guild_id : int,
+        exclude  : Container[int],
+    ) -> AsyncIterator[CaseRecord]:
+        seen : set[int] = set()
+        for info in reversed(self.segments):
+            if guild_id not in info["guild_ids"]:
+                continue
+            loaded = await self.segment(info)
+            for case_id in loaded.index.guild(guild_id).case_ids:
+                if case_id in exclude or case_id in self.deleted or case_id in seen:
+                    continue
+                seen.add(case_id)
+                yield loaded.cases[case_id]
+
+    def extend_stats(self, stats : CaseStats) -> None:
+        # Columns are decoded once when the archive loads, so re-adopting the
+        # hot store only does in-memory array work.
+        deleted = list(self.deleted)
+        for columns in self._columns.values():
+            keep = ~np.isin(columns["case_ids"], deleted)
+            stats.extend(
+                guild_ids  = columns["guild_ids"][keep],
+                case_ids   = columns["case_ids"][keep],
+                days       = columns["days"][keep],
+                types      = columns["types"][keep],
+                moderators = columns["moderators"][keep],
+                targets    = columns["targets"][keep],
+            )
+
+def _columns_of(cases : list[CaseRecord]) -> StatColumns:
+    counted = [case for case in cases if case.type.value not in IGNORED_TYPES]
+    return {
+        "case_ids"   : np.array([c.case_id for c in counted], dtype = np.int64),
+        "guild_ids"  : np.array([c.guild_id for c in counted], dtype = np.int64),
+        "days"       : np.array([day_of(c) for c in counted], dtype = np.int64),
+        "types"      : np.array([c.type.value for c in counted], dtype = np.str_),
+        "moderators" : np.array([c.moderator_id for c in counted], dtype = np.int64),
+        "targets"    : np.array([c.target_user_id or 0 for c in counted], dtype = np.int64),
+    }
+
+def _encode_columns(columns : StatColumns) -> bytes:
+    buffer = io.BytesIO()
+    np.savez_compressed(buffer, **columns)
+    return buffer.getvalue()
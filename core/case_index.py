@@ -0,0 +1,308 @@
+from __future__ import annotations
+
+import re
+from bisect import bisect_left, bisect_right, insort
+from datetime import UTC, datetime
+from typing import TYPE_CHECKING
+
+if TYPE_CHECKING:
+    from collections.abc import Iterable, Iterator
+
+    from core.case_record import CaseRecord
+
+# ⸻⸻⸻⸻⸻⸻⸻⸻⸻⸻⸻⸻⸻⸻⸻⸻⸻⸻⸻
+# Case Index Management
+# ⸻⸻⸻⸻⸻⸻⸻⸻⸻⸻⸻⸻⸻⸻⸻⸻⸻⸻⸻
+
+TOKEN_PATTERN : re.Pattern[str] = re.compile(r"\w+")
+
+def tokenize(text : str | None) -> list[str]:
+    return TOKEN_PATTERN.findall(text.casefold()) if text else []
+
+def case_terms(case : CaseRecord) -> frozenset[str]:
+    return frozenset(tokenize(case.reason) + tokenize(case.content))
+
+def to_epoch(value : datetime | str) -> float:
+    moment = datetime.fromisoformat(value) if isinstance(value, str) else value
+    if moment.tzinfo is None:
+        moment = moment.replace(tzinfo = UTC)
+    return moment.timestamp()
+
+def _add_sorted(
+    postings : list[int],
+    case_id  : int,
+) -> None:
+    if not postings or postings[-1] < case_id:
+        postings.append(case_id)
+    else:
+        insort(postings, case_id)
+
+def _remove_sorted(
+    postings : list[int],
+    case_id  : int,
+) -> None:
+    i = bisect_left(postings, case_id)
+    if i < len(postings) and postings[i] == case_id:
+        _ = postings.pop(i)
+
+def _remove_sorted_term(
+    vocabulary : list[str],
+    term       : str,
+) -> None:
+    i = bisect_left(vocabulary, term)
+    if i < len(vocabulary) and vocabulary[i] == term:
+        _ = vocabulary.pop(i)
+
+def _contains_sorted(
+    postings : list[int],
+    case_id  : int,
+) -> bool:
+    i = bisect_left(postings, case_id)
+    return i < len(postings) and postings[i] == case_id
+
+class GuildCaseIndex:
+    case_ids     : list[int]
+    by_user      : dict[int, list[int]]
+    by_moderator : dict[int, list[int]]
+    by_type      : dict[str, list[int]]
+    by_related   : dict[int, list[int]]
+    epochs       : dict[int, float]
+    time_keys    : list[float]
+    time_ids     : list[int]
+    terms        : dict[str, list[int]]
+    vocabulary   : list[str]
+    case_terms   : dict[int, frozenset[str]]
+
+    def __init__(self) -> None:
+        self.case_ids     = []
+        self.by_user      = {}
+        self.by_moderator = {}
+        self.by_type      = {}
+        self.by_related   = {}
+        self.epochs       = {}
+        self.time_keys    = []
+        self.time_ids     = []
+        self.terms        = {}
+        self.vocabulary   = []
+        self.case_terms   = {}
+
+    def add(self, case : CaseRecord) -> None:
+        case_id = case.case_id
+        _add_sorted(self.case_ids, case_id)
+
+        target_user_id = case.target_user_id
+        if target_user_id is not None:
+            _add_sorted(self.by_user.setdefault(target_user_id, []), case_id)
+
+        related_case_id = case.related_case_id
+        if related_case_id is not None:
+            _add_sorted(self.by_related.setdefault(related_case_id, []), case_id)
+
+        _add_sorted(self.by_moderator.setdefault(case.moderator_id, []), case_id)
+        _add_sorted(self.by_type.setdefault(case.type.value, []), case_id)
+
+        epoch = case.epoch
+        self.epochs[case_id] = epoch
+        i = bisect_right(self.time_keys, epoch)
+        self.time_keys.insert(i, epoch)
+        self.time_ids.insert(i, case_id)
+
+        self.add_text(case)
+
+    def add_text(self, case : CaseRecord) -> None:
+        case_id = case.case_id
+        terms   = case_terms(case)
+        self.case_terms[case_id] = terms
+        for term in terms:
+            postings = self.terms.get(term)
+            if postings is None:
+                postings = self.terms[term] = []
+                insort(self.vocabulary, term)
+            _add_sorted(postings, case_id)
+
+    def remove_text(self, case_id : int) -> None:
+        for term in self.case_terms.pop(case_id, frozenset()):
+            postings = self.terms.get(term)
+            if postings is None:
+                continue
+            _remove_sorted(postings, case_id)
+            if not postings:
+                del self.terms[term]
+                _remove_sorted_term(self.vocabulary, term)
+
+    def search(self, query : str) -> list[int] | None:
+        tokens = tokenize(query)
+        if not tokens:
+            return None
+
+        matches : list[list[int]] = []
+        for token in set(tokens):
+            i = bisect_left(self.vocabulary, token)
+            words : list[str] = []
+            while i < len(self.vocabulary) and self.vocabulary[i].startswith(token):
+                words.append(self.vocabulary[i])
+                i += 1
+            if not words:
+                return []
+            if len(words) == 1:
+                matches.append(self.terms[words[0]])
+            else:
+                merged : set[int] = set()
+                for word in words:
+                    merged.update(self.terms[word])
+                matches.append(sorted(merged))
+
+        matches.sort(key = len)
+        first, rest = matches[0], matches[1:]
+        return [
+            case_id for case_id in first
+            if all(_contains_sorted(other, case_id) for other in rest)
+        ]
+
+    def remove(self, case : CaseRecord) -> None:
+        case_id = case.case_id
+        _remove_sorted(self.case_ids, case_id)
+
+        for postings, key in (
+            (self.by_user,      case.target_user_id),
+            (self.by_related,   case.related_case_id),
+            (self.by_moderator, case.moderator_id),
+        ):
+            if key is not None and key in postings:
+                _remove_sorted(postings[key], case_id)
+                if not postings[key]:
+                    del postings[key]
+
+        if case.type.value in self.by_type:
+            _remove_sorted(self.by_type[case.type.value], case_id)
+
+        # Tokens go first so a case without a time entry cannot leave its
+        # text postings behind.
+        self.remove_text(case_id)
+
+        epoch = self.epochs.pop(case_id, None)
+        if epoch is None:
+            return
+        lo = bisect_left(self.time_keys, epoch)
+        hi = bisect_right(self.time_keys, epoch)
+        for i in range(lo, hi):
+            if self.time_ids[i] == case_id:
+                del self.time_keys[i]
+                del self.time_ids[i]
+                break
+
+    def query(
+        self,
+        user_id       : int      | None = None,
+        moderator_id  : int      | None = None,
+        case_type     : str      | None = None,
+        contains      : str      | None = None,
+        after         : datetime | None = None,
+        before        : datetime | None = None,
+        *,
+        include_notes : bool            = True,
+    ) -> list[int]:
+        return list(self.iter_ids(
+            user_id       = user_id,
+            moderator_id  = moderator_id,
+            case_type     = case_type,
+            contains      = contains,
+            after         = after,
+            before        = before,
+            include_notes = include_notes,
+        ))
+
+    def iter_ids(
+        self,
+        user_id       : int      | None = None,
+        moderator_id  : int      | None = None,
+        case_type     : str      | None = None,
+        contains      : str      | None = None,
+        after         : datetime | None = None,
+        before        : datetime | None = None,
+        *,
+        include_notes : bool            = True,
+        after_case_id : int      | None = None,
+        ascending     : bool            = False,
+    ) -> Iterator[int]:
+        postings : list[list[int]] = []
+        if contains is not None:
+            matches = self.search(contains)
+            if matches is not None:
+                postings.append(matches)
+        if user_id is not None:
+            postings.append(self.by_user.get(user_id, []))
+        if moderator_id is not None:
+            postings.append(self.by_moderator.get(moderator_id, []))
+        if case_type is not None:
+            postings.append(self.by_type.get(case_type, []))
+
+        after_epoch  = to_epoch(after)  if after  is not None else None
+        before_epoch = to_epoch(before) if before is not None else None
+        has_range    = after_epoch is not None or before_epoch is not None
+
+        lo = bisect_right(self.time_keys, after_epoch) if after_epoch is not None else 0
+        hi = bisect_left(self.time_keys, before_epoch) if before_epoch is not None else len(self.time_keys)
+        range_size = max(0, hi - lo)
+
+        postings.sort(key = len)
+        if has_range and (not postings or range_size < len(postings[0])):
+            candidates = sorted(self.time_ids[lo:hi])
+        elif postings:
+            candidates = postings.pop(0)
+        else:
+            candidates = self.case_ids
+
+        notes = self.by_type.get("note", []) if not include_notes else []
+
+        # The cursor is exclusive in either direction; walking up from the
+        # oldest case lets the last page be read without paging through.
+        if ascending:
+            start = bisect_right(candidates, after_case_id) if after_case_id is not None else 0
+            order = range(start, len(candidates))
+        else:
+            start = bisect_left(candidates, after_case_id) if after_case_id is not None else len(candidates)
+            order = range(start - 1, -1, -1)
+        for i in order:
+            case_id = candidates[i]
+            if notes and _contains_sorted(notes, case_id):
+                continue
+            if has_range:
+                epoch = self.epochs[case_id]
+                if after_epoch is not None and epoch <= after_epoch:
+                    continue
+                if before_epoch is not None and epoch >= before_epoch:
+                    continue
+            if all(_contains_sorted(other, case_id) for other in postings):
+                yield case_id
+
+class CaseIndex:
+    guilds : dict[int, GuildCaseIndex]
+
+    def __init__(self) -> None:
+        self.guilds = {}
+
+    def rebuild(self, cases : Iterable[CaseRecord]) -> None:
+        self.guilds = {}
+        for case in sorted(cases, key = lambda c : c.case_id):
+            self.add(case)
+
+    def add(self, case : CaseRecord) -> None:
+        guild_index = self.guilds.get(case.guild_id)
+        if guild_index is None:
+            guild_index = self.guilds[case.guild_id] = GuildCaseIndex()
+        guild_index.add(case)
+
+    def remove(self, case : CaseRecord) -> None:
+        guild_index = self.guilds.get(case.guild_id)
+        if guild_index is not None:
+            guild_index.remove(case)
+
+    def update_text(self, case : CaseRecord) -> None:
+        guild_index = self.guilds.get(case.guild_id)
+        if guild_index is not None:
+            guild_index.remove_text(case.case_id)
+            guild_index.add_text(case)
+
+    def guild(self, guild_id : int) -> GuildCaseIndex:
+        return self.guilds.get(guild_id) or GuildCaseIndex()
@@ -0,0 +1,235 @@
+from __future__ import annotations
+
+import asyncio
+import contextlib
+import json
+import logging
+import re
+from typing import TYPE_CHECKING, TypedDict
+
+import discord
+
+from core.case_storage import write_text_atomic
+from core.user_resolver import user_resolver
+
+if TYPE_CHECKING:
+    from collections.abc import Iterable
+    from pathlib import Path
+
+    from core.cases import CaseData, CasesManager
+
+log = logging.getLogger("Utility Bot")
+
+# ⸻⸻⸻⸻⸻⸻⸻⸻⸻⸻⸻⸻⸻⸻⸻⸻⸻⸻⸻
+# Case Log Outbox
+# ⸻⸻⸻⸻⸻⸻⸻⸻⸻⸻⸻⸻⸻⸻⸻⸻⸻⸻⸻
+
+OUTBOX_BATCH_SIZE      : int   = 10
+OUTBOX_EMBED_CHARS     : int   = 6000
+OUTBOX_HISTORY_SCAN    : int   = 50
+OUTBOX_MIN_BACKOFF     : float = 1.0
+OUTBOX_MAX_BACKOFF     : float = 300.0
+HTTP_TOO_MANY_REQUESTS : int   = 429
+HTTP_SERVER_ERROR      : int   = 500
+
+CASE_TITLE_PATTERN : re.Pattern[str] = re.compile(r"^Case #(\d+) ")
+
+class OutboxFile(TypedDict):
+    pending   : list[int]
+    in_flight : list[int]
+
+class CaseLogOutbox:
+    manager   : CasesManager
+    path      : Path
+    pending   : list[int]
+    in_flight : list[int]
+    _wake     : asyncio.Event
+    _lock     : asyncio.Lock
+    _task     : asyncio.Task[None] | None
+
+    def __init__(
+        self,
+        manager : CasesManager,
+        path    : Path,
+    ) -> None:
+        self.manager   = manager
+        self.path      = path
+        self.pending   = []
+        self.in_flight = []
+        self._wake     = asyncio.Event()
+        self._lock     = asyncio.Lock()
+        self._task     = None
+
+    def load(self) -> None:
+        try:
+            with self.path.open() as f:
+                data : OutboxFile = json.load(f)
+        except FileNotFoundError:
+            return
+        except (OSError, json.JSONDecodeError):
+            log.exception("Failed to read case log outbox %s", self.path)
+            return
+
+        self.in_flight = list(data.get("in_flight", []))
+        self.pending   = list(data.get("pending", []))
+        if self.pending:
+            log.info("Resuming %s undelivered case log entries", len(self.pending))
+
+    def start(self) -> None:
+        if self._task is None or self._task.done():
+            self._task = asyncio.create_task(
+                self._run(),
+                name = "case-log-outbox",
+            )
+
+    async def close(self) -> None:
+        if self._task is not None:
+            _ = self._task.cancel()
+            with contextlib.suppress(asyncio.CancelledError):
+                await self._task
+            self._task = None
+
+    async def enqueue(self, case_ids : Iterable[int]) -> None:
+        self.pending.extend(case_ids)
+        await self._persist()
+        self._wake.set()
+
+    async def _persist(self) -> None:
+        async with self._lock:
+            data : OutboxFile = {
+                "pending"   : self.pending,
+                "in_flight" : self.in_flight,
+            }
+            payload = json.dumps(data)
+            _ = await asyncio.to_thread(write_text_atomic, self.path, payload)
+
+    async def _run(self) -> None:
+        await self.manager.bot.wait_until_ready()
+
+        if self.in_flight:
+            await self._reconcile()
+
+        backoff = OUTBOX_MIN_BACKOFF
+        while True:
+            if not self.pending:
+                self._wake.clear()
+                _ = await self._wake.wait()
+                continue
+
+            try:
+                await self._deliver_next()
+            except discord.RateLimited as e:
+                await asyncio.sleep(e.retry_after)
+            except discord.HTTPException as e:
+                if self.in_flight and e.status < HTTP_SERVER_ERROR and e.status != HTTP_TOO_MANY_REQUESTS:
+                    log.exception("Dropping undeliverable case log batch %s", self.in_flight)
+                    await self._complete(self.in_flight)
+                    continue
+                log.warning("Case log delivery failed, retrying in %.0fs", backoff)
+                await asyncio.sleep(backoff)
+                backoff = min(backoff * 2, OUTBOX_MAX_BACKOFF)
+            except Exception:
+                log.exception("Case log outbox worker error")
+                await asyncio.sleep(backoff)
+                backoff = min(backoff * 2, OUTBOX_MAX_BACKOFF)
+            else:
+                backoff = OUTBOX_MIN_BACKOFF
+
+    def _resolve_channel(self, guild_id : int) -> discord.TextChannel | discord.Thread | None:
+        channel_id = self.manager.config.get("log_channel_id")
+        guild      = self.manager.bot.get_guild(guild_id)
+        if not channel_id or guild is None:
+            return None
+
+        channel = guild.get_channel(channel_id)
+        if not isinstance(channel, discord.TextChannel | discord.Thread):
+            return None
+        return channel
+
+    def _next_batch(self) -> list[CaseData]:
+        batch : list[CaseData] = []
+        for case_id in self.pending:
+            record = self.manager.cases.get(case_id)
+            if record is None:
+                if batch:
+                    break
+                continue
+            if batch and record.guild_id != batch[0]["guild_id"]:
+                break
+            batch.append(record.to_data())
+            if len(batch) >= OUTBOX_BATCH_SIZE:
+                break
+        return batch
+
+    async def _deliver_next(self) -> None:
+        batch = self._next_batch()
+        if not batch:
+            await self._complete(list(self.pending))
+            return
+
+        guild   = self.manager.bot.get_guild(batch[0]["guild_id"])
+        channel = self._resolve_channel(batch[0]["guild_id"])
+        if guild is None or channel is None:
+            await self._complete(self._through(batch[-1]["case_id"]))
+            return
+
+        _ = await user_resolver(self.manager.bot).resolve_many(
+            case["target_user_id"] for case in batch if case["target_user_id"]
+        )
+
+        embeds : list[discord.Embed] = []
+        size   = 0
+        for case in batch:
+            embed = await self.manager.build_log_embed(guild, case)
+            if embeds and size + len(embed) > OUTBOX_EMBED_CHARS:
+                break
+            embeds.append(embed)
+            size += len(embed)
+
+        self.in_flight = self._through(batch[len(embeds) - 1]["case_id"])
+        await self._persist()
+
+        try:
+            _ = await channel.send(embeds = embeds)
+        except discord.Forbidden:
+            log.warning("Missing access to case log channel %s, dropping batch", channel.id)
+
+        await self._complete(self.in_flight)
+
+    def _through(self, case_id : int) -> list[int]:
+        return self.pending[:self.pending.index(case_id) + 1]
+
+    async def _complete(self, case_ids : list[int]) -> None:
+        done           = set(case_ids)
+        self.pending   = [case_id for case_id in self.pending if case_id not in done]
+        self.in_flight = []
+        await self._persist()
+
+    async def _reconcile(self) -> None:
+        first   = next((self.manager.cases.get(i) for i in self.in_flight if i in self.manager.cases), None)
+        channel = self._resolve_channel(first.guild_id) if first is not None else None
+        if channel is None:
+            self.in_flight = []
+            await self._persist()
+            return
+
+        delivered : set[int] = set()
+        bot_user  = self.manager.bot.user
+        try:
+            async for message in channel.history(limit = OUTBOX_HISTORY_SCAN):
+                if bot_user is None or message.author.id != bot_user.id:
+                    continue
+                for embed in message.embeds:
+                    match = CASE_TITLE_PATTERN.match(embed.title or "")
+                    if match:
+                        delivered.add(int(match.group(1)))
+        except discord.HTTPException:
+            log.exception("Failed to check case log channel for in-flight entries")
+
+        posted = [case_id for case_id in self.in_flight if case_id in delivered]
+        if posted:
+            log.info("Skipping %s case log entries already posted before restart", len(posted))
+            await self._complete(posted)
+        else:
+            self.in_flight = []
+            await self._persist()
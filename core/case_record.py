@@ -0,0 +1,114 @@
+from __future__ import annotations
+
+import sys
+from dataclasses import dataclass
+from datetime import UTC, datetime
+from enum import Enum
+from typing import TYPE_CHECKING
+
+if TYPE_CHECKING:
+    from core.cases import CaseData
+
+# ⸻⸻⸻⸻⸻⸻⸻⸻⸻⸻⸻⸻⸻⸻⸻⸻⸻⸻⸻
+# Compact Case Records
+# ⸻⸻⸻⸻⸻⸻⸻⸻⸻⸻⸻⸻⸻⸻⸻⸻⸻⸻⸻
+
+US_PER_SECOND : int = 1_000_000
+
+class CaseType(str, Enum):
+    BAN               = "ban"
+    UNBAN             = "unban"
+    KICK              = "kick"
+    TIMEOUT           = "timeout"
+    UNTIMEOUT         = "untimeout"
+    QUARANTINE_ADD    = "quarantine_add"
+    QUARANTINE_REMOVE = "quarantine_remove"
+    LOCKDOWN_ADD      = "lockdown_add"
+    LOCKDOWN_REMOVE   = "lockdown_remove"
+    PURGE             = "purge"
+    NOTE              = "note"
+
+class Visibility(str, Enum):
+    MODERATORS        = "moderators"
+    SENIOR_MODERATORS = "senior_moderators"
+    DIRECTORS         = "directors"
+
+def to_micros(value : datetime | str) -> int:
+    moment = datetime.fromisoformat(value) if isinstance(value, str) else value
+    if moment.tzinfo is None:
+        moment = moment.replace(tzinfo = UTC)
+    delta = moment - datetime(1970, 1, 1, tzinfo = UTC)
+    return (delta.days * 86_400 + delta.seconds) * US_PER_SECOND + delta.microseconds
+
+def from_micros(value : int) -> str:
+    seconds, micros = divmod(value, US_PER_SECOND)
+    return datetime.fromtimestamp(seconds, UTC).replace(microsecond = micros).isoformat()
+
+def _intern(value : str | None) -> str | None:
+    return sys.intern(value) if value is not None else None
+
+@dataclass(slots = True)
+class CaseRecord:
+    case_id            : int
+    type               : CaseType
+    guild_id           : int
+    moderator_id       : int
+    moderator_name     : str
+    target_user_id     : int | None
+    target_user_name   : str | None
+    reason             : str | None
+    content            : str | None
+    duration           : str | None
+    related_case_id    : int | None
+    visibility_level   : Visibility
+    pending_visibility : Visibility | None
+    created_at         : int
+    edited_at          : int | None
+    metadata           : dict[str, object] | None
+
+    @property
+    def epoch(self) -> float:
+        return self.created_at / US_PER_SECOND
+
+    @classmethod
+    def from_data(cls, case : CaseData) -> CaseRecord:
+        pending   = case.get("pending_visibility")
+        edited_at = case.get("edited_at")
+        return cls(
+            case_id            = case["case_id"],
+            type               = CaseType(case["type"]),
+            guild_id           = case["guild_id"],
+            moderator_id       = case["moderator_id"],
+            moderator_name     = sys.intern(case["moderator_name"]),
+            target_user_id     = case.get("target_user_id"),
+            target_user_name   = _intern(case.get("target_user_name")),
+            reason             = case.get("reason"),
+            content            = case.get("content"),
+            duration           = _intern(case.get("duration")),
+            related_case_id    = case.get("related_case_id"),
+            visibility_level   = Visibility(case.get("visibility_level") or Visibility.MODERATORS),
+            pending_visibility = Visibility(pending) if pending else None,
+            created_at         = to_micros(case["created_at"]),
+            edited_at          = to_micros(edited_at) if edited_at else None,
+            metadata           = case.get("metadata") or None,
+        )
+
+    def to_data(self) -> CaseData:
+        return {
+            "case_id"            : self.case_id,
+            "type"               : self.type.value,
+            "guild_id"           : self.guild_id,
+            "moderator_id"       : self.moderator_id,
+            "moderator_name"     : self.moderator_name,
+            "target_user_id"     : self.target_user_id,
+            "target_user_name"   : self.target_user_name,
+            "reason"             : self.reason,
+            "content"            : self.content,
+            "duration"           : self.duration,
+            "related_case_id"    : self.related_case_id,
+            "visibility_level"   : self.visibility_level.value,
+            "pending_visibility" : self.pending_visibility.value if self.pending_visibility else None,
+            "created_at"         : from_micros(self.created_at),
+            "edited_at"          : from_micros(self.edited_at) if self.edited_at is not None else None,
+            "metadata"           : dict(self.metadata) if self.metadata else {},
+        }
@@ -0,0 +1,256 @@
+from __future__ import annotations
+
+from collections import Counter
+from typing import TYPE_CHECKING, TypedDict
+
+import numpy as np
+
+if TYPE_CHECKING:
+    from collections.abc import Iterable
+
+    from numpy.typing import NDArray
+
+    from core.case_record import CaseRecord
+
+# ⸻⸻⸻⸻⸻⸻⸻⸻⸻⸻⸻⸻⸻⸻⸻⸻⸻⸻⸻
+# Case Statistics
+# ⸻⸻⸻⸻⸻⸻⸻⸻⸻⸻⸻⸻⸻⸻⸻⸻⸻⸻⸻
+
+SECONDS_PER_DAY  : int = 86_400
+INITIAL_CAPACITY : int = 256
+IGNORED_TYPES    : frozenset[str] = frozenset({"note"})
+
+class CaseStatsSummary(TypedDict):
+    total            : int
+    by_type          : list[tuple[str, int]]
+    by_moderator     : list[tuple[int, int]]
+    by_day           : list[tuple[int, int]]
+    by_week          : list[tuple[int, int]]
+    repeat_offenders : int
+    top_offenders    : list[tuple[int, int]]
+
+def day_of(case : CaseRecord) -> int:
+    return int(case.epoch // SECONDS_PER_DAY)
+
+def week_of(day : int) -> int:
+    # Day 0 of the epoch is a Thursday, shift so weeks start on Monday.
+    return (day + 3) // 7
+
+def _column_counts(
+    keys : NDArray[np.int64],
+    mask : NDArray[np.bool_],
+) -> list[tuple[int, int]]:
+    values, counts = np.unique(keys[mask], return_counts = True)
+    order          = np.argsort(-counts, kind = "stable")
+    return [(int(values[i]), int(counts[i])) for i in order]
+
+class GuildCaseStats:
+    size         : int
+    case_ids     : NDArray[np.int64]
+    days         : NDArray[np.int64]
+    types        : NDArray[np.int64]
+    moderators   : NDArray[np.int64]
+    targets      : NDArray[np.int64]
+    alive        : NDArray[np.bool_]
+    positions    : dict[int, int]
+    type_codes   : dict[str, int]
+    type_names   : list[str]
+    by_type      : Counter[str]
+    by_moderator : Counter[int]
+    by_day       : Counter[int]
+    by_target    : Counter[int]
+
+    def __init__(self) -> None:
+        self.size         = 0
+        self.case_ids     = np.zeros(INITIAL_CAPACITY, dtype = np.int64)
+        self.days         = np.zeros(INITIAL_CAPACITY, dtype = np.int64)
+        self.types        = np.zeros(INITIAL_CAPACITY, dtype = np.int64)
+        self.moderators   = np.zeros(INITIAL_CAPACITY, dtype = np.int64)
+        self.targets      = np.zeros(INITIAL_CAPACITY, dtype = np.int64)
+        self.alive        = np.zeros(INITIAL_CAPACITY, dtype = np.bool_)
+        self.positions    = {}
+        self.type_codes   = {}
+        self.type_names   = []
+        self.by_type      = Counter()
+        self.by_moderator = Counter()
+        self.by_day       = Counter()
+        self.by_target    = Counter()
+
+    def _grow(self) -> None:
+        capacity        = len(self.case_ids) * 2
+        self.case_ids   = np.resize(self.case_ids,   capacity)
+        self.days       = np.resize(self.days,       capacity)
+        self.types      = np.resize(self.types,      capacity)
+        self.moderators = np.resize(self.moderators, capacity)
+        self.targets    = np.resize(self.targets,    capacity)
+        self.alive      = np.resize(self.alive,      capacity)
+        self.alive[self.size:] = False
+
+    def _type_code(self, case_type : str) -> int:
+        code = self.type_codes.get(case_type)
+        if code is None:
+            code = self.type_codes[case_type] = len(self.type_names)
+            self.type_names.append(case_type)
+        return code
+
+    def add(self, case : CaseRecord) -> None:
+        if case.type.value in IGNORED_TYPES or case.case_id in self.positions:
+            return
+        if self.size == len(self.case_ids):
+            self._grow()
+
+        i         = self.size
+        day       = day_of(case)
+        target_id = case.target_user_id or 0
+
+        self.case_ids[i]   = case.case_id
+        self.days[i]       = day
+        self.types[i]      = self._type_code(case.type.value)
+        self.moderators[i] = case.moderator_id
+        self.targets[i]    = target_id
+        self.alive[i]      = True
+        self.positions[case.case_id] = i
+        self.size += 1
+
+        self.by_type[case.type.value]        += 1
+        self.by_moderator[case.moderator_id] += 1
+        self.by_day[day]                     += 1
+        if target_id:
+            self.by_target[target_id] += 1
+
+    def extend(
+        self,
+        case_ids   : NDArray[np.int64],
+        days       : NDArray[np.int64],
+        types      : NDArray[np.str_],
+        moderators : NDArray[np.int64],
+        targets    : NDArray[np.int64],
+    ) -> None:
+        fresh = np.array([int(case_id) not in self.positions for case_id in case_ids], dtype = np.bool_)
+        count = int(fresh.sum())
+        if not count:
+            return
+        while self.size + count > len(self.case_ids):
+            self._grow()
+
+        start, end = self.size, self.size + count
+        codes      = np.array([self._type_code(str(t)) for t in types[fresh]], dtype = np.int64)
+
+        self.case_ids[start:end]   = case_ids[fresh]
+        self.days[start:end]       = days[fresh]
+        self.types[start:end]      = codes
+        self.moderators[start:end] = moderators[fresh]
+        self.targets[start:end]    = targets[fresh]
+        self.alive[start:end]      = True
+        self.positions.update((int(case_id), start + i) for i, case_id in enumerate(case_ids[fresh]))
+        self.size = end
+
+        self.by_type.update(str(t) for t in types[fresh])
+        self.by_moderator.update(int(m) for m in moderators[fresh])
+        self.by_day.update(int(d) for d in days[fresh])
+        self.by_target.update(int(t) for t in targets[fresh] if t)
+
+    def remove(self, case : CaseRecord) -> None:
+        i = self.positions.pop(case.case_id, None)
+        if i is None:
+            return
+
+        self.alive[i] = False
+        self.by_type[case.type.value]        -= 1
+        self.by_moderator[case.moderator_id] -= 1
+        self.by_day[int(self.days[i])]       -= 1
+        if self.targets[i]:
+            self.by_target[int(self.targets[i])] -= 1
+
+    def summary(
+        self,
+        since_day : int | None = None,
+        *,
+        limit     : int        = 10,
+    ) -> CaseStatsSummary:
+        if since_day is None:
+            return self._rollup_summary(limit)
+        return self._window_summary(since_day, limit)
+
+    def _rollup_summary(self, limit : int) -> CaseStatsSummary:
+        by_week : Counter[int] = Counter()
+        for day, count in self.by_day.items():
+            by_week[week_of(day)] += count
+
+        offenders = [(user_id, count) for user_id, count in self.by_target.most_common() if count > 1]
+
+        return {
+            "total"            : len(self.positions),
+            "by_type"          : [(t, c) for t, c in self.by_type.most_common() if c > 0],
+            "by_moderator"     : [(m, c) for m, c in self.by_moderator.most_common(limit) if c > 0],
+            "by_day"           : sorted((d, c) for d, c in self.by_day.items() if c > 0),
+            "by_week"          : sorted((w, c) for w, c in by_week.items() if c > 0),
+            "repeat_offenders" : len(offenders),
+            "top_offenders"    : offenders[:limit],
+        }
+
+    def _window_summary(
+        self,
+        since_day : int,
+        limit     : int,
+    ) -> CaseStatsSummary:
+        n    = self.size
+        mask = self.alive[:n] & (self.days[:n] >= since_day)
+
+        types = _column_counts(self.types[:n], mask)
+        days  = _column_counts(self.days[:n], mask)
+        weeks = _column_counts((self.days[:n] + 3) // 7, mask)
+
+        target_mask = mask & (self.targets[:n] != 0)
+        offenders   = [(u, c) for u, c in _column_counts(self.targets[:n], target_mask) if c > 1]
+
+        return {
+            "total"            : int(mask.sum()),
+            "by_type"          : [(self.type_names[code], count) for code, count in types],
+            "by_moderator"     : _column_counts(self.moderators[:n], mask)[:limit],
+            "by_day"           : sorted(days),
+            "by_week"          : sorted(weeks),
+            "repeat_offenders" : len(offenders),
+            "top_offenders"    : offenders[:limit],
+        }
+
+class CaseStats:
+    guilds : dict[int, GuildCaseStats]
+
+    def __init__(self) -> None:
+        self.guilds = {}
+
+    def rebuild(self, cases : Iterable[CaseRecord]) -> None:
+        self.guilds = {}
+        for case in sorted(cases, key = lambda c : c.case_id):
+            self.add(case)
+
+    def add(self, case : CaseRecord) -> None:
+        guild_stats = self.guilds.get(case.guild_id)
+        if guild_stats is None:
+            guild_stats = self.guilds[case.guild_id] = GuildCaseStats()
+        guild_stats.add(case)
+
+    def extend(
+        self,
+        guild_ids  : NDArray[np.int64],
+        case_ids   : NDArray[np.int64],
+        days       : NDArray[np.int64],
+        types      : NDArray[np.str_],
+        moderators : NDArray[np.int64],
+        targets    : NDArray[np.int64],
+    ) -> None:
+        for guild_id in np.unique(guild_ids):
+            mask        = guild_ids == guild_id
+            guild_stats = self.guilds.get(int(guild_id))
+            if guild_stats is None:
+                guild_stats = self.guilds[int(guild_id)] = GuildCaseStats()
+            guild_stats.extend(case_ids[mask], days[mask], types[mask], moderators[mask], targets[mask])
+
+    def remove(self, case : CaseRecord) -> None:
+        guild_stats = self.guilds.get(case.guild_id)
+        if guild_stats is not None:
+            guild_stats.remove(case)
+
+    def guild(self, guild_id : int) -> GuildCaseStats:
+        return self.guilds.get(guild_id) or GuildCaseStats()
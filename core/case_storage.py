@@ -0,0 +1,691 @@
+from __future__ import annotations
+
+import asyncio
+import contextlib
+import json
+import logging
+import os
+from datetime import UTC, datetime
+from pathlib import Path
+from typing import TYPE_CHECKING, Protocol, cast
+
+import aiosqlite
+from typing_extensions import override
+
+if TYPE_CHECKING:
+    from collections.abc import Callable, Iterable, Sequence
+
+    from core.case_record import CaseRecord
+    from core.cases import CaseData, CasesDataFile
+
+log = logging.getLogger("Utility Bot")
+
+# ⸻⸻⸻⸻⸻⸻⸻⸻⸻⸻⸻⸻⸻⸻⸻⸻⸻⸻⸻
+# Case Storage Management
+# ⸻⸻⸻⸻⸻⸻⸻⸻⸻⸻⸻⸻⸻⸻⸻⸻⸻⸻⸻
+
+CASE_COLUMNS : tuple[str, ...] = (
+    "case_id",
+    "type",
+    "guild_id",
+    "moderator_id",
+    "moderator_name",
+    "target_user_id",
+    "target_user_name",
+    "reason",
+    "content",
+    "duration",
+    "related_case_id",
+    "visibility_level",
+    "pending_visibility",
+    "created_at",
+    "edited_at",
+    "metadata",
+)
+
+class CasesBackend(Protocol):
+    async def load(self) -> CasesDataFile: ...
+
+    def refresh(self) -> CasesDataFile | None: ...
+
+    def bind(self, cases : dict[int, CaseRecord]) -> None: ...
+
+    async def save_all(self, data : CasesDataFile) -> None: ...
+
+    async def insert_cases(
+        self,
+        cases        : Sequence[CaseData],
+        next_case_id : int,
+    ) -> None: ...
+
+    async def update_case(self, case : CaseData) -> None: ...
+
+    async def delete_case(self, case_id : int) -> None: ...
+
+    async def close(self) -> None: ...
+
+def empty_cases_data() -> CasesDataFile:
+    return {
+        "cases"        : [],
+        "next_case_id" : 1,
+    }
+
+# Stores are stamped with the schema version they were written with. Loading
+# a store at the current version is a plain deserialize, older stores run
+# each migration from their version upward once and are saved re-stamped.
+CASES_SCHEMA_VERSION : int = 3
+LEGACY_NOTES_FILE    : str = "notes_data.json"
+
+def _migrate_legacy_fields(data : CasesDataFile) -> None:
+    for case in data["cases"]:
+        legacy_case = cast("dict[str, object]", case)
+        if "timestamp" in legacy_case and "created_at" not in legacy_case:
+            case["created_at"] = cast("str", legacy_case.pop("timestamp"))
+
+        _ = case.setdefault("content", None)
+        _ = case.setdefault("related_case_id", None)
+        _ = case.setdefault("visibility_level", "moderators")
+        _ = case.setdefault("pending_visibility", None)
+        _ = case.setdefault("edited_at", None)
+        _ = case.setdefault("metadata", {})
+
+def _legacy_note_case(
+    case_id         : int,
+    note            : dict[str, object],
+    target_user_id  : int | None,
+    related_case_id : int | None,
+    now_iso         : str,
+) -> CaseData:
+    return {
+        "case_id"            : case_id,
+        "type"               : "note",
+        "guild_id"           : int(cast("int", note.get("guild_id", 0))),
+        "moderator_id"       : int(cast("int", note.get("author_id", 0))),
+        "moderator_name"     : str(note.get("author_name", "Unknown")),
+        "target_user_id"     : target_user_id,
+        "target_user_name"   : None,
+        "reason"             : None,
+        "content"            : cast("str | None", note.get("content")),
+        "duration"           : None,
+        "related_case_id"    : related_case_id,
+        "visibility_level"   : str(note.get("classification") or "moderators"),
+        "pending_visibility" : cast("str | None", note.get("classification_pending")),
+        "created_at"         : cast("str", note.get("created_at") or now_iso),
+        "edited_at"          : cast("str | None", note.get("edited_at")),
+        "metadata"           : {},
+    }
+
+def _migrate_legacy_notes(data : CasesDataFile) -> None:
+    notes_file = Path(LEGACY_NOTES_FILE)
+    if not notes_file.exists():
+        return
+
+    notes_data : dict[str, dict[str, list[dict[str, object]]]] = {}
+    with contextlib.suppress(json.JSONDecodeError), notes_file.open() as f:
+        notes_data = json.load(f)
+
+    taken   = {case["case_id"] for case in data["cases"]}
+    next_id = data["next_case_id"]
+    now_iso = datetime.now(UTC).isoformat()
+
+    def _next_id() -> int:
+        nonlocal next_id
+        while next_id in taken:
+            next_id += 1
+        taken.add(next_id)
+        return next_id
+
+    for user_id_str, notes in notes_data.get("user_notes", {}).items():
+        data["cases"].extend(
+            _legacy_note_case(_next_id(), note, int(user_id_str), None, now_iso)
+            for note in notes
+        )
+
+    for case_id_str, notes in notes_data.get("case_notes", {}).items():
+        data["cases"].extend(
+            _legacy_note_case(_next_id(), note, None, int(case_id_str), now_iso)
+            for note in notes
+        )
+
+    data["next_case_id"] = max(data["next_case_id"], max(taken, default = 0) + 1)
+
+CASE_MIGRATIONS : dict[int, Callable[[CasesDataFile], None]] = {
+    1 : _migrate_legacy_fields,
+    2 : _migrate_legacy_notes,
+}
+
+def migrate_cases(data : CasesDataFile) -> bool:
+    version = data.get("schema_version", 1)
+    if version == CASES_SCHEMA_VERSION:
+        return False
+    if version > CASES_SCHEMA_VERSION:
+        msg = f"Case store schema version {version} is newer than supported version {CASES_SCHEMA_VERSION}"
+        raise RuntimeError(msg)
+
+    while version < CASES_SCHEMA_VERSION:
+        CASE_MIGRATIONS[version](data)
+        version += 1
+        log.info("Migrated case store to schema version %s", version)
+
+    data["schema_version"] = version
+    return True
+
+def retire_legacy_files() -> None:
+    notes_file = Path(LEGACY_NOTES_FILE)
+    if notes_file.exists():
+        _ = notes_file.replace(notes_file.with_name(f"{notes_file.name}.migrated"))
+
+def read_json_cases(path : Path) -> CasesDataFile:
+    if path.exists():
+        with contextlib.suppress(json.JSONDecodeError), path.open() as f:
+            return cast("CasesDataFile", json.load(f))
+    return empty_cases_data()
+
+def file_signature(path : Path) -> tuple[int, int] | None:
+    try:
+        stat = path.stat()
+    except OSError:
+        return None
+    return stat.st_mtime_ns, stat.st_size
+
+def write_text_atomic(
+    path    : Path,
+    payload : str,
+) -> tuple[int, int] | None:
+    tmp_path = path.with_name(f"{path.name}.tmp")
+    with tmp_path.open("w") as f:
+        _ = f.write(payload)
+        f.flush()
+        os.fsync(f.fileno())
+    _ = tmp_path.replace(path)
+    return file_signature(path)
+
+def write_json_atomic(
+    path : Path,
+    data : object,
+) -> tuple[int, int] | None:
+    return write_text_atomic(path, json.dumps(data, indent = 4))
+
+def write_bytes_atomic(
+    path    : Path,
+    payload : bytes,
+) -> None:
+    tmp_path = path.with_name(f"{path.name}.tmp")
+    with tmp_path.open("wb") as f:
+        _ = f.write(payload)
+        f.flush()
+        os.fsync(f.fileno())
+    _ = tmp_path.replace(path)
+
+# ⸻⸻⸻⸻⸻⸻⸻⸻⸻⸻⸻⸻⸻⸻
+# JSON Backend
+# ⸻⸻⸻⸻⸻⸻⸻⸻⸻⸻⸻⸻⸻⸻
+
+class JsonCasesBackend:
+    path           : Path
+    cases          : dict[int, CaseRecord]
+    next_case_id   : int
+    schema_version : int
+    _signature     : tuple[int, int] | None
+    _pending_flush : int
+    _lock          : asyncio.Lock
+
+    def __init__(
+        self,
+        path : Path,
+    ) -> None:
+        self.path           = path
+        self.cases          = {}
+        self.next_case_id   = 1
+        self.schema_version = CASES_SCHEMA_VERSION
+        self._signature     = None
+        self._pending_flush = 0
+        self._lock          = asyncio.Lock()
+
+    def _adopt(self, data : CasesDataFile) -> CasesDataFile:
+        self.next_case_id   = data["next_case_id"]
+        self.schema_version = data.get("schema_version", 1)
+        return data
+
+    def _snapshot(self) -> CasesDataFile:
+        return {
+            "schema_version" : self.schema_version,
+            "cases"          : [record.to_data() for record in self.cases.values()],
+            "next_case_id"   : self.next_case_id,
+        }
+
+    def bind(self, cases : dict[int, CaseRecord]) -> None:
+        # The manager owns the records, the file is written from its live view.
+        self.cases = cases
+
+    async def load(self) -> CasesDataFile:
+        signature = await asyncio.to_thread(file_signature, self.path)
+        data      = await asyncio.to_thread(read_json_cases, self.path)
+        self._signature = signature
+        return self._adopt(data)
+
+    def refresh(self) -> CasesDataFile | None:
+        if self._pending_flush:
+            return None
+
+        signature = file_signature(self.path)
+        if signature == self._signature:
+            return None
+
+        log.info("%s changed on disk, reloading cases", self.path)
+        self._signature = signature
+        return self._adopt(read_json_cases(self.path))
+
+    async def save_all(self, data : CasesDataFile) -> None:
+        await self._flush(self._adopt(data))
+
+    async def insert_cases(
+        self,
+        cases        : Sequence[CaseData],  # noqa: ARG002
+        next_case_id : int,
+    ) -> None:
+        self.next_case_id = next_case_id
+        await self._flush()
+
+    async def update_case(self, case : CaseData) -> None:  # noqa: ARG002
+        await self._flush()
+
+    async def delete_case(self, case_id : int) -> None:  # noqa: ARG002
+        await self._flush()
+
+    async def close(self) -> None:
+        async with self._lock:
+            return
+
+    async def _flush(self, data : CasesDataFile | None = None) -> None:
+        self._pending_flush += 1
+        try:
+            async with self._lock:
+                snapshot        = data or self._snapshot()
+                self._signature = await asyncio.to_thread(write_json_atomic, self.path, snapshot)
+        finally:
+            self._pending_flush -= 1
+
+# ⸻⸻⸻⸻⸻⸻⸻⸻⸻⸻⸻⸻⸻⸻
+# Journaled JSON Backend
+# ⸻⸻⸻⸻⸻⸻⸻⸻⸻⸻⸻⸻⸻⸻
+
+JOURNAL_COMPACT_BYTES = 1_048_576
+
+def append_line(
+    path : Path,
+    line : str,
+) -> int:
+    with path.open("a") as f:
+        _ = f.write(line)
+        _ = f.write("\n")
+        f.flush()
+        os.fsync(f.fileno())
+        return f.tell()
+
+def read_journal(path : Path) -> list[dict[str, object]]:
+    if not path.exists():
+        return []
+
+    entries : list[dict[str, object]] = []
+    with path.open() as f:
+        for line in f:
+            if not line.strip():
+                continue
+            try:
+                entries.append(cast("dict[str, object]", json.loads(line)))
+            except json.JSONDecodeError:
+                log.warning("Stopping journal replay at a torn entry in %s", path)
+                break
+    return entries
+
+class JournaledCasesBackend(JsonCasesBackend):
+    journal_path  : Path
+    rotated_path  : Path
+    compact_bytes : int
+    _journal_size : int
+    _compact_lock : asyncio.Lock
+    _compact_task : asyncio.Task[None] | None
+
+    def __init__(
+        self,
+        path          : Path,
+        compact_bytes : int = JOURNAL_COMPACT_BYTES,
+    ) -> None:
+        super().__init__(path)
+        self.journal_path  = path.with_name(f"{path.stem}.journal")
+        self.rotated_path  = path.with_name(f"{path.stem}.journal.compacting")
+        self.compact_bytes = compact_bytes
+        self._journal_size = 0
+        self._compact_lock = asyncio.Lock()
+        self._compact_task = None
+
+    @override
+    async def load(self) -> CasesDataFile:
+        data    = await super().load()
+        entries = await asyncio.to_thread(self._read_journals)
+        if entries:
+            log.info("Replayed %s case journal entries from %s", len(entries), self.journal_path)
+
+        journal_signature  = await asyncio.to_thread(file_signature, self.journal_path)
+        self._journal_size = journal_signature[1] if journal_signature else 0
+        return self._adopt(self._replay(data, entries))
+
+    @override
+    def refresh(self) -> CasesDataFile | None:
+        if self._compact_lock.locked():
+            return None
+        data = super().refresh()
+        if data is None:
+            return None
+        return self._adopt(self._replay(data, self._read_journals()))
+
+    @override
+    async def save_all(self, data : CasesDataFile) -> None:
+        await self._compact(self._adopt(data))
+
+    @override
+    async def insert_cases(
+        self,
+        cases        : Sequence[CaseData],
+        next_case_id : int,
+    ) -> None:
+        self.next_case_id = next_case_id
+        await self._append({
+            "op"    : "insert",
+            "cases" : list(cases),
+            "next"  : next_case_id,
+        })
+
+    @override
+    async def update_case(self, case : CaseData) -> None:
+        await self._append({
+            "op"   : "update",
+            "case" : case,
+        })
+
+    @override
+    async def delete_case(self, case_id : int) -> None:
+        await self._append({
+            "op"      : "delete",
+            "case_id" : case_id,
+        })
+
+    @override
+    async def close(self) -> None:
+        if self._compact_task is not None:
+            with contextlib.suppress(asyncio.CancelledError):
+                await self._compact_task
+        if self._journal_size:
+            await self._compact()
+
+    def _read_journals(self) -> list[dict[str, object]]:
+        return read_journal(self.rotated_path) + read_journal(self.journal_path)
+
+    @staticmethod
+    def _replay(
+        data    : CasesDataFile,
+        entries : list[dict[str, object]],
+    ) -> CasesDataFile:
+        if not entries:
+            return data
+
+        cases        = {case["case_id"] : case for case in data["cases"]}
+        next_case_id = data["next_case_id"]
+        for entry in entries:
+            op = entry.get("op")
+            if op == "insert":
+                for case in cast("list[CaseData]", entry.get("cases") or []):
+                    cases[case["case_id"]] = case
+                next_case_id = max(next_case_id, cast("int", entry.get("next") or 1))
+            elif op == "update":
+                case = cast("CaseData", entry["case"])
+                cases[case["case_id"]] = case
+            elif op == "delete":
+                _ = cases.pop(cast("int", entry["case_id"]), None)
+
+        return {
+            **data,
+            "cases"        : list(cases.values()),
+            "next_case_id" : next_case_id,
+        }
+
+    async def _append(self, entry : dict[str, object]) -> None:
+        line = json.dumps(entry, separators = (",", ":"))
+        async with self._lock:
+            self._journal_size = await asyncio.to_thread(append_line, self.journal_path, line)
+
+        if self._journal_size >= self.compact_bytes and (
+            self._compact_task is None or self._compact_task.done()
+        ):
+            self._compact_task = asyncio.create_task(
+                self._compact(),
+                name = "cases-journal-compaction",
+            )
+
+    async def _compact(self, data : CasesDataFile | None = None) -> None:
+        async with self._compact_lock:
+            self._pending_flush += 1
+            try:
+                async with self._lock:
+                    await asyncio.to_thread(self._rotate_journal)
+                    snapshot           = data or self._snapshot()
+                    self._journal_size = 0
+
+                self._signature = await asyncio.to_thread(write_json_atomic, self.path, snapshot)
+                await asyncio.to_thread(self.rotated_path.unlink, missing_ok = True)
+            except OSError:
+                log.exception("Failed to compact case journal %s", self.journal_path)
+            finally:
+                self._pending_flush -= 1
+
+    def _rotate_journal(self) -> None:
+        if not self.journal_path.exists():
+            return
+        if not self.rotated_path.exists():
+            _ = self.journal_path.replace(self.rotated_path)
+            return
+        with self.rotated_path.open("a") as rotated, self.journal_path.open() as journal:
+            _ = rotated.write(journal.read())
+        self.journal_path.unlink()
+
+# ⸻⸻⸻⸻⸻⸻⸻⸻⸻⸻⸻⸻⸻⸻
+# SQLite Backend
+# ⸻⸻⸻⸻⸻⸻⸻⸻⸻⸻⸻⸻⸻⸻
+
+_SCHEMA : tuple[str, ...] = (
+    """
+    CREATE TABLE IF NOT EXISTS cases (
+        case_id            INTEGER PRIMARY KEY,
+        type               TEXT    NOT NULL,
+        guild_id           INTEGER NOT NULL,
+        moderator_id       INTEGER NOT NULL,
+        moderator_name     TEXT    NOT NULL,
+        target_user_id     INTEGER,
+        target_user_name   TEXT,
+        reason             TEXT,
+        content            TEXT,
+        duration           TEXT,
+        related_case_id    INTEGER,
+        visibility_level   TEXT    NOT NULL DEFAULT 'moderators',
+        pending_visibility TEXT,
+        created_at         TEXT    NOT NULL,
+        edited_at          TEXT,
+        metadata           TEXT    NOT NULL DEFAULT '{}'
+    )
+    """,
+    "CREATE TABLE IF NOT EXISTS case_meta (key TEXT PRIMARY KEY, value INTEGER NOT NULL)",
+    "CREATE INDEX IF NOT EXISTS idx_cases_guild     ON cases (guild_id, case_id)",
+    "CREATE INDEX IF NOT EXISTS idx_cases_target    ON cases (guild_id, target_user_id)",
+    "CREATE INDEX IF NOT EXISTS idx_cases_moderator ON cases (guild_id, moderator_id)",
+    "CREATE INDEX IF NOT EXISTS idx_cases_type      ON cases (guild_id, type)",
+    "CREATE INDEX IF NOT EXISTS idx_cases_related   ON cases (related_case_id)",
+    "CREATE INDEX IF NOT EXISTS idx_cases_created   ON cases (guild_id, created_at)",
+)
+
+_COLUMN_LIST  = ", ".join(CASE_COLUMNS)
+_PLACEHOLDERS = ", ".join("?" for _ in CASE_COLUMNS)
+_ASSIGNMENTS  = ", ".join(f"{column} = ?" for column in CASE_COLUMNS[1:])
+
+_INSERT_SQL = f"INSERT OR REPLACE INTO cases ({_COLUMN_LIST}) VALUES ({_PLACEHOLDERS})" # noqa: S608
+_UPDATE_SQL = f"UPDATE cases SET {_ASSIGNMENTS} WHERE case_id = ?" # noqa: S608
+
+_BUMP_NEXT_ID_SQL = (
+    "INSERT INTO case_meta (key, value) VALUES ('next_case_id', ?) "
+    "ON CONFLICT(key) DO UPDATE SET value = MAX(value, excluded.value)"
+)
+
+_SET_SCHEMA_VERSION_SQL = (
+    "INSERT INTO case_meta (key, value) VALUES ('schema_version', ?) "
+    "ON CONFLICT(key) DO UPDATE SET value = excluded.value"
+)
+
+def _case_to_row(case : CaseData) -> tuple[object, ...]:
+    row : list[object] = [case.get(column) for column in CASE_COLUMNS[:-1]]
+    row.append(json.dumps(case.get("metadata") or {}))
+    return tuple(row)
+
+def _row_to_case(row : aiosqlite.Row) -> CaseData:
+    case = cast("dict[str, object]", {column : row[column] for column in CASE_COLUMNS})
+    case["metadata"] = json.loads(cast("str", row["metadata"]) or "{}")
+    return cast("CaseData", case)
+
+class SqliteCasesBackend:
+    path  : Path
+    _conn : aiosqlite.Connection | None
+
+    def __init__(
+        self,
+        path : Path,
+    ) -> None:
+        self.path  = path
+        self._conn = None
+
+    async def _connect(self) -> aiosqlite.Connection:
+        if self._conn is not None:
+            return self._conn
+
+        conn             = await aiosqlite.connect(self.path)
+        conn.row_factory = aiosqlite.Row
+        _ = await conn.execute("PRAGMA journal_mode = WAL")
+        _ = await conn.execute("PRAGMA synchronous = NORMAL")
+        for statement in _SCHEMA:
+            _ = await conn.execute(statement)
+        await conn.commit()
+
+        self._conn = conn
+        return conn
+
+    async def count_cases(self) -> int:
+        conn = await self._connect()
+        async with conn.execute("SELECT COUNT(*) FROM cases") as cursor:
+            row = await cursor.fetchone()
+        return int(cast("int", row[0])) if row else 0
+
+    async def load(self) -> CasesDataFile:
+        conn = await self._connect()
+
+        async with conn.execute("SELECT * FROM cases ORDER BY case_id") as cursor:
+            cases = [_row_to_case(row) for row in await cursor.fetchall()]
+
+        async with conn.execute(
+            "SELECT value FROM case_meta WHERE key = 'next_case_id'",
+        ) as cursor:
+            row = await cursor.fetchone()
+
+        async with conn.execute(
+            "SELECT value FROM case_meta WHERE key = 'schema_version'",
+        ) as cursor:
+            version = await cursor.fetchone()
+
+        highest      = max((c["case_id"] for c in cases), default = 0)
+        next_case_id = max(int(cast("int", row[0])) if row else 1, highest + 1)
+
+        return {
+            "schema_version" : int(cast("int", version[0])) if version else 1,
+            "cases"          : cases,
+            "next_case_id"   : next_case_id,
+        }
+
+    def refresh(self) -> CasesDataFile | None:
+        return None
+
+    def bind(self, cases : dict[int, CaseRecord]) -> None:
+        pass
+
+    async def save_all(self, data : CasesDataFile) -> None:
+        conn = await self._connect()
+        _    = await conn.execute("DELETE FROM cases")
+        _    = await conn.execute(_SET_SCHEMA_VERSION_SQL, (data.get("schema_version", CASES_SCHEMA_VERSION),))
+        await self._write_rows(conn, data["cases"], data["next_case_id"])
+
+    async def insert_cases(
+        self,
+        cases        : Sequence[CaseData],
+        next_case_id : int,
+    ) -> None:
+        conn = await self._connect()
+        await self._write_rows(conn, cases, next_case_id)
+
+    async def update_case(self, case : CaseData) -> None:
+        conn = await self._connect()
+        row  = _case_to_row(case)
+        _    = await conn.execute(_UPDATE_SQL, (*row[1:], row[0]))
+        await conn.commit()
+
+    async def delete_case(self, case_id : int) -> None:
+        conn = await self._connect()
+        _    = await conn.execute("DELETE FROM cases WHERE case_id = ?", (case_id,))
+        await conn.commit()
+
+    async def close(self) -> None:
+        if self._conn is None:
+            return
+        await self._conn.close()
+        self._conn = None
+
+    async def _write_rows(
+        self,
+        conn         : aiosqlite.Connection,
+        cases        : Iterable[CaseData],
+        next_case_id : int,
+    ) -> None:
+        try:
+            await conn.executemany(_INSERT_SQL, [_case_to_row(c) for c in cases])
+            _ = await conn.execute(_BUMP_NEXT_ID_SQL, (next_case_id,))
+            await conn.commit()
+        except aiosqlite.Error:
+            await conn.rollback()
+            raise
+
+# ⸻⸻⸻⸻⸻⸻⸻⸻⸻⸻⸻⸻⸻⸻
+# JSON → SQLite Migration
+# ⸻⸻⸻⸻⸻⸻⸻⸻⸻⸻⸻⸻⸻⸻
+
+async def migrate_json_to_sqlite(
+    json_path : Path,
+    backend   : SqliteCasesBackend,
+) -> int:
+    if not await asyncio.to_thread(json_path.exists):
+        return 0
+
+    if await backend.count_cases():
+        log.warning(
+            "Skipping case migration: %s already holds cases, leaving %s in place",
+            backend.path,
+            json_path,
+        )
+        return 0
+
+    source = JournaledCasesBackend(json_path)
+    data   = await source.load()
+    _      = migrate_cases(data)
+    await backend.save_all(data)
+    await asyncio.to_thread(retire_legacy_files)
+
+    for path in (json_path, source.rotated_path, source.journal_path):
+        if path.exists():
+            _ = await asyncio.to_thread(path.replace, path.with_name(f"{path.name}.migrated"))
+
+    log.info("Migrated %s cases from %s to %s", len(data["cases"]), json_path, backend.path)
+    return len(data["cases"])
@@ -0,0 +1,290 @@
+from __future__ import annotations
+
+import asyncio
+import csv
+import io
+import json
+import logging
+from bisect import bisect_right
+from datetime import datetime
+from itertools import islice
+from typing import TYPE_CHECKING, Literal, TypedDict, TypeVar, cast
+
+from core.case_record import CaseType, Visibility, to_micros
+from core.case_storage import CASE_COLUMNS
+
+if TYPE_CHECKING:
+    from collections.abc import AsyncIterator, Iterator
+    from pathlib import Path
+
+    from core.cases import CaseData, CasesManager
+
+log = logging.getLogger("Utility Bot")
+
+# ⸻⸻⸻⸻⸻⸻⸻⸻⸻⸻⸻⸻⸻⸻⸻⸻⸻⸻⸻
+# Case Export / Import
+# ⸻⸻⸻⸻⸻⸻⸻⸻⸻⸻⸻⸻⸻⸻⸻⸻⸻⸻⸻
+
+TransferFormat = Literal["ndjson", "csv"]
+RowT           = TypeVar("RowT")
+
+TRANSFER_CHUNK_SIZE : int = 500
+MAX_REPORTED_ERRORS : int = 10
+
+CASE_TYPES        : frozenset[str] = frozenset(t.value for t in CaseType)
+VISIBILITY_LEVELS : frozenset[str] = frozenset(v.value for v in Visibility)
+INT_COLUMNS       : frozenset[str] = frozenset({"case_id", "guild_id", "moderator_id", "target_user_id", "related_case_id"})
+OPTIONAL_COLUMNS  : frozenset[str] = frozenset({
+    "target_user_id",
+    "target_user_name",
+    "reason",
+    "content",
+    "duration",
+    "related_case_id",
+    "pending_visibility",
+    "edited_at",
+})
+
+class ImportResult(TypedDict):
+    imported : int
+    skipped  : int
+    invalid  : int
+    errors   : list[str]
+
+async def iter_guild_cases(
+    manager    : CasesManager,
+    guild_id   : int,
+    chunk_size : int = TRANSFER_CHUNK_SIZE,
+) -> AsyncIterator[list[CaseData]]:
+    last = 0
+    while True:
+        case_ids = manager.index.guild(guild_id).case_ids
+        start    = bisect_right(case_ids, last)
+        chunk    = [manager.cases[case_id].to_data() for case_id in case_ids[start:start + chunk_size]]
+        if not chunk:
+            break
+        last = chunk[-1]["case_id"]
+        yield chunk
+
+    chunk = []
+    async for record in manager.archive.iter_guild_cases(guild_id, manager.cases):
+        chunk.append(record.to_data())
+        if len(chunk) >= chunk_size:
+            yield chunk
+            chunk = []
+    if chunk:
+        yield chunk
+
+def encode_cases(
+    cases  : list[CaseData],
+    fmt    : TransferFormat,
+    *,
+    header : bool = False,
+) -> str:
+    if fmt == "ndjson":
+        return "".join(json.dumps(case, separators = (",", ":")) + "\n" for case in cases)
+
+    buffer = io.StringIO()
+    writer = csv.writer(buffer)
+    if header:
+        writer.writerow(CASE_COLUMNS)
+    for case in cases:
+        row = cast("dict[str, object]", case)
+        writer.writerow(
+            json.dumps(row.get(column) or {}) if column == "metadata"
+            else "" if row.get(column) is None
+            else row.get(column)
+            for column in CASE_COLUMNS
+        )
+    return buffer.getvalue()
+
+async def export_cases(
+    manager  : CasesManager,
+    guild_id : int,
+    path     : Path,
+    fmt      : TransferFormat,
+) -> int:
+    total = 0
+    with path.open("w", newline = "") as f:
+        async for chunk in iter_guild_cases(manager, guild_id):
+            payload = encode_cases(chunk, fmt, header = fmt == "csv" and total == 0)
+            _ = await asyncio.to_thread(f.write, payload)
+            total += len(chunk)
+    return total
+
+def _take(
+    rows  : Iterator[RowT],
+    count : int,
+) -> list[RowT]:
+    return list(islice(rows, count))
+
+def _decode_csv_row(row : dict[str, str]) -> dict[str, object]:
+    record : dict[str, object] = {}
+    for column in CASE_COLUMNS:
+        value = row.get(column, "")
+        if column == "metadata":
+            record[column] = json.loads(value) if value else {}
+        elif value == "" and column in OPTIONAL_COLUMNS:
+            record[column] = None
+        elif column in INT_COLUMNS:
+            record[column] = int(value)
+        else:
+            record[column] = value
+    return record
+
+def validate_case(record : dict[str, object]) -> CaseData:
+    for column in CASE_COLUMNS:
+        if column not in record:
+            msg = f"missing field `{column}`"
+            raise ValueError(msg)
+
+    for column in INT_COLUMNS:
+        value = record[column]
+        if value is None and column in OPTIONAL_COLUMNS:
+            continue
+        if not isinstance(value, int) or isinstance(value, bool):
+            msg = f"`{column}` must be an integer"
+            raise TypeError(msg)
+
+    for column in ("moderator_name", "created_at", "visibility_level", "type"):
+        if not isinstance(record[column], str):
+            msg = f"`{column}` must be a string"
+            raise TypeError(msg)
+
+    for column in OPTIONAL_COLUMNS - INT_COLUMNS:
+        if record[column] is not None and not isinstance(record[column], str):
+            msg = f"`{column}` must be a string or empty"
+            raise TypeError(msg)
+
+    if record["type"] not in CASE_TYPES:
+        msg = f"unknown case type `{record['type']}`"
+        raise ValueError(msg)
+    if record["visibility_level"] not in VISIBILITY_LEVELS:
+        msg = f"unknown visibility level `{record['visibility_level']}`"
+        raise ValueError(msg)
+    if record["pending_visibility"] is not None and record["pending_visibility"] not in VISIBILITY_LEVELS:
+        msg = f"unknown pending visibility level `{record['pending_visibility']}`"
+        raise ValueError(msg)
+    if not isinstance(record["metadata"], dict):
+        msg = "`metadata` must be an object"
+        raise TypeError(msg)
+
+    _ = datetime.fromisoformat(cast("str", record["created_at"]))
+    if record["edited_at"] is not None:
+        _ = datetime.fromisoformat(cast("str", record["edited_at"]))
+
+    return cast("CaseData", {column : record[column] for column in CASE_COLUMNS})
+
+def _parse_row(raw : str | dict[str, str]) -> CaseData:
+    record = _decode_csv_row(raw) if isinstance(raw, dict) else json.loads(raw)
+    if not isinstance(record, dict):
+        msg = "record must be an object"
+        raise TypeError(msg)
+    return validate_case(cast("dict[str, object]", record))
+
+def _imported_cases(
+    manager  : CasesManager,
+    guild_id : int,
+) -> dict[tuple[int, int], int]:
+    # Earlier imports are recognised by their imported_case_id metadata, so
+    # only the guild's hot postings are walked instead of the whole archive.
+    seen : dict[tuple[int, int], int] = {}
+    for case_id in manager.index.guild(guild_id).case_ids:
+        case   = manager.cases[case_id]
+        origin = cast("int", (case.metadata or {}).get("imported_case_id", case_id))
+        seen[origin, case.created_at] = case_id
+    return seen
+
+async def _is_archived(
+    manager    : CasesManager,
+    guild_id   : int,
+    case_id    : int,
+    created_at : int,
+) -> bool:
+    case = await manager.archive.get_case(case_id)
+    return case is not None and case.guild_id == guild_id and case.created_at == created_at
+
+async def import_cases(
+    manager    : CasesManager,
+    guild_id   : int,
+    path       : Path,
+    fmt        : TransferFormat,
+    batch_size : int = TRANSFER_CHUNK_SIZE,
+) -> ImportResult:
+    result : ImportResult = {
+        "imported" : 0,
+        "skipped"  : 0,
+        "invalid"  : 0,
+        "errors"   : [],
+    }
+
+    seen       = _imported_cases(manager, guild_id)
+    id_map     : dict[int, int]        = {}
+    unresolved : list[tuple[int, int]] = []
+    number     = 0
+
+    with path.open(newline = "") as f:
+        rows : Iterator[str] | Iterator[dict[str, str]] = csv.DictReader(f) if fmt == "csv" else iter(f)
+
+        while True:
+            raw_rows : list[str] | list[dict[str, str]] = await asyncio.to_thread(_take, rows, batch_size)
+            if not raw_rows:
+                break
+
+            batch : list[CaseData] = []
+            for raw in raw_rows:
+                number += 1
+                if isinstance(raw, str) and not raw.strip():
+                    continue
+                try:
+                    case = _parse_row(raw)
+                except (ValueError, TypeError) as e:
+                    result["invalid"] += 1
+                    if len(result["errors"]) < MAX_REPORTED_ERRORS:
+                        result["errors"].append(f"record {number}: {e}")
+                    continue
+
+                original_id = case["case_id"]
+                created_at  = to_micros(case["created_at"])
+                existing_id = seen.get((original_id, created_at))
+                if existing_id is None and await _is_archived(manager, guild_id, original_id, created_at):
+                    existing_id = original_id
+                if existing_id is not None:
+                    id_map[original_id] = existing_id
+                    result["skipped"] += 1
+                    continue
+
+                case["case_id"]  = manager.get_next_case_id()
+                case["guild_id"] = guild_id
+                case["metadata"] = {**case["metadata"], "imported_case_id" : original_id}
+
+                seen[original_id, created_at] = case["case_id"]
+                id_map[original_id]            = case["case_id"]
+                batch.append(case)
+
+            for case in batch:
+                related = case["related_case_id"]
+                if related is None:
+                    continue
+                case["related_case_id"] = id_map.get(related)
+                if case["related_case_id"] is None:
+                    unresolved.append((case["case_id"], related))
+
+            if batch:
+                await manager.add_cases(batch)
+                result["imported"] += len(batch)
+
+    # Links to cases that appear later in the file are resolved once every
+    # row has been assigned its new id.
+    for case_id, related in unresolved:
+        if related in id_map:
+            _ = await manager.set_related(case_id, id_map[related])
+
+    log.info(
+        "Imported %s cases into guild %s (%s skipped, %s invalid)",
+        result["imported"],
+        guild_id,
+        result["skipped"],
+        result["invalid"],
+    )
+    return result
@@ -1,10 +1,13 @@
+import asyncio
 import contextlib
+import copy
 import json
-from collections.abc import Sequence
-from datetime import UTC, datetime
-from enum import Enum
+import logging
+from collections.abc import AsyncIterator, Callable, Iterator, Sequence
+from datetime import UTC, datetime, timedelta
+from functools import partial
 from pathlib import Path
-from typing import TypedDict, cast
+from typing import TYPE_CHECKING, Literal, NotRequired, TypedDict, cast
 
 import discord
 from discord.ext import commands
@@ -18,6 +21,32 @@ from constants import (
     COLOR_RED,
     COLOR_YELLOW,
 )
+from core.case_archive import CaseArchive, SegmentInfo, merge_cases
+from core.case_index import CaseIndex, to_epoch, tokenize
+from core.case_outbox import CaseLogOutbox
+from core.case_record import CaseRecord, CaseType, Visibility, to_micros
+from core.case_stats import SECONDS_PER_DAY, CaseStats, CaseStatsSummary
+from core.case_storage import (
+    CASES_SCHEMA_VERSION,
+    CasesBackend,
+    JournaledCasesBackend,
+    JsonCasesBackend,
+    SqliteCasesBackend,
+    migrate_cases,
+    migrate_json_to_sqlite,
+    retire_legacy_files,
+    write_json_atomic,
+)
+from core.state.store import StateStore
+from core.user_resolver import user_resolver
+
+if TYPE_CHECKING:
+    from core.case_archive import SegmentSource
+
+log = logging.getLogger("Utility Bot")
+
+ARCHIVE_INTERVAL    : float = 86_400.0
+REJECTED_CASES_FILE : str   = "cases_rejected.json"
 
 # ⸻⸻⸻⸻⸻⸻⸻⸻⸻⸻⸻⸻⸻⸻⸻⸻⸻⸻⸻
 # Cases Management
@@ -42,303 +71,220 @@ class CaseData(TypedDict):
     metadata           : dict[str, object]
 
 class CasesDataFile(TypedDict):
-    cases        : list[CaseData]
-    next_case_id : int
+    schema_version : NotRequired[int]
+    cases          : list[CaseData]
+    next_case_id   : int
 
 class CasesConfig(TypedDict):
-    log_channel_id : int | None
-
-class CaseType(str, Enum):
-    BAN               = "ban"
-    UNBAN             = "unban"
-    KICK              = "kick"
-    TIMEOUT           = "timeout"
-    UNTIMEOUT         = "untimeout"
-    QUARANTINE_ADD    = "quarantine_add"
-    QUARANTINE_REMOVE = "quarantine_remove"
-    LOCKDOWN_ADD      = "lockdown_add"
-    LOCKDOWN_REMOVE   = "lockdown_remove"
-    PURGE             = "purge"
-    NOTE              = "note"
+    log_channel_id     : int | None
+    storage_backend    : NotRequired[Literal["json", "journal", "sqlite"]]
+    archive_after_days : NotRequired[int]
 
 class CasesManager:
-    bot         : commands.Bot
-    data_file   : str
-    config_file : str
-    data        : CasesDataFile
-    config      : CasesConfig
+    bot           : commands.Bot
+    data_file     : str
+    database_file : str
+    config_file   : str
+    cases         : dict[int, CaseRecord]
+    next_case_id  : int
+    index         : CaseIndex
+    stats         : CaseStats
+    config        : CasesConfig
+    backend       : CasesBackend
+    outbox        : CaseLogOutbox
+    archive       : CaseArchive
+    rejected      : dict[str, CaseData]
+    _archive_task : asyncio.Task[None] | None
+    _archive_lock : asyncio.Lock
+    _reject_task  : asyncio.Task[None] | None
+    config_store  : StateStore
 
     def __init__(
         self,
         bot : commands.Bot,
     ) -> None:
-        self.bot         = bot
-        self.data_file   = "cases_data.json"
-        self.config_file = "cases_config.json"
-        self.data        = self.load_data()
-        self.config      = self.load_config()
-        self._auto_migrate_notes()
-
-    def load_data(self) -> CasesDataFile:
-        if Path(self.data_file).exists():
-            with contextlib.suppress(json.JSONDecodeError), Path(self.data_file).open() as f:
-                data = cast(CasesDataFile, json.load(f))
-                self._normalize_cases(data)
-                return data
-        return {
-            "cases"        : [],
-            "next_case_id" : 1,
-        }
-
-    def _normalize_cases(
-        self,
-        data : CasesDataFile,
-    ) -> None:
-        for case in data.get(
-            "cases",
-            [],
-        ):
-            if "timestamp" in case and "created_at" not in case:
-                legacy_case        = cast(
-                    dict[
-                        str,
-                        object,
-                    ],
-                    case,
-                )
-                case["created_at"] = cast(str, legacy_case.pop("timestamp"))
-
-            _ = case.setdefault(
-                "content",
-                None,
-            )
-            _ = case.setdefault(
-                "related_case_id",
-                None,
-            )
-            _ = case.setdefault(
-                "visibility_level",
-                "moderators",
-            )
-            _ = case.setdefault(
-                "pending_visibility",
-                None,
-            )
-            _ = case.setdefault(
-                "edited_at",
-                None,
-            )
-            _ = case.setdefault(
-                "metadata",
-                {},
-            )
-
-    def _auto_migrate_notes(self) -> None:
-        notes_file = Path("notes_data.json")
-        if not notes_file.exists():
-            return
-
-        notes_data : dict[
-            str,
-            dict[
-                str,
-                list[
-                    dict[
-                        str,
-                        object,
-                    ]
-                ],
-            ],
-        ] = {}
-        with contextlib.suppress(json.JSONDecodeError), Path(notes_file).open() as f:
-            notes_data = cast(
-                dict[
-                    str,
-                    dict[
-                        str,
-                        list[
-                            dict[
-                                str,
-                                object,
-                            ]
-                        ],
-                    ],
-                ],
-                json.load(f),
+        self.bot           = bot
+        self.data_file     = "cases_data.json"
+        self.database_file = "cases.db"
+        self.config_file   = "cases_config.json"
+        self.config_store  = StateStore(Path(self.config_file), lambda: self.config, indent = 4)
+        self.cases         = {}
+        self.next_case_id  = 1
+        self.index         = CaseIndex()
+        self.stats         = CaseStats()
+        self.config        = self.load_config()
+        self.backend       = self._create_backend()
+        self.outbox        = CaseLogOutbox(self, Path("case_log_outbox.json"))
+        self.archive       = CaseArchive(Path("cases_archive"))
+        self.rejected      = {}
+        self._archive_task = None
+        self._archive_lock = asyncio.Lock()
+        self._reject_task  = None
+
+    async def open(self) -> None:
+        if isinstance(self.backend, SqliteCasesBackend):
+            _ = await migrate_json_to_sqlite(Path(self.data_file), self.backend)
+
+        await self.archive.load()
+
+        data = await self.backend.load()
+        if migrate_cases(data):
+            await self.backend.save_all(data)
+            await asyncio.to_thread(retire_legacy_files)
+        if self._adopt(data):
+            await self._save_rejected()
+
+        self.outbox.load()
+        self.outbox.start()
+
+        if self.config.get("archive_after_days"):
+            self._archive_task = asyncio.create_task(
+                self._run_archival(),
+                name = "case-archival",
             )
 
-        if not notes_data:
-            with contextlib.suppress(OSError):
-                Path(notes_file).unlink()
-            return
-
-        existing_ids : set[int] = {c["case_id"] for c in self.data["cases"]}
-
-        def _next_id() -> int:
-            nid = self.data["next_case_id"]
-            while nid in existing_ids:
-                nid += 1
-            existing_ids.add(nid)
-            self.data["next_case_id"] = nid + 1
-            return nid
-
-        now_iso = datetime.now(UTC).isoformat()
-
-        user_notes : dict[
-            str,
-            list[
-                dict[
-                    str,
-                    object,
-                ]
-            ],
-        ] = notes_data.get(
-            "user_notes",
-            {},
+    async def close(self) -> None:
+        if self._archive_task is not None:
+            _ = self._archive_task.cancel()
+            with contextlib.suppress(asyncio.CancelledError):
+                await self._archive_task
+            self._archive_task = None
+        await self.outbox.close()
+        await self.backend.close()
+
+    async def _run_archival(self) -> None:
+        while True:
+            try:
+                _ = await self.archive_old_cases()
+            except Exception:
+                log.exception("Failed to archive old cases")
+            await asyncio.sleep(ARCHIVE_INTERVAL)
+
+    async def archive_old_cases(self) -> int:
+        days = self.config.get("archive_after_days")
+        if not days:
+            return 0
+
+        async with self._archive_lock:
+            self._refresh()
+
+            # Only whole months are archived so every segment covers one month.
+            cutoff   = datetime.now(UTC) - timedelta(days = days)
+            boundary = to_epoch(cutoff.replace(day = 1, hour = 0, minute = 0, second = 0, microsecond = 0))
+            eligible = [
+                copy.copy(case) for case in self.cases.values()
+                if case.pending_visibility is None
+                and case.epoch < boundary
+            ]
+            if not eligible:
+                return 0
+
+            segments = await self.archive.add_segments(eligible)
+
+            # Cases changed while the segments were written stay hot and
+            # shadow their archived copy, deleted ones are tombstoned.
+            for case in eligible:
+                current = self.cases.get(case.case_id)
+                if current is None:
+                    await self.archive.mark_deleted(case.case_id)
+                elif current == case:
+                    del self.cases[case.case_id]
+                    self.index.remove(case)
+            await self.backend.save_all(self.snapshot())
+
+        log.info("Archived %s cases into %s segments", len(eligible), len(segments))
+        return len(eligible)
+
+    async def _get_record(self, case_id : int) -> CaseRecord | None:
+        self._refresh()
+        record = self.cases.get(case_id)
+        if record is None:
+            return await self.archive.get_case(case_id)
+        return record
+
+    async def _get_mutable(self, case_id : int) -> CaseRecord | None:
+        record = await self._get_record(case_id)
+        if record is None or case_id in self.cases:
+            return record
+
+        # Archived segments are read-only, so a changed case moves back into
+        # the hot store and shadows its archived copy.
+        promoted = copy.copy(record)
+        self.cases[case_id] = promoted
+        self.index.add(promoted)
+        await self.backend.insert_cases([promoted.to_data()], self.next_case_id)
+        return promoted
+
+    def _adopt(self, data : CasesDataFile) -> bool:
+        cases    : dict[int, CaseRecord] = {}
+        rejected = False
+        for case in data["cases"]:
+            try:
+                record = CaseRecord.from_data(case)
+            except (KeyError, TypeError, ValueError):
+                # One malformed legacy row must not stop the bot from starting;
+                # it is set aside in the rejected file instead.
+                log.exception("Skipping unreadable case %s", case.get("case_id"))
+                self.rejected[str(case.get("case_id"))] = case
+                rejected = True
+                continue
+            cases[record.case_id] = record
+
+        self.cases        = cases
+        self.next_case_id = max(
+            data["next_case_id"],
+            max(self.cases, default = 0) + 1,
+            *(int(case_id) + 1 for case_id in self.rejected if case_id.isdigit()),
         )
-        for user_id_str, notes in user_notes.items():
-            for note in notes:
-                new_note_entry : CaseData = {
-                    "case_id"            : _next_id(),
-                    "type"               : CaseType.NOTE.value,
-                    "guild_id"           : int(
-                        cast(
-                            int,
-                            note.get(
-                                "guild_id",
-                                0,
-                            ),
-                        ),
-                    ),
-                    "moderator_id"       : int(
-                        cast(
-                            int,
-                            note.get(
-                                "author_id",
-                                0,
-                            ),
-                        ),
-                    ),
-                    "moderator_name"     : str(
-                        note.get(
-                            "author_name",
-                            "Unknown",
-                        ),
-                    ),
-                    "target_user_id"     : int(user_id_str),
-                    "target_user_name"   : None,
-                    "reason"             : None,
-                    "content"            : cast(
-                        str | None,
-                        note.get("content"),
-                    ),
-                    "duration"           : None,
-                    "related_case_id"    : None,
-                    "visibility_level"   : str(note.get("classification") or "moderators"),
-                    "pending_visibility" : cast(
-                        str | None,
-                        note.get("classification_pending"),
-                    ),
-                    "created_at"         : cast(
-                        str,
-                        note.get("created_at") or now_iso,
-                    ),
-                    "edited_at"          : cast(
-                        str | None,
-                        note.get("edited_at"),
-                    ),
-                    "metadata"           : {},
-                }
-                self.data["cases"].append(new_note_entry)
-
-        case_notes : dict[
-            str,
-            list[
-                dict[
-                    str,
-                    object,
-                ],
-            ],
-        ] = notes_data.get("case_notes", {})
-        for case_id_str, notes in case_notes.items():
-            for note in notes:
-                new_note : CaseData = {
-                    "case_id"            : _next_id(),
-                    "type"               : CaseType.NOTE.value,
-                    "guild_id"           : int(
-                        cast(
-                            int,
-                            note.get(
-                                "guild_id",
-                                0,
-                            ),
-                        ),
-                    ),
-                    "moderator_id"       : int(
-                        cast(
-                            int,
-                            note.get(
-                                "author_id",
-                                0),
-                        ),
-                    ),
-                    "moderator_name"     : str(
-                        note.get(
-                            "author_name",
-                            "Unknown",
-                        ),
-                    ),
-                    "target_user_id"     : None,
-                    "target_user_name"   : None,
-                    "reason"             : None,
-                    "content"            : cast(
-                        str | None,
-                        note.get("content"),
-                    ),
-                    "duration"           : None,
-                    "related_case_id"    : int(case_id_str),
-                    "visibility_level"   : str(note.get("classification") or "moderators"),
-                    "pending_visibility" : cast(
-                        str | None,
-                        note.get("classification_pending"),
-                    ),
-                    "created_at"         : cast(
-                        str,
-                        note.get("created_at") or now_iso,
-                    ),
-                    "edited_at"          : cast(
-                        str | None,
-                        note.get("edited_at"),
-                    ),
-                    "metadata"           : {},
-                }
-                self.data["cases"].append(new_note)
-
-        self.save_data()
-        with contextlib.suppress(OSError):
-            Path(notes_file).unlink()
+        self.backend.bind(self.cases)
+        self.index.rebuild(self.cases.values())
+        self.stats.rebuild(self.cases.values())
+        self.archive.extend_stats(self.stats)
+        return rejected
+
+    def _write_rejected(self, rejected : dict[str, CaseData]) -> None:
+        path = Path(REJECTED_CASES_FILE)
+        if path.exists():
+            with contextlib.suppress(OSError, json.JSONDecodeError), path.open() as f:
+                rejected = {**json.load(f), **rejected}
+        _ = write_json_atomic(path, rejected)
+
+    async def _save_rejected(self) -> None:
+        await asyncio.to_thread(self._write_rejected, dict(self.rejected))
+
+    def _refresh(self) -> None:
+        data = self.backend.refresh()
+        if data is not None and self._adopt(data):
+            self._reject_task = asyncio.create_task(self._save_rejected(), name = "cases-save-rejected")
+
+    def snapshot(self) -> CasesDataFile:
+        return {
+            "schema_version" : CASES_SCHEMA_VERSION,
+            "cases"          : [record.to_data() for record in self.cases.values()],
+            "next_case_id"   : self.next_case_id,
+        }
+
+    def _create_backend(self) -> CasesBackend:
+        backend = self.config.get("storage_backend")
+        if backend == "sqlite":
+            return SqliteCasesBackend(Path(self.database_file))
+        if backend == "journal":
+            return JournaledCasesBackend(Path(self.data_file))
+        return JsonCasesBackend(Path(self.data_file))
 
     def load_config(self) -> CasesConfig:
-        if Path(self.config_file).exists():
-            with contextlib.suppress(json.JSONDecodeError), Path(self.config_file).open() as f:
-                return cast(
-                    CasesConfig,
-                    json.load(f),
-                )
+        with contextlib.suppress(json.JSONDecodeError):
+            data = self.config_store.read()
+            if data is not None:
+                return cast(CasesConfig, data)
         return {"log_channel_id" : None}
 
-    def save_data(self) -> None:
-        with Path(self.data_file).open("w") as f:
-            json.dump(self.data, f, indent = 4)
-
     def save_config(self) -> None:
-        with Path(self.config_file).open("w") as f:
-            json.dump(self.config, f, indent=4)
+        self.config_store.mark_dirty()
 
     def get_next_case_id(self) -> int:
-        case_id                    = self.data["next_case_id"]
-        self.data["next_case_id"] += 1
-        self.save_data()
+        case_id            = self.next_case_id
+        self.next_case_id += 1
         return case_id
 
     async def log_case(
@@ -375,12 +321,7 @@ class CasesManager:
             "metadata"           : metadata or {},
         }
 
-        self.data["cases"].append(case_data)
-        self.save_data()
-
-        if self.config.get("log_channel_id"):
-            await self._send_to_log_channel(guild, case_data)
-
+        await self.add_cases([case_data], post = True)
         return case_id
 
     async def log_cases(
@@ -401,12 +342,12 @@ class CasesManager:
 
         for index, entry in enumerate(entries, start = 1):
             entry_metadata: dict[str, object] = dict(metadata or {})
+            entry_metadata.update(cast(dict[str, object], entry.get("metadata") or {}))
             entry_metadata["mass_total"]  = total
             entry_metadata["mass_index"]  = index
             entry_metadata["mass_action"] = True
 
-            case_id = self.data["next_case_id"]
-            self.data["next_case_id"] += 1
+            case_id = self.get_next_case_id()
 
             target_user = cast(discord.User | discord.Member | None, entry.get("target_user"))
 
@@ -432,18 +373,30 @@ class CasesManager:
             pending_cases.append(case_data)
             case_ids.append(case_id)
 
-        self.data["cases"].extend(pending_cases)
-        self.save_data()
-
-        if self.config.get("log_channel_id"):
-            for case_data in pending_cases:
-                await self._send_to_log_channel(
-                    guild,
-                    case_data,
-                )
-
+        await self.add_cases(pending_cases, post = True)
         return case_ids
 
+    async def add_cases(
+        self,
+        cases : Sequence[CaseData],
+        *,
+        post  : bool = False,
+    ) -> None:
+        # Build every record up front so a bad row cannot leave memory
+        # half-updated relative to the backend.
+        records = [CaseRecord.from_data(case_data) for case_data in cases]
+        for record in records:
+            self.cases[record.case_id] = record
+            self.index.add(record)
+            self.stats.add(record)
+
+        # The outbox entry is written ahead of the case: a crash in between
+        # leaves an id the outbox drops as missing, never a stored case that
+        # is not posted.
+        if post and self.config.get("log_channel_id"):
+            await self.outbox.enqueue([record.case_id for record in records])
+        await self.backend.insert_cases(cases, self.next_case_id)
+
     async def add_note(
         self,
         guild            : discord.Guild,
@@ -491,22 +444,11 @@ class CasesManager:
             visibility_level = visibility_level,
         )
 
-    async def _send_to_log_channel(
+    async def build_log_embed(
         self,
         guild     : discord.Guild,
         case_data : CaseData,
-    ) -> None:
-        channel_id = self.config.get("log_channel_id")
-        if not channel_id:
-            return
-
-        log_channel = guild.get_channel(channel_id)
-        if not isinstance(
-            log_channel,
-            discord.TextChannel | discord.Thread,
-        ):
-            return
-
+    ) -> discord.Embed:
         case_type = case_data["type"]
 
         color_map: dict[str, discord.Color] = {
@@ -567,16 +509,14 @@ class CasesManager:
             )
 
         if case_data["target_user_id"]:
-            user_added = False
-            with contextlib.suppress(discord.NotFound, discord.HTTPException):
-                user = await self.bot.fetch_user(case_data["target_user_id"])
+            user = await user_resolver(self.bot).resolve(case_data["target_user_id"])
+            if user:
                 _ = embed.add_field(
                     name   = "User",
                     value  = f"{user.mention} ({user.id})",
                     inline = True,
                 )
-                user_added = True
-            if not user_added:
+            else:
                 _ = embed.add_field(
                     name   = "User",
                     value  = f"{case_data['target_user_name']} ({case_data['target_user_id']})",
@@ -687,115 +627,144 @@ class CasesManager:
             )
             _ = embed.set_image(url = proof_url)
 
-        with contextlib.suppress(discord.Forbidden):
-            _ = await log_channel.send(embed = embed)
+        return embed
 
-    def get_case_by_id(
+    async def get_case_by_id(
         self,
         case_id : int,
     ) -> CaseData | None:
-        self.data = self.load_data()
-        for case in self.data["cases"]:
-            if case["case_id"] == case_id:
-                return case
-        return None
+        record = await self._get_record(case_id)
+        return record.to_data() if record is not None else None
 
     def get_all_pending_classifications(self) -> list[CaseData]:
-        self.data = self.load_data()
+        self._refresh()
         return [
-            c for c in self.data["cases"]
-            if c.get("pending_visibility") is not None
+            c.to_data() for c in self.cases.values()
+            if c.pending_visibility is not None
         ]
 
-    def edit_case(
+    async def edit_case(
         self,
         case_id : int,
         content : str,
     ) -> bool:
-        case = self.get_case_by_id(case_id)
+        case = await self._get_mutable(case_id)
         if not case:
             return False
-        case["content"]   = content
-        case["edited_at"] = datetime.now(UTC).isoformat()
-        self.save_data()
+        case.content   = content
+        case.edited_at = to_micros(datetime.now(UTC))
+        self.index.update_text(case)
+        await self.backend.update_case(case.to_data())
         return True
 
-    def delete_case(
+    async def delete_case(
         self,
         case_id : int,
     ) -> bool:
-        cases : list[CaseData] = self.data["cases"]
-        for i, case in enumerate(cases):
-            if case["case_id"] == case_id:
-                _ = cases.pop(i)
-                self.save_data()
-                return True
-        return False
-
-    def set_visibility(
+        self._refresh()
+        archived = await self.archive.get_case(case_id)
+        case     = self.cases.pop(case_id, None) or archived
+        if case is None:
+            return False
+        self.index.remove(case)
+        self.stats.remove(case)
+        if archived is not None:
+            await self.archive.mark_deleted(case_id)
+        await self.backend.delete_case(case_id)
+        return True
+
+    async def set_related(
+        self,
+        case_id         : int,
+        related_case_id : int | None,
+    ) -> bool:
+        case = await self._get_mutable(case_id)
+        if not case:
+            return False
+        self.index.remove(case)
+        case.related_case_id = related_case_id
+        self.index.add(case)
+        await self.backend.update_case(case.to_data())
+        return True
+
+    async def set_visibility(
         self,
         case_id    : int,
         visibility : str,
     ) -> bool:
-        case = self.get_case_by_id(case_id)
+        case = await self._get_mutable(case_id)
         if not case:
             return False
-        case["visibility_level"]   = visibility
-        case["pending_visibility"] = None
-        self.save_data()
+        case.visibility_level   = Visibility(visibility)
+        case.pending_visibility = None
+        await self.backend.update_case(case.to_data())
         return True
 
-    def request_visibility(
+    async def request_visibility(
         self,
         case_id    : int,
         visibility : str,
     ) -> bool:
-        case = self.get_case_by_id(case_id)
+        case = await self._get_mutable(case_id)
         if not case:
             return False
-        case["pending_visibility"] = visibility
-        self.save_data()
+        case.pending_visibility = Visibility(visibility)
+        await self.backend.update_case(case.to_data())
         return True
 
-    def approve_visibility(
+    async def approve_visibility(
         self,
         case_id : int,
     ) -> bool:
-        case    = self.get_case_by_id(case_id)
-        pending = case.get("pending_visibility") if case else None
+        case    = await self._get_mutable(case_id)
+        pending = case.pending_visibility if case else None
         if not case or pending is None:
             return False
 
-        case["visibility_level"]   = pending
-        case["pending_visibility"] = None
-        self.save_data()
+        case.visibility_level   = pending
+        case.pending_visibility = None
+        await self.backend.update_case(case.to_data())
         return True
 
-    def deny_visibility(
+    async def deny_visibility(
         self,
         case_id : int,
     ) -> bool:
-        case = self.get_case_by_id(case_id)
-        if not case or not case.get("pending_visibility"):
+        case = await self._get_mutable(case_id)
+        if not case or case.pending_visibility is None:
             return False
-        case["pending_visibility"] = None
-        self.save_data()
+        case.pending_visibility = None
+        await self.backend.update_case(case.to_data())
         return True
 
-    def get_related_notes(
+    async def get_related_notes(
         self,
         case_id  : int,
         guild_id : int,
     ) -> list[CaseData]:
-        self.data = self.load_data()
-        return [
-            c for c in self.data["cases"]
-            if c.get("related_case_id") == case_id
-            and c["guild_id"]           == guild_id
-            and c["type"]               == CaseType.NOTE.value
+        self._refresh()
+        related = self.index.guild(guild_id).by_related.get(case_id, [])
+        notes   = [
+            c for c in (self.cases[i] for i in related)
+            if c.type is CaseType.NOTE
         ]
+        if self.archive.segments:
+            notes = sorted(
+                notes + await self.archive.related_notes(case_id, guild_id, self.cases),
+                key = lambda c : c.case_id,
+            )
+        return [note.to_data() for note in notes]
 
-    def get_cases(
+    def get_stats(
+        self,
+        guild_id : int,
+        since    : datetime | None = None,
+    ) -> CaseStatsSummary:
+        self._refresh()
+        since_day = int(to_epoch(since) // SECONDS_PER_DAY) if since is not None else None
+        return self.stats.guild(guild_id).summary(since_day)
+
+    async def get_cases(
         self,
         guild_id      : int,
         user_id       : int      | None = None,
@@ -807,38 +776,144 @@ class CasesManager:
         *,
         include_notes : bool            = True,
     ) -> list[CaseData]:
-        self.data = self.load_data()
-
-        cases : list[CaseData] = [c for c in self.data["cases"] if c["guild_id"] == guild_id]
-
-        if not include_notes:
-            cases = [c for c in cases if c["type"] != CaseType.NOTE.value]
-
-        if user_id is not None:
-            cases = [c for c in cases if c.get("target_user_id") == user_id]
-
-        if moderator_id is not None:
-            cases = [c for c in cases if c["moderator_id"] == moderator_id]
+        return await self.iter_cases(
+            guild_id      = guild_id,
+            user_id       = user_id,
+            moderator_id  = moderator_id,
+            case_type     = case_type,
+            contains      = contains,
+            after         = after,
+            before        = before,
+            include_notes = include_notes,
+        )
 
-        if case_type is not None:
-            cases = [c for c in cases if c["type"] == case_type]
+    async def iter_cases(
+        self,
+        guild_id      : int,
+        user_id       : int                        | None = None,
+        moderator_id  : int                        | None = None,
+        case_type     : str                        | None = None,
+        contains      : str                        | None = None,
+        after         : datetime                   | None = None,
+        before        : datetime                   | None = None,
+        *,
+        include_notes : bool                              = True,
+        after_case_id : int                        | None = None,
+        ascending     : bool                              = False,
+        limit         : int                        | None = None,
+        predicate     : Callable[[CaseData], bool] | None = None,
+    ) -> list[CaseData]:
+        cases : list[CaseData] = []
+        async for record in self._walk_cases(
+            guild_id,
+            user_id,
+            moderator_id,
+            case_type,
+            contains,
+            after,
+            before,
+            include_notes = include_notes,
+            after_case_id = after_case_id,
+            ascending     = ascending,
+        ):
+            case = record.to_data()
+            if predicate is not None and not predicate(case):
+                continue
+            cases.append(case)
+            if limit is not None and len(cases) >= limit:
+                break
 
-        if contains is not None:
-            query : str = contains.lower()
-            cases = [
-                c for c in cases
-                if query in (c.get("reason" ) or "").lower()
-                or query in (c.get("content") or "").lower()
-            ]
+        return cases
 
-        if after is not None:
-            cases = [c for c in cases if datetime.fromisoformat(c["created_at"]) > after]
+    async def count_cases(
+        self,
+        guild_id      : int,
+        user_id       : int      | None = None,
+        moderator_id  : int      | None = None,
+        case_type     : str      | None = None,
+        contains      : str      | None = None,
+        after         : datetime | None = None,
+        before        : datetime | None = None,
+        *,
+        include_notes : bool            = True,
+    ) -> int:
+        total = 0
+        async for _ in self._walk_cases(
+            guild_id,
+            user_id,
+            moderator_id,
+            case_type,
+            contains,
+            after,
+            before,
+            include_notes = include_notes,
+        ):
+            total += 1
+        return total
 
-        if before is not None:
-            cases = [c for c in cases if datetime.fromisoformat(c["created_at"]) < before]
+    async def _walk_cases(
+        self,
+        guild_id      : int,
+        user_id       : int      | None,
+        moderator_id  : int      | None,
+        case_type     : str      | None,
+        contains      : str      | None,
+        after         : datetime | None,
+        before        : datetime | None,
+        *,
+        include_notes : bool,
+        after_case_id : int      | None = None,
+        ascending     : bool            = False,
+    ) -> AsyncIterator[CaseRecord]:
+        self._refresh()
+
+        def source(
+            index : CaseIndex,
+            store : dict[int, CaseRecord],
+        ) -> Iterator[tuple[int, CaseRecord]]:
+            case_ids = index.guild(guild_id).iter_ids(
+                user_id       = user_id,
+                moderator_id  = moderator_id,
+                case_type     = case_type,
+                contains      = contains,
+                after         = after,
+                before        = before,
+                include_notes = include_notes,
+                after_case_id = after_case_id,
+                ascending     = ascending,
+            )
+            return ((case_id, store[case_id]) for case_id in case_ids if case_id not in self.archive.deleted)
+
+        async def hot() -> Iterator[tuple[int, CaseRecord]]:
+            return source(self.index, self.cases)
+
+        async def archived(info : SegmentInfo) -> Iterator[tuple[int, CaseRecord]]:
+            # Cases promoted back into the hot store shadow their archived
+            # copy, even when the edited copy no longer matches the query.
+            segment = await self.archive.segment(info)
+            return (
+                (case_id, record) for case_id, record in source(segment.index, segment.cases)
+                if case_id not in self.cases
+            )
 
-        cases.sort(
-            key     = lambda x : int(x["case_id"]),
-            reverse = True,
+        # Archived segments are only opened once the walk reaches their range.
+        # Promoted cases can sit anywhere in the hot store, so an ascending
+        # walk opens it straight away.
+        candidates = self.archive.candidates(guild_id, user_id, after, before, after_case_id, ascending = ascending)
+        sources    : list[tuple[int, SegmentSource]] = [(0 if ascending else self.next_case_id, hot)]
+        sources.extend(
+            (info["min_case_id"] if ascending else info["max_case_id"], partial(archived, info))
+            for info in reversed(candidates)
         )
-        return cases
+
+        query : str | None = None
+        if contains is not None and not tokenize(contains):
+            query = contains.lower()
+
+        async for _, record in merge_cases(sources, ascending = ascending):
+            if query is not None and not (
+                query in (record.reason  or "").lower()
+                or query in (record.content or "").lower()
+            ):
+                continue
+            yield record
@@ -0,0 +1,227 @@
+from __future__ import annotations
+
+import asyncio
+import contextlib
+import logging
+import time
+from dataclasses import dataclass, field
+from typing import TYPE_CHECKING, Generic, TypeVar
+
+import discord
+
+if TYPE_CHECKING:
+    from collections.abc import Awaitable, Callable, Iterator, Sequence
+
+log = logging.getLogger("Utility Bot")
+
+# ⸻⸻⸻⸻⸻⸻⸻⸻⸻⸻⸻⸻⸻⸻⸻⸻⸻⸻⸻
+# Mass Moderation Executor
+# ⸻⸻⸻⸻⸻⸻⸻⸻⸻⸻⸻⸻⸻⸻⸻⸻⸻⸻⸻
+
+ItemT = TypeVar("ItemT")
+
+MASS_ACTION_CONCURRENCY : int   = 4
+MASS_ACTION_RETRIES     : int   = 2
+MASS_ACTION_BACKOFF     : float = 1.0
+MASS_PROGRESS_INTERVAL  : float = 1.5
+
+RATE_LIMITED_STATUS : int = 429
+
+MASS_STOPPED_MESSAGE : str = "Skipped: mass run stopped due to rate limit"
+
+def retry_after(exc : discord.HTTPException | discord.RateLimited) -> float | None:
+    if isinstance(exc, discord.RateLimited):
+        return exc.retry_after
+    if exc.status != RATE_LIMITED_STATUS:
+        return None
+    header = exc.response.headers.get("Retry-After")
+    try:
+        return float(header) if header is not None else MASS_ACTION_BACKOFF
+    except ValueError:
+        return MASS_ACTION_BACKOFF
+
+class AdaptiveLimiter:
+    ceiling    : int
+    limit      : int
+    active     : int
+    _streak    : int
+    _condition : asyncio.Condition
+
+    def __init__(self, ceiling : int) -> None:
+        self.ceiling    = ceiling
+        self.limit      = ceiling
+        self.active     = 0
+        self._streak    = 0
+        self._condition = asyncio.Condition()
+
+    async def acquire(self) -> None:
+        async with self._condition:
+            _ = await self._condition.wait_for(lambda: self.active < self.limit)
+            self.active += 1
+
+    async def release(self, *, throttled : bool) -> None:
+        async with self._condition:
+            self.active -= 1
+            if throttled:
+                # Halve on a 429 and grow back one slot per full window of
+                # clean completions, so the run settles just under the bucket.
+                self.limit   = max(1, self.limit // 2)
+                self._streak = 0
+            elif self.limit < self.ceiling:
+                self._streak += 1
+                if self._streak >= self.limit:
+                    self.limit  += 1
+                    self._streak = 0
+            self._condition.notify_all()
+
+@dataclass(slots = True)
+class MassRunReport(Generic[ItemT]):
+    results : list[tuple[ItemT, bool, str]] = field(default_factory = list)
+    stopped : str | None                    = None
+
+class MassActionExecutor(Generic[ItemT]):
+    run         : Callable[[ItemT], Awaitable[tuple[bool, str]]]
+    precheck    : Callable[[ItemT], tuple[bool, str]] | None
+    admit       : Callable[[ItemT], tuple[bool, str]] | None
+    on_progress : Callable[[int, int], Awaitable[None]] | None
+    limiter     : AdaptiveLimiter
+    _done       : int
+    _reported   : float
+    _report     : asyncio.Lock
+
+    def __init__(
+        self,
+        run         : Callable[[ItemT], Awaitable[tuple[bool, str]]],
+        *,
+        precheck    : Callable[[ItemT], tuple[bool, str]] | None   = None,
+        admit       : Callable[[ItemT], tuple[bool, str]] | None   = None,
+        on_progress : Callable[[int, int], Awaitable[None]] | None = None,
+        concurrency : int                                          = MASS_ACTION_CONCURRENCY,
+    ) -> None:
+        self.run         = run
+        self.precheck    = precheck
+        self.admit       = admit
+        self.on_progress = on_progress
+        self.limiter     = AdaptiveLimiter(concurrency)
+        self._done       = 0
+        self._reported   = 0.0
+        self._report     = asyncio.Lock()
+
+    def _admitted(
+        self,
+        items           : Sequence[ItemT],
+        outcomes        : list[tuple[bool, str] | None],
+        report          : MassRunReport[ItemT],
+        stopped_message : str,
+    ) -> Iterator[int]:
+        # Prechecks and admission run in order on the calling task, so a
+        # tripped rate limit stops the run at the same member as a sequential
+        # loop would.
+        for index, item in enumerate(items):
+            if self.precheck is not None:
+                can_run, message = self.precheck(item)
+                if not can_run:
+                    outcomes[index] = (False, message)
+                    self._done     += 1
+                    continue
+
+            if self.admit is not None:
+                can_proceed, message = self.admit(item)
+                if not can_proceed:
+                    report.stopped  = message
+                    outcomes[index] = (False, f"Rate limited: {message}")
+                    for skipped in range(index + 1, len(items)):
+                        outcomes[skipped] = (False, stopped_message)
+                    return
+
+            yield index
+
+    def _finish(
+        self,
+        items    : Sequence[ItemT],
+        outcomes : list[tuple[bool, str] | None],
+        report   : MassRunReport[ItemT],
+    ) -> MassRunReport[ItemT]:
+        for item, outcome in zip(items, outcomes, strict = True):
+            ok, message = outcome or (False, "Action did not complete")
+            report.results.append((item, ok, message))
+        return report
+
+    async def execute(
+        self,
+        items           : Sequence[ItemT],
+        *,
+        stopped_message : str = MASS_STOPPED_MESSAGE,
+    ) -> MassRunReport[ItemT]:
+        outcomes : list[tuple[bool, str] | None] = [None] * len(items)
+        pending  : set[asyncio.Task[None]]       = set()
+        report   : MassRunReport[ItemT]          = MassRunReport()
+
+        async def run_one(index : int, item : ItemT) -> None:
+            try:
+                outcomes[index] = await self._attempt(item)
+            finally:
+                self._done += 1
+                await self._progress(len(items))
+
+        for index in self._admitted(items, outcomes, report, stopped_message):
+            await self.limiter.acquire()
+            task = asyncio.create_task(run_one(index, items[index]))
+            pending.add(task)
+            task.add_done_callback(pending.discard)
+
+        if pending:
+            _ = await asyncio.wait(pending)
+
+        return self._finish(items, outcomes, report)
+
+    async def execute_batch(
+        self,
+        items           : Sequence[ItemT],
+        run_batch       : Callable[[list[ItemT]], Awaitable[list[tuple[bool, str]]]],
+        *,
+        stopped_message : str = MASS_STOPPED_MESSAGE,
+    ) -> MassRunReport[ItemT]:
+        outcomes : list[tuple[bool, str] | None] = [None] * len(items)
+        report   : MassRunReport[ItemT]          = MassRunReport()
+
+        admitted = list(self._admitted(items, outcomes, report, stopped_message))
+        if admitted:
+            results = await run_batch([items[index] for index in admitted])
+            for index, outcome in zip(admitted, results, strict = True):
+                outcomes[index] = outcome
+            self._done += len(admitted)
+            await self._progress(len(items))
+
+        return self._finish(items, outcomes, report)
+
+    async def _attempt(self, item : ItemT) -> tuple[bool, str]:
+        # Callbacks swallow failures of their confirmation sends, so an escaped
+        # 429 comes from the moderation call itself and a retry is safe.
+        throttled = False
+        try:
+            for attempt in range(MASS_ACTION_RETRIES + 1):
+                try:
+                    return await self.run(item)
+                except (discord.HTTPException, discord.RateLimited) as e:
+                    delay = retry_after(e)
+                    if delay is None or attempt == MASS_ACTION_RETRIES:
+                        log.warning("Mass moderation action failed: %s", e)
+                        return False, str(e)
+                    throttled = True
+                    await asyncio.sleep(delay)
+            return False, "Rate limited"
+        finally:
+            await self.limiter.release(throttled = throttled)
+
+    async def _progress(self, total : int) -> None:
+        if self.on_progress is None:
+            return
+
+        async with self._report:
+            now = time.monotonic()
+            if self._done < total and now - self._reported < MASS_PROGRESS_INTERVAL:
+                return
+            self._reported = now
+            with contextlib.suppress(discord.HTTPException):
+                await self.on_progress(self._done, total)
@@ -0,0 +1,217 @@
+from __future__ import annotations
+
+import time
+from bisect import bisect_left, insort
+from datetime import datetime
+from typing import TYPE_CHECKING, cast
+
+from discord.ext import commands
+
+from constants import QUARANTINE_ROLE_ID
+
+if TYPE_CHECKING:
+    from collections.abc import Iterator
+
+    import discord
+
+    from bot import UtilityBot
+
+# ⸻⸻⸻⸻⸻⸻⸻⸻⸻⸻⸻⸻⸻⸻⸻⸻⸻⸻⸻
+# Timeout / Quarantine Indexes
+# ⸻⸻⸻⸻⸻⸻⸻⸻⸻⸻⸻⸻⸻⸻⸻⸻⸻⸻⸻
+
+class ExpiryIndex:
+    __slots__ = ("_keys", "_members")
+
+    _keys    : list[tuple[float, int]]
+    _members : dict[int, float]
+
+    def __init__(self) -> None:
+        self._keys    = []
+        self._members = {}
+
+    def __len__(self) -> int:
+        return len(self._members)
+
+    def __contains__(self, member_id : int) -> bool:
+        return member_id in self._members
+
+    def set(self, member_id : int, stamp : float) -> None:
+        if self._members.get(member_id) == stamp:
+            return
+        self.discard(member_id)
+        self._members[member_id] = stamp
+        insort(self._keys, (stamp, member_id))
+
+    def discard(self, member_id : int) -> None:
+        stamp = self._members.pop(member_id, None)
+        if stamp is None:
+            return
+        index = bisect_left(self._keys, (stamp, member_id))
+        del self._keys[index]
+
+    def prune(self, now : float) -> None:
+        # Keys are ordered by stamp, so everything that has lapsed sits at the
+        # front and pruning only touches expired entries.
+        cut = bisect_left(self._keys, (now, -1))
+        for _stamp, member_id in self._keys[:cut]:
+            del self._members[member_id]
+        del self._keys[:cut]
+
+    def __iter__(self) -> Iterator[tuple[float, int]]:
+        return iter(list(self._keys))
+
+def _quarantined_at(entry : object) -> float:
+    if isinstance(entry, dict):
+        stamp = cast("dict[str, object]", entry).get("quarantined_at")
+        if isinstance(stamp, str):
+            try:
+                return datetime.fromisoformat(stamp).timestamp()
+            except ValueError:
+                pass
+    return time.time()
+
+def quarantine_registry(mod_data : dict[str, object]) -> dict[str, object]:
+    quarantined = mod_data.get("quarantined")
+    return cast("dict[str, object]", quarantined) if isinstance(quarantined, dict) else {}
+
+class ModerationIndex:
+    timeouts    : dict[int, ExpiryIndex]
+    quarantines : dict[int, ExpiryIndex]
+
+    def __init__(self) -> None:
+        self.timeouts    = {}
+        self.quarantines = {}
+
+    def seed(
+        self,
+        guild    : discord.Guild,
+        registry : dict[str, object],
+    ) -> None:
+        timeouts    = self.timeouts[guild.id]    = ExpiryIndex()
+        quarantines = self.quarantines[guild.id] = ExpiryIndex()
+
+        for user_id, entry in registry.items():
+            if user_id.isdigit():
+                quarantines.set(int(user_id), _quarantined_at(entry))
+
+        for member in guild.members:
+            self._track(timeouts, quarantines, member, registry)
+
+    def _track(
+        self,
+        timeouts    : ExpiryIndex,
+        quarantines : ExpiryIndex,
+        member      : discord.Member,
+        registry    : dict[str, object],
+    ) -> None:
+        until = member.timed_out_until
+        if until is not None and member.is_timed_out():
+            timeouts.set(member.id, until.timestamp())
+        else:
+            timeouts.discard(member.id)
+
+        if member.get_role(QUARANTINE_ROLE_ID) is not None:
+            if member.id not in quarantines:
+                quarantines.set(member.id, _quarantined_at(registry.get(str(member.id))))
+        elif str(member.id) not in registry:
+            quarantines.discard(member.id)
+
+    def update(
+        self,
+        member   : discord.Member,
+        registry : dict[str, object],
+    ) -> None:
+        if member.guild.id not in self.timeouts:
+            return
+        self._track(self.timeouts[member.guild.id], self.quarantines[member.guild.id], member, registry)
+
+    def remove(
+        self,
+        member   : discord.Member,
+        registry : dict[str, object],
+    ) -> None:
+        timeouts = self.timeouts.get(member.guild.id)
+        if timeouts is None:
+            return
+        timeouts.discard(member.id)
+        if str(member.id) not in registry:
+            self.quarantines[member.guild.id].discard(member.id)
+
+    def forget(self, guild_id : int) -> None:
+        _ = self.timeouts.pop(guild_id, None)
+        _ = self.quarantines.pop(guild_id, None)
+
+    def ensure(
+        self,
+        guild    : discord.Guild,
+        registry : dict[str, object],
+    ) -> None:
+        if guild.id not in self.timeouts:
+            self.seed(guild, registry)
+
+    def timed_out(
+        self,
+        guild    : discord.Guild,
+        registry : dict[str, object],
+    ) -> list[tuple[float, int]]:
+        self.ensure(guild, registry)
+        index = self.timeouts[guild.id]
+        index.prune(time.time())
+        return list(index)
+
+    def quarantined(
+        self,
+        guild    : discord.Guild,
+        registry : dict[str, object],
+    ) -> list[tuple[float, int]]:
+        self.ensure(guild, registry)
+        index = self.quarantines[guild.id]
+        # Entries released outside of a role change (e.g. a member who left
+        # being unquarantined) drop out here.
+        for _stamp, member_id in index:
+            member = guild.get_member(member_id)
+            if str(member_id) not in registry and (member is None or member.get_role(QUARANTINE_ROLE_ID) is None):
+                index.discard(member_id)
+        return list(index)
+
+MODERATION_INDEX : ModerationIndex = ModerationIndex()
+
+class ModerationIndexListener(commands.Cog):
+    def __init__(self, bot : UtilityBot) -> None:
+        self.bot = bot
+
+    @commands.Cog.listener("on_member_update")
+    async def on_member_update(
+        self,
+        before : discord.Member,
+        after  : discord.Member,
+    ) -> None:
+        if before.timed_out_until != after.timed_out_until or before.roles != after.roles:
+            MODERATION_INDEX.update(after, quarantine_registry(self.bot.mod_data))
+
+    @commands.Cog.listener("on_member_join")
+    async def on_member_join(self, member : discord.Member) -> None:
+        MODERATION_INDEX.update(member, quarantine_registry(self.bot.mod_data))
+
+    @commands.Cog.listener("on_member_remove")
+    async def on_member_remove(self, member : discord.Member) -> None:
+        MODERATION_INDEX.remove(member, quarantine_registry(self.bot.mod_data))
+
+    @commands.Cog.listener("on_guild_remove")
+    async def on_guild_remove(self, guild : discord.Guild) -> None:
+        MODERATION_INDEX.forget(guild.id)
+
+    # The member cache is rebuilt after a reconnect without member update
+    # events, so drop the index and let the next listing re-seed it.
+    @commands.Cog.listener("on_guild_available")
+    async def on_guild_available(self, guild : discord.Guild) -> None:
+        MODERATION_INDEX.forget(guild.id)
+
+    @commands.Cog.listener("on_ready")
+    async def on_ready(self) -> None:
+        for guild in self.bot.guilds:
+            MODERATION_INDEX.forget(guild.id)
+
+async def setup(bot : commands.Bot) -> None:
+    await bot.add_cog(ModerationIndexListener(cast("UtilityBot", bot)))
@@ -0,0 +1,157 @@
+from __future__ import annotations
+
+import logging
+import time
+from collections import deque
+from datetime import datetime
+from typing import TYPE_CHECKING, cast
+
+from core.state.store import KeyedStateStore
+
+if TYPE_CHECKING:
+    from collections.abc import Iterable
+    from pathlib import Path
+
+log = logging.getLogger("Utility Bot")
+
+# ⸻⸻⸻⸻⸻⸻⸻⸻⸻⸻⸻⸻⸻⸻⸻⸻⸻⸻⸻
+# Moderator Rate Limits
+# ⸻⸻⸻⸻⸻⸻⸻⸻⸻⸻⸻⸻⸻⸻⸻⸻⸻⸻⸻
+
+RATE_LIMIT_HOUR      : float = 3600.0
+RATE_LIMIT_DAY       : float = 86400.0
+RATE_LIMIT_SWEEP_GAP : float = 600.0
+
+class ModeratorActivity:
+    __slots__ = ("actions",)
+
+    actions : dict[str, deque[float]]
+
+    def __init__(self) -> None:
+        self.actions = {}
+
+    @property
+    def last_seen(self) -> float:
+        return max((stamps[-1] for stamps in self.actions.values() if stamps), default = 0.0)
+
+    def prune(self, now : float) -> None:
+        cutoff = now - RATE_LIMIT_DAY
+        for action, stamps in list(self.actions.items()):
+            while stamps and stamps[0] <= cutoff:
+                _ = stamps.popleft()
+            if not stamps:
+                del self.actions[action]
+
+    def count(
+        self,
+        action : str,
+        now    : float,
+        window : float,
+    ) -> int:
+        stamps = self.actions.get(action)
+        if not stamps:
+            return 0
+
+        # Stamps are appended in order, so walk back from the newest and stop
+        # at the first one outside the window.
+        cutoff = now - window
+        total  = 0
+        for stamp in reversed(stamps):
+            if stamp <= cutoff:
+                break
+            total += 1
+        return total
+
+    def add(
+        self,
+        action : str,
+        now    : float,
+    ) -> None:
+        self.actions.setdefault(action, deque()).append(now)
+
+    def to_data(self) -> dict[str, list[float]]:
+        return {action : list(stamps) for action, stamps in self.actions.items()}
+
+    @classmethod
+    def from_data(cls, data : dict[str, list[float]]) -> ModeratorActivity:
+        activity = cls()
+        for action, stamps in data.items():
+            activity.actions[action] = deque(sorted(float(stamp) for stamp in stamps))
+        return activity
+
+class RateLimitTracker:
+    store       : KeyedStateStore
+    _activity   : dict[int, ModeratorActivity]
+    _last_sweep : float
+
+    def __init__(self, directory : Path) -> None:
+        self.store       = KeyedStateStore(directory, self._record)
+        self._activity   = {}
+        self._last_sweep = 0.0
+
+        for user_id, data in self.store.read().items():
+            if isinstance(data, dict):
+                self._activity[user_id] = ModeratorActivity.from_data(cast("dict[str, list[float]]", data))
+
+    def _record(self, user_id : int) -> object | None:
+        activity = self._activity.get(user_id)
+        return activity.to_data() if activity is not None else None
+
+    def count(
+        self,
+        user_id : int,
+        action  : str,
+        window  : float,
+        now     : float | None = None,
+    ) -> int:
+        now = time.time() if now is None else now
+        self.maybe_sweep(now)
+        activity = self._activity.get(user_id)
+        return activity.count(action, now, window) if activity is not None else 0
+
+    def add(
+        self,
+        user_id : int,
+        actions : Iterable[str],
+        now     : float | None = None,
+    ) -> None:
+        now      = time.time() if now is None else now
+        activity = self._activity.setdefault(user_id, ModeratorActivity())
+        activity.prune(now)
+        for action in actions:
+            activity.add(action, now)
+        self.store.mark_key_dirty(user_id)
+
+    def maybe_sweep(self, now : float) -> None:
+        if now - self._last_sweep >= RATE_LIMIT_SWEEP_GAP:
+            _ = self.sweep(now)
+
+    def sweep(self, now : float | None = None) -> int:
+        now              = time.time() if now is None else now
+        self._last_sweep = now
+        dropped          = 0
+        for user_id, activity in list(self._activity.items()):
+            activity.prune(now)
+            if not activity.actions:
+                del self._activity[user_id]
+                self.store.mark_key_dirty(user_id)
+                dropped += 1
+        return dropped
+
+    def migrate(self, legacy : dict[str, dict[str, list[str]]]) -> None:
+        # The old layout kept ISO-8601 stamps under "<action>_hourly" and
+        # "<action>_daily"; the daily lists are a superset of the hourly ones.
+        for user_id, limits in legacy.items():
+            activity = ModeratorActivity()
+            for key, stamps in limits.items():
+                action, _, window = key.rpartition("_")
+                if window != "daily":
+                    continue
+                try:
+                    activity.actions[action] = deque(sorted(datetime.fromisoformat(stamp).timestamp() for stamp in stamps))
+                except (TypeError, ValueError):
+                    log.warning("Skipping malformed rate limit entry for %s", user_id)
+            activity.prune(time.time())
+            if activity.actions and user_id.isdigit():
+                self._activity[int(user_id)] = activity
+                self.store.mark_key_dirty(int(user_id))
@@ -106,6 +106,8 @@ class Ready(commands.Cog):
         for user_id, data in ACTIVE_APPLICATIONS.items():
             if data.get("log_message_id") or not data.get("channel_id") or data.get("index") is None:
                 continue
+            if data.get("reviewing") or data["index"] >= len(data["questions"]):
+                continue
             user = self.bot.get_user(user_id)
             if not user:
                 continue
@@ -0,0 +1,76 @@
+from __future__ import annotations
+
+# ⸻⸻⸻⸻⸻⸻⸻⸻⸻⸻⸻⸻⸻⸻⸻⸻⸻⸻⸻
+# Bucketed Ring Counters
+# ⸻⸻⸻⸻⸻⸻⸻⸻⸻⸻⸻⸻⸻⸻⸻⸻⸻⸻⸻
+
+class RingCounter:
+    __slots__ = ("bucket_seconds", "counts", "epoch", "total")
+
+    bucket_seconds : float
+    counts         : list[int]
+    epoch          : int
+    total          : int
+
+    def __init__(
+        self,
+        buckets        : int,
+        bucket_seconds : float,
+    ) -> None:
+        self.bucket_seconds = bucket_seconds
+        self.counts         = [0] * buckets
+        self.epoch          = 0
+        self.total          = 0
+
+    @property
+    def window(self) -> float:
+        return len(self.counts) * self.bucket_seconds
+
+    def _advance(self, now : float) -> int:
+        epoch = int(now // self.bucket_seconds)
+        size  = len(self.counts)
+        if epoch - self.epoch >= size:
+            self.counts = [0] * size
+            self.total  = 0
+        else:
+            # Each elapsed bucket is cleared exactly once, so this stays
+            # O(1) amortised however often the counter is touched.
+            for stale in range(self.epoch + 1, epoch + 1):
+                slot               = stale % size
+                self.total        -= self.counts[slot]
+                self.counts[slot]  = 0
+        self.epoch = max(self.epoch, epoch)
+        return self.epoch % size
+
+    def add(
+        self,
+        now    : float,
+        amount : int = 1,
+    ) -> int:
+        slot               = self._advance(now)
+        self.counts[slot] += amount
+        self.total        += amount
+        return self.total
+
+    def count(self, now : float) -> int:
+        _ = self._advance(now)
+        return self.total
+
+class ActionWindow:
+    __slots__ = ("daily", "hourly", "last_seen")
+
+    hourly    : RingCounter
+    daily     : RingCounter
+    last_seen : float
+
+    def __init__(self) -> None:
+        self.hourly    = RingCounter(60, 60)
+        self.daily     = RingCounter(144, 600)
+        self.last_seen = 0.0
+
+    def add(self, now : float) -> tuple[int, int]:
+        self.last_seen = now
+        return self.hourly.add(now), self.daily.add(now)
+
+    def idle(self, now : float) -> bool:
+        return now - self.last_seen >= self.daily.window
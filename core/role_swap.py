@@ -0,0 +1,113 @@
+from __future__ import annotations
+
+import asyncio
+from dataclasses import dataclass
+from typing import TYPE_CHECKING, Any
+
+if TYPE_CHECKING:
+    from collections.abc import Iterable, Sequence
+
+    import discord
+
+# ⸻⸻⸻⸻⸻⸻⸻⸻⸻⸻⸻⸻⸻⸻⸻⸻⸻⸻⸻
+# Atomic Role Swaps
+# ⸻⸻⸻⸻⸻⸻⸻⸻⸻⸻⸻⸻⸻⸻⸻⸻⸻⸻⸻
+
+ROLE_SWAP_CONCURRENCY : int = 5
+
+@dataclass(slots = True)
+class RoleSwap:
+    member  : discord.Member
+    before  : list[int]
+    after   : list[discord.Role]
+    removed : list[int]
+    added   : list[int]
+
+    @property
+    def changed(self) -> bool:
+        return bool(self.removed or self.added)
+
+    async def apply(
+        self,
+        reason : str | None = None,
+        nick   : str | None = None,
+    ) -> None:
+        fields : dict[str, Any] = {}
+        if self.changed:
+            fields["roles"] = self.after
+        if nick is not None:
+            fields["nick"] = nick
+        if fields:
+            _ = await self.member.edit(**fields, reason = reason)
+
+def _locked(role : discord.Role, top_role : discord.Role | None) -> bool:
+    # Managed roles and roles at or above the bot's top role cannot be
+    # changed, so they are carried through unchanged.
+    return role.managed or (top_role is not None and role >= top_role)
+
+def plan_role_swap(
+    member : discord.Member,
+    *,
+    remove : Iterable[discord.Role] | None = None,
+    add    : Iterable[discord.Role]        = (),
+) -> RoleSwap:
+    guild    = member.guild
+    top_role = guild.me.top_role if guild.me else None
+    adding   = list(add)
+    current  = [role for role in member.roles if role.id != guild.default_role.id]
+    dropping = (
+        {role.id for role in current}
+        if remove is None
+        else {role.id for role in remove}
+    ) - {role.id for role in adding}
+
+    after   : list[discord.Role] = []
+    removed : list[int]          = []
+    for role in current:
+        if role.id in dropping and not _locked(role, top_role):
+            removed.append(role.id)
+        else:
+            after.append(role)
+
+    kept  = {role.id for role in after}
+    added : list[int] = []
+    for role in adding:
+        if role.id not in kept:
+            after.append(role)
+            kept.add(role.id)
+            added.append(role.id)
+
+    return RoleSwap(
+        member  = member,
+        before  = [role.id for role in current],
+        after   = after,
+        removed = removed,
+        added   = added,
+    )
+
+async def swap_roles(
+    member  : discord.Member,
+    *,
+    remove  : Iterable[discord.Role] | None = None,
+    add     : Iterable[discord.Role]        = (),
+    reason  : str | None                    = None,
+    nick    : str | None                    = None,
+) -> RoleSwap:
+    swap = plan_role_swap(member, remove = remove, add = add)
+    await swap.apply(reason, nick)
+    return swap
+
+async def apply_role_swaps(
+    swaps       : Sequence[RoleSwap],
+    *,
+    reason      : str | None = None,
+    concurrency : int        = ROLE_SWAP_CONCURRENCY,
+) -> list[BaseException | None]:
+    semaphore = asyncio.Semaphore(concurrency)
+
+    async def run(swap : RoleSwap) -> None:
+        async with semaphore:
+            await swap.apply(reason)
+
+    results = await asyncio.gather(*(run(swap) for swap in swaps), return_exceptions = True)
+    return [result if isinstance(result, BaseException) else None for result in results]
@@ -14,7 +14,6 @@ import asyncio
 import json
 import logging
 import time
-from pathlib import Path
 from typing import cast
 
 from typing_extensions import override
@@ -33,7 +32,11 @@ from constants import (
     STAFF_PROPOSALS_INFO_CHANNEL_ID,
     TICKET_CHANNEL_ID,
 )
-from core.state.layout_state import load_layout_message_ids, save_layout_message_ids
+from core.state.layout_state import (
+    LAYOUT_CONFIG_STORE,
+    load_layout_message_ids,
+    save_layout_message_ids,
+)
 from core.state.partnership_state import PartnershipData, load_partnership_data
 from events.systems.applications import ApplicationComponents
 from events.systems.leave import LeaveComponents
@@ -90,7 +93,6 @@ from guild_info.staff_proposal_info import (
 
 log = logging.getLogger("Utility Bot")
 
-LAYOUT_CONFIG_PATH = Path("data/layout_config.json")
 
 DEFAULT_LAYOUT_CONFIG : dict[str, bool] = {
     "tickets"                  : True,
@@ -110,19 +112,17 @@ DEFAULT_LAYOUT_CONFIG : dict[str, bool] = {
 
 
 def load_layout_config() -> dict[str, bool]:
-    if not LAYOUT_CONFIG_PATH.exists():
-        log.warning("layout_config.json not found, writing defaults and enabling all layouts")
-        with LAYOUT_CONFIG_PATH.open("w") as f:
-            json.dump(DEFAULT_LAYOUT_CONFIG, f, indent = 4)
-        return DEFAULT_LAYOUT_CONFIG.copy()
-
     try:
-        with LAYOUT_CONFIG_PATH.open("r") as f:
-            data = json.load(f)
+        data = LAYOUT_CONFIG_STORE.read()
     except (json.JSONDecodeError, OSError):
         log.exception("Failed to read layout_config.json, enabling all layouts")
         return DEFAULT_LAYOUT_CONFIG.copy()
 
+    if data is None:
+        log.warning("layout_config.json not found, writing defaults and enabling all layouts")
+        LAYOUT_CONFIG_STORE.save(DEFAULT_LAYOUT_CONFIG.copy())
+        return DEFAULT_LAYOUT_CONFIG.copy()
+
     config = DEFAULT_LAYOUT_CONFIG.copy()
     for key in config:
         if key in data and isinstance(data[key], bool):
@@ -1,13 +1,19 @@
 import json
+import logging
 from pathlib import Path
 from typing import Any
 
+from core.state.store import KeyedStateStore, StateStore
+
+log = logging.getLogger("Utility Bot")
+
 # ⸻⸻⸻⸻⸻⸻⸻⸻⸻⸻⸻⸻⸻⸻
 # Applications Management
 # ⸻⸻⸻⸻⸻⸻⸻⸻⸻⸻⸻⸻⸻⸻
 
 APPLICATION_STATE_FILE:   Path = Path("application_state.json")
 ACTIVE_APPLICATIONS_FILE: Path = Path("active_applications.json")
+ACTIVE_APPLICATIONS_DIR:  Path = Path("data/applications")
 
 APPLICATIONS_OPEN: dict[str, bool] = {
     "mod":   True,
@@ -16,13 +22,36 @@ APPLICATIONS_OPEN: dict[str, bool] = {
 
 ACTIVE_APPLICATIONS: dict[int, dict[str, Any]] = {}
 
+def _application_record(data: dict[str, Any]) -> dict[str, Any]:
+    return {
+        "type":              data.get("type"),
+        "questions":         data.get("questions", []),
+        "answers":           data.get("answers", []),
+        "index":             data.get("index", 0),
+        "editing":           data.get("editing", False),
+        "reviewing":         data.get("reviewing", False),
+        "channel_id":        data.get("channel_id"),
+        "messages":          data.get("messages", []),
+        "review_message_id": data.get("review_message_id"),
+        "log_message_id":    data.get("log_message_id"),
+        "thread_id":         data.get("thread_id"),
+        "applicant_id":      data.get("applicant_id"),
+    }
+
+def _active_application(user_id: int) -> dict[str, Any] | None:
+    data = ACTIVE_APPLICATIONS.get(user_id)
+    return _application_record(data) if data is not None else None
+
+APPLICATION_STATE_STORE:   StateStore      = StateStore(APPLICATION_STATE_FILE, lambda: APPLICATIONS_OPEN, indent = 4)
+ACTIVE_APPLICATIONS_STORE: KeyedStateStore = KeyedStateStore(ACTIVE_APPLICATIONS_DIR, _active_application, indent = 4)
+
 def load_application_state() -> None:
     if not APPLICATION_STATE_FILE.exists():
         save_application_state()
         return
 
     try:
-        data = json.loads(APPLICATION_STATE_FILE.read_text())
+        data = APPLICATION_STATE_STORE.read()
     except Exception:
         return
 
@@ -30,52 +59,32 @@ def load_application_state() -> None:
     APPLICATIONS_OPEN["admin"] = bool(data.get("admin", True))
 
 def save_application_state() -> None:
-    _ = APPLICATION_STATE_FILE.write_text(
-        json.dumps(APPLICATIONS_OPEN, indent = 4),
-    )
-
-def load_active_applications() -> None:
-    if not ACTIVE_APPLICATIONS_FILE.exists():
-        return
+    APPLICATION_STATE_STORE.mark_dirty()
 
+def _load_legacy_applications() -> dict[int, Any]:
     try:
         raw = json.loads(ACTIVE_APPLICATIONS_FILE.read_text())
     except Exception:
-        return
+        log.exception("Failed to read legacy active applications")
+        return {}
+    return {int(user_id): data for user_id, data in raw.items()}
+
+def load_active_applications() -> None:
+    legacy = ACTIVE_APPLICATIONS_FILE.exists()
+    raw    = _load_legacy_applications() if legacy else {}
+    raw.update(ACTIVE_APPLICATIONS_STORE.read())
 
     ACTIVE_APPLICATIONS.clear()
 
     for user_id, data in raw.items():
-        ACTIVE_APPLICATIONS[int(user_id)] = {
-            "type":              data.get("type"),
-            "questions":         data.get("questions", []),
-            "answers":           data.get("answers", []),
-            "index":             data.get("index", 0),
-            "editing":           data.get("editing", False),
-            "reviewing":         data.get("reviewing", False),
-            "channel_id":        data.get("channel_id"),
-            "messages":          data.get("messages", []),
-            "review_message_id": data.get("review_message_id"),
-            "log_message_id":    data.get("log_message_id"),
-        }
-
-def save_active_applications() -> None:
-    serializable: dict[str, dict[str, Any]] = {}
-
-    for user_id, data in ACTIVE_APPLICATIONS.items():
-        serializable[str(user_id)] = {
-            "type":              data.get("type"),
-            "questions":         data.get("questions", []),
-            "answers":           data.get("answers", []),
-            "index":             data.get("index", 0),
-            "editing":           data.get("editing", False),
-            "reviewing":         data.get("reviewing", False),
-            "channel_id":        data.get("channel_id"),
-            "messages":          data.get("messages", []),
-            "review_message_id": data.get("review_message_id"),
-            "log_message_id":    data.get("log_message_id"),
-        }
-
-    _ = ACTIVE_APPLICATIONS_FILE.write_text(
-        json.dumps(serializable, indent = 4),
-    )
+        ACTIVE_APPLICATIONS[user_id] = _application_record(data)
+
+    if legacy:
+        for user_id in ACTIVE_APPLICATIONS:
+            ACTIVE_APPLICATIONS_STORE.mark_key_dirty(user_id)
+        ACTIVE_APPLICATIONS_STORE.flush_sync()
+        if not ACTIVE_APPLICATIONS_STORE.dirty:
+            _ = ACTIVE_APPLICATIONS_FILE.replace(ACTIVE_APPLICATIONS_FILE.with_name(f"{ACTIVE_APPLICATIONS_FILE.name}.migrated"))
+
+def save_active_applications(user_id: int) -> None:
+    ACTIVE_APPLICATIONS_STORE.mark_key_dirty(user_id)
@@ -1,6 +1,7 @@
-import json
 from pathlib import Path
 
+from core.state.store import StateStore
+
 # ⸻⸻⸻⸻⸻⸻⸻⸻⸻⸻⸻⸻⸻⸻
 # Blacklist Management
 # ⸻⸻⸻⸻⸻⸻⸻⸻⸻⸻⸻⸻⸻⸻
@@ -12,13 +13,15 @@ BLACKLIST: dict[str, list[int]] = {
     "tickets":      [],
 }
 
+BLACKLIST_STORE: StateStore = StateStore(BLACKLIST_FILE, lambda: BLACKLIST, indent = 4)
+
 def load_blacklist() -> None:
     if not BLACKLIST_FILE.exists():
         save_blacklist()
         return
 
     try:
-        data = json.loads(BLACKLIST_FILE.read_text())
+        data = BLACKLIST_STORE.read()
     except Exception:
         return
 
@@ -26,6 +29,4 @@ def load_blacklist() -> None:
     BLACKLIST["tickets"]      = list(map(int, data.get("tickets", [])))
 
 def save_blacklist() -> None:
-    _ = BLACKLIST_FILE.write_text(
-        json.dumps(BLACKLIST, indent = 4),
-    )
+    BLACKLIST_STORE.mark_dirty()
@@ -2,22 +2,25 @@ import json
 from pathlib import Path
 from typing import Any
 
+from core.state.store import StateStore
+
 # ⸻⸻⸻⸻⸻⸻⸻⸻⸻⸻⸻⸻⸻⸻
 # Layout Management
 # ⸻⸻⸻⸻⸻⸻⸻⸻⸻⸻⸻⸻⸻⸻
 
-LAYOUT_FILE = Path("data/layout_message_ids.json")
+LAYOUT_FILE         = Path("data/layout_message_ids.json")
+LAYOUT_STORE        = StateStore(LAYOUT_FILE)
+LAYOUT_CONFIG_FILE  = Path("data/layout_config.json")
+LAYOUT_CONFIG_STORE = StateStore(LAYOUT_CONFIG_FILE, indent = 4)
 
 def load_layout_message_ids() -> dict[str, Any]:
-    if not LAYOUT_FILE.exists():
-        return {"tickets": None, "applications": None, "leave": None}
     try:
-        with LAYOUT_FILE.open("r", encoding = "utf-8") as f:
-            return json.load(f)
+        data = LAYOUT_STORE.read()
     except json.JSONDecodeError:
+        data = None
+    if data is None:
         return {"tickets": None, "applications": None, "leave": None}
+    return data
 
 def save_layout_message_ids(layout_ids: dict[str, Any]) -> None:
-    LAYOUT_FILE.parent.mkdir(exist_ok=True, parents=True)
-    with LAYOUT_FILE.open("w", encoding = "utf-8") as f:
-        json.dump(layout_ids, f)
+    LAYOUT_STORE.save(layout_ids)
@@ -5,10 +5,13 @@ import logging
 from pathlib import Path
 from typing import Any, TypedDict, cast
 
+from core.state.store import StateStore
+
 log = logging.getLogger("Utility Bot")
 
 IMAGE_DIR: Path = Path("data/partnership_images")
 _DATA_FILE: Path = Path("data/partnerships.json")
+_STORE: StateStore = StateStore(_DATA_FILE, indent = 2)
 
 # ⸻⸻⸻⸻⸻⸻⸻⸻⸻⸻⸻⸻⸻⸻⸻⸻⸻⸻⸻
 # Partnership State Management
@@ -39,11 +42,8 @@ def _default() -> PartnershipData:
 
 
 def load_partnership_data() -> PartnershipData:
-    if not _DATA_FILE.exists():
-        return _default()
     try:
-        with Path.open(_DATA_FILE) as f:
-            raw: Any = json.load(f)
+        raw: Any = _STORE.read()
         if not isinstance(raw, dict):
             return _default()
         data = cast("dict[str, Any]", raw)
@@ -59,9 +59,4 @@ def load_partnership_data() -> PartnershipData:
 
 
 def save_partnership_data(data: PartnershipData) -> None:
-    _DATA_FILE.parent.mkdir(parents=True, exist_ok=True)
-    try:
-        with Path.open(_DATA_FILE, "w") as f:
-            json.dump(data, f, indent = 2)
-    except OSError:
-        log.exception("Failed to save partnership data")
+    _STORE.save(data)
@@ -0,0 +1,204 @@
+from __future__ import annotations
+
+import asyncio
+import json
+import logging
+from typing import TYPE_CHECKING, Any, cast
+
+from typing_extensions import override
+
+from core.case_storage import write_text_atomic
+
+if TYPE_CHECKING:
+    from collections.abc import Callable
+    from pathlib import Path
+
+log = logging.getLogger("Utility Bot")
+
+# ⸻⸻⸻⸻⸻⸻⸻⸻⸻⸻⸻⸻⸻⸻⸻⸻⸻⸻⸻
+# State Store Management
+# ⸻⸻⸻⸻⸻⸻⸻⸻⸻⸻⸻⸻⸻⸻⸻⸻⸻⸻⸻
+
+STATE_FLUSH_DELAY : float = 2.0
+
+_STORES : dict[Path, StateStore] = {}
+
+def _write_state(path : Path, payload : str) -> None:
+    path.parent.mkdir(parents = True, exist_ok = True)
+    _ = write_text_atomic(path, payload)
+
+class StateStore:
+    path      : Path
+    indent    : int | None
+    delay     : float
+    dirty     : bool
+    _snapshot : Callable[[], object] | None
+    _value    : object
+    _task     : asyncio.Task[None] | None
+    _lock     : asyncio.Lock
+
+    def __init__(
+        self,
+        path     : Path,
+        snapshot : Callable[[], object] | None = None,
+        *,
+        indent   : int | None = None,
+        delay    : float      = STATE_FLUSH_DELAY,
+    ) -> None:
+        self.path      = path
+        self.indent    = indent
+        self.delay     = delay
+        self.dirty     = False
+        self._snapshot = snapshot
+        self._value    = None
+        self._task     = None
+        self._lock     = asyncio.Lock()
+
+        _STORES[path] = self
+
+    def _current(self) -> object:
+        return self._snapshot() if self._snapshot is not None else self._value
+
+    def _encode(self) -> str:
+        return json.dumps(self._current(), indent = self.indent)
+
+    def read(self) -> Any:  # noqa: ANN401
+        if self.dirty:
+            return json.loads(self._encode())
+        if not self.path.exists():
+            return None
+        return json.loads(self.path.read_text(encoding = "utf-8"))
+
+    def save(self, value : object) -> None:
+        self._value = value
+        self.mark_dirty()
+
+    def mark_dirty(self) -> None:
+        self.dirty = True
+        if self._task is not None and not self._task.done():
+            return
+
+        try:
+            loop = asyncio.get_running_loop()
+        except RuntimeError:
+            self.flush_sync()
+            return
+
+        self._task = loop.create_task(self._flush_later(), name = f"state-flush:{self.path.name}")
+
+    async def _flush_later(self) -> None:
+        # Saves that land while a write is in flight (or a write that failed
+        # and was requeued) leave the store dirty; keep flushing until clean.
+        while self.dirty:
+            await asyncio.sleep(self.delay)
+            await self.flush()
+
+    def _take(self) -> object:
+        return self._current()
+
+    def _write(self, payload : object) -> None:
+        _write_state(self.path, json.dumps(payload, indent = self.indent))
+
+    def _requeue(self, payload : object) -> None:  # noqa: ARG002
+        self.dirty = True
+
+    async def flush(self) -> None:
+        async with self._lock:
+            if not self.dirty:
+                return
+            self.dirty = False
+            payload    = self._take()
+            # Encoding happens in the worker thread. A save racing the encode
+            # has already marked the store dirty again, so a snapshot that
+            # changed size mid-write is simply retried on the next flush.
+            try:
+                await asyncio.to_thread(self._write, payload)
+            except (OSError, RuntimeError):
+                self._requeue(payload)
+                log.exception("Failed to write state file %s", self.path)
+
+    def flush_sync(self) -> None:
+        if not self.dirty:
+            return
+        self.dirty = False
+        payload    = self._take()
+        try:
+            self._write(payload)
+        except OSError:
+            self._requeue(payload)
+            log.exception("Failed to write state file %s", self.path)
+
+    def cancel(self) -> None:
+        if self._task is not None and not self._task.done():
+            _ = self._task.cancel()
+        self._task = None
+
+class KeyedStateStore(StateStore):
+    _record     : Callable[[int], object | None]
+    _dirty_keys : set[int]
+
+    def __init__(
+        self,
+        directory : Path,
+        record    : Callable[[int], object | None],
+        *,
+        indent    : int | None = None,
+        delay     : float      = STATE_FLUSH_DELAY,
+    ) -> None:
+        super().__init__(directory, indent = indent, delay = delay)
+        self._record     = record
+        self._dirty_keys = set()
+
+    def _key_path(self, key : int) -> Path:
+        return self.path / f"{key}.json"
+
+    @override
+    def read(self) -> dict[int, Any]:
+        records : dict[int, Any] = {}
+        if self.path.is_dir():
+            for file in self.path.glob("*.json"):
+                if not file.stem.isdigit():
+                    continue
+                try:
+                    records[int(file.stem)] = json.loads(file.read_text(encoding = "utf-8"))
+                except (OSError, json.JSONDecodeError):
+                    log.exception("Failed to read state file %s", file)
+        for key in self._dirty_keys:
+            record = self._record(key)
+            if record is None:
+                _ = records.pop(key, None)
+            else:
+                records[key] = json.loads(json.dumps(record))
+        return records
+
+    def mark_key_dirty(self, key : int) -> None:
+        self._dirty_keys.add(key)
+        self.mark_dirty()
+
+    @override
+    def _take(self) -> object:
+        payload = [(key, self._record(key)) for key in sorted(self._dirty_keys)]
+        self._dirty_keys.clear()
+        return payload
+
+    @override
+    def _write(self, payload : object) -> None:
+        for key, record in cast("list[tuple[int, object | None]]", payload):
+            if record is None:
+                self._key_path(key).unlink(missing_ok = True)
+            else:
+                _write_state(self._key_path(key), json.dumps(record, indent = self.indent))
+
+    @override
+    def _requeue(self, payload : object) -> None:
+        self._dirty_keys.update(key for key, _ in cast("list[tuple[int, object | None]]", payload))
+        self.dirty = True
+
+async def flush_all() -> None:
+    for store in list(_STORES.values()):
+        await store.flush()
+
+def flush_all_sync() -> None:
+    for store in list(_STORES.values()):
+        store.cancel()
+        store.flush_sync()
@@ -1,7 +1,8 @@
-import json
 from pathlib import Path
 from typing import Any
 
+from core.state.store import StateStore
+
 ACTIVE_TICKETS: dict[int, int] = {}
 THREAD_OPENERS: dict[int, int] = {}
 TICKET_CLAIMS: dict[int, int] = {}
@@ -9,29 +10,25 @@ TICKET_TYPES: dict[int, str] = {}
 RESOLUTION_STOPPED: set[int] = set()
 RESOLUTION_STATE: dict[int, dict[str, Any]] = {}
 
-_STATE_PATH = "data/tickets.json"
+def _ticket_snapshot() -> dict[str, Any]:
+    return {
+        "active_tickets": {str(k): v for k, v in ACTIVE_TICKETS.items()},
+        "thread_openers": {str(k): v for k, v in THREAD_OPENERS.items()},
+        "ticket_claims": {str(k): v for k, v in TICKET_CLAIMS.items()},
+        "ticket_types": {str(k): v for k, v in TICKET_TYPES.items()},
+        "resolution_stopped": list(RESOLUTION_STOPPED),
+        "resolution_state": {str(k): v for k, v in RESOLUTION_STATE.items()},
+    }
+
+_STATE_STORE = StateStore(Path("data/tickets.json"), _ticket_snapshot, indent = 2)
 
 def save_ticket_state() -> None:
-    Path("data").mkdir(parents=True, exist_ok=True)
-    with Path(_STATE_PATH).open("w", encoding = "utf-8") as f:
-        json.dump(
-            {
-                "active_tickets": {str(k): v for k, v in ACTIVE_TICKETS.items()},
-                "thread_openers": {str(k): v for k, v in THREAD_OPENERS.items()},
-                "ticket_claims": {str(k): v for k, v in TICKET_CLAIMS.items()},
-                "ticket_types": {str(k): v for k, v in TICKET_TYPES.items()},
-                "resolution_stopped": list(RESOLUTION_STOPPED),
-                "resolution_state": {str(k): v for k, v in RESOLUTION_STATE.items()},
-            },
-            f,
-            indent = 2,
-        )
+    _STATE_STORE.mark_dirty()
 
 def load_ticket_state() -> None:
-    if not Path(_STATE_PATH).exists():
+    data = _STATE_STORE.read()
+    if data is None:
         return
-    with Path(_STATE_PATH).open(encoding = "utf-8") as f:
-        data = json.load(f)
     ACTIVE_TICKETS.update({int(k): int(v) for k, v in data.get("active_tickets", {}).items()})
     THREAD_OPENERS.update({int(k): int(v) for k, v in data.get("thread_openers", {}).items()})
     TICKET_CLAIMS.update({int(k): int(v) for k, v in data.get("ticket_claims", {}).items()})
@@ -0,0 +1,125 @@
+from __future__ import annotations
+
+import asyncio
+import logging
+import time
+from collections import OrderedDict
+from typing import TYPE_CHECKING
+from weakref import WeakKeyDictionary
+
+import discord
+
+if TYPE_CHECKING:
+    from collections.abc import Iterable
+
+log = logging.getLogger("Utility Bot")
+
+# ⸻⸻⸻⸻⸻⸻⸻⸻⸻⸻⸻⸻⸻⸻⸻⸻⸻⸻⸻
+# User Resolution
+# ⸻⸻⸻⸻⸻⸻⸻⸻⸻⸻⸻⸻⸻⸻⸻⸻⸻⸻⸻
+
+USER_CACHE_SIZE         : int   = 2048
+USER_CACHE_TTL          : float = 3600.0
+USER_CACHE_NEGATIVE_TTL : float = 600.0
+USER_FETCH_CONCURRENCY  : int   = 5
+
+class UserResolver:
+    client       : discord.Client
+    max_size     : int
+    ttl          : float
+    negative_ttl : float
+    _entries     : OrderedDict[int, tuple[float, discord.User | None]]
+    _inflight    : dict[int, asyncio.Future[discord.User | None]]
+    _semaphore   : asyncio.Semaphore
+
+    def __init__(
+        self,
+        client       : discord.Client,
+        max_size     : int   = USER_CACHE_SIZE,
+        ttl          : float = USER_CACHE_TTL,
+        negative_ttl : float = USER_CACHE_NEGATIVE_TTL,
+    ) -> None:
+        self.client       = client
+        self.max_size     = max_size
+        self.ttl          = ttl
+        self.negative_ttl = negative_ttl
+        self._entries     = OrderedDict()
+        self._inflight    = {}
+        self._semaphore   = asyncio.Semaphore(USER_FETCH_CONCURRENCY)
+
+    def peek(self, user_id : int) -> tuple[bool, discord.User | None]:
+        user = self.client.get_user(user_id)
+        if user is not None:
+            return True, user
+
+        entry = self._entries.get(user_id)
+        if entry is None:
+            return False, None
+
+        expires_at, cached = entry
+        if expires_at <= time.monotonic():
+            del self._entries[user_id]
+            return False, None
+
+        self._entries.move_to_end(user_id)
+        return True, cached
+
+    async def resolve(self, user_id : int) -> discord.User | None:
+        found, user = self.peek(user_id)
+        if found:
+            return user
+
+        future = self._inflight.get(user_id)
+        if future is None:
+            future = asyncio.get_running_loop().create_future()
+            self._inflight[user_id] = future
+            try:
+                future.set_result(await self._fetch(user_id))
+            finally:
+                del self._inflight[user_id]
+                if not future.done():
+                    future.set_result(None)
+            return future.result()
+
+        return await asyncio.shield(future)
+
+    async def resolve_many(self, user_ids : Iterable[int]) -> dict[int, discord.User | None]:
+        unique  = list(dict.fromkeys(user_ids))
+        results = await asyncio.gather(*(self.resolve(user_id) for user_id in unique))
+        return dict(zip(unique, results, strict = True))
+
+    def invalidate(self, user_id : int) -> None:
+        _ = self._entries.pop(user_id, None)
+
+    async def _fetch(self, user_id : int) -> discord.User | None:
+        async with self._semaphore:
+            try:
+                user = await self.client.fetch_user(user_id)
+            except discord.NotFound:
+                self._store(user_id, None, self.negative_ttl)
+                return None
+            except discord.HTTPException:
+                log.warning("Failed to fetch user %s", user_id)
+                return None
+
+        self._store(user_id, user, self.ttl)
+        return user
+
+    def _store(
+        self,
+        user_id : int,
+        user    : discord.User | None,
+        ttl     : float,
+    ) -> None:
+        self._entries[user_id] = (time.monotonic() + ttl, user)
+        self._entries.move_to_end(user_id)
+        while len(self._entries) > self.max_size:
+            _ = self._entries.popitem(last = False)
+
+_resolvers : WeakKeyDictionary[discord.Client, UserResolver] = WeakKeyDictionary()
+
+def user_resolver(client : discord.Client) -> UserResolver:
+    resolver = _resolvers.get(client)
+    if resolver is None:
+        resolver = _resolvers[client] = UserResolver(client)
+    return resolver
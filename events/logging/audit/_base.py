@@ -6,6 +6,7 @@ from discord.ext import commands, tasks
 from typing_extensions import override
 
 from constants import CHANGE_LOG_CHANNEL_ID, DIRECTORSHIP_CATEGORY_ID
+from core.audit_log import AUDIT_LOG
 
 # ⸻⸻⸻⸻⸻⸻⸻⸻⸻⸻⸻⸻⸻⸻⸻⸻⸻⸻⸻
 # Queue
@@ -79,13 +80,9 @@ class AuditCog(commands.Cog):
         action_type : discord.AuditLogAction,
         target_id   : int | None = None,
     ) -> discord.Member | None:
-        try:
-            await asyncio.sleep(0.5)
-            async for entry in guild.audit_logs(limit=10, action=action_type):
-                if (target_id is None or (entry.target is not None and entry.target.id == target_id)) and isinstance(entry.user, discord.Member):
-                    return entry.user
-        except discord.HTTPException:
-            log.exception("Error fetching audit log")
+        entry = await AUDIT_LOG.fetch(guild, action_type, target_id)
+        if entry is not None and isinstance(entry.user, discord.Member):
+            return entry.user
         return None
 
     from collections.abc import Iterable
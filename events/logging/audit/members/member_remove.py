@@ -1,4 +1,3 @@
-import asyncio
 import logging
 from datetime import UTC, datetime
 
@@ -6,6 +5,7 @@ import discord
 from discord.ext import commands
 
 from constants import COLOR_YELLOW
+from core.audit_log import AUDIT_LOG
 from events.logging.audit._base import AuditCog, AuditQueue
 
 # ⸻⸻⸻⸻⸻⸻⸻⸻⸻⸻⸻⸻⸻⸻⸻⸻⸻⸻⸻
@@ -34,21 +34,9 @@ class MemberRemoveCog(AuditCog):
         if not log_channel:
             return
 
-        executor   = None
-        was_kicked = False
-
-        try:
-            await asyncio.sleep(0.5)
-            async for entry in member.guild.audit_logs(
-                limit  = 5,
-                action = discord.AuditLogAction.kick,
-            ):
-                if entry.target is not None and entry.target.id == member.id:
-                    executor   = entry.user
-                    was_kicked = True
-                    break
-        except discord.HTTPException:
-            log.exception("Error fetching audit log")
+        entry      = await AUDIT_LOG.fetch(member.guild, discord.AuditLogAction.kick, member.id)
+        executor   = entry.user if entry is not None else None
+        was_kicked = entry is not None
 
         embed = discord.Embed(
             title     = "Member Kicked" if was_kicked else "Member Left",
@@ -1,11 +1,10 @@
-import asyncio
-import logging as log
 from datetime import UTC, datetime
 
 import discord
 from discord.ext import commands
 
 from constants import COLOR_BLURPLE, COLOR_GREEN, COLOR_RED
+from core.audit_log import AUDIT_LOG
 from events.logging.audit._base import AuditCog, AuditQueue
 
 # ⸻⸻⸻⸻⸻⸻⸻⸻⸻⸻⸻⸻⸻⸻⸻⸻⸻⸻⸻
@@ -36,25 +35,22 @@ class IntegrationsCog(AuditCog):
         action_type : discord.AuditLogAction        | None = None
         target_name : str                           | None = None
 
-        try:
-            await asyncio.sleep(0.5)
-            async for entry in guild.audit_logs(limit = 5):
-                if entry.action in [
-                    discord.AuditLogAction.integration_create,
-                    discord.AuditLogAction.integration_update,
-                    discord.AuditLogAction.integration_delete,
-                ]:
-                    executor = entry.user
-                    action_type = entry.action
-
-                    if isinstance(entry.target, discord.Integration):
-                        target_name = entry.target.name
-                    elif isinstance(entry.target, discord.Object):
-                        target_name = f"ID: {entry.target.id}"
+        entry = await AUDIT_LOG.fetch(
+            guild,
+            (
+                discord.AuditLogAction.integration_create,
+                discord.AuditLogAction.integration_update,
+                discord.AuditLogAction.integration_delete,
+            ),
+        )
+        if entry is not None:
+            executor    = entry.user
+            action_type = entry.action
 
-                    break
-        except discord.HTTPException:
-            log.exception("Error fetching integration audit log")
+            if isinstance(entry.target, discord.Integration):
+                target_name = entry.target.name
+            elif isinstance(entry.target, discord.Object):
+                target_name = f"ID: {entry.target.id}"
 
         if action_type == discord.AuditLogAction.integration_create:
             title = "Integration Added"
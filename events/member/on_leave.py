@@ -60,7 +60,7 @@ class MemberLeaveHandler(commands.Cog):
             except discord.NotFound:
                 pass
         _ = ACTIVE_APPLICATIONS.pop(member.id, None)
-        save_active_applications()
+        save_active_applications(member.id)
 
 async def setup(bot : commands.Bot) -> None:
     await bot.add_cog(MemberLeaveHandler(bot))
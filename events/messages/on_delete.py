@@ -10,6 +10,7 @@ from constants import (
     DIRECTORSHIP_CATEGORY_ID,
     MESSAGE_DELETE_LOG_CHANNEL_ID,
 )
+from core.audit_log import AUDIT_LOG
 from core.state.automod_state import AUTOMOD_DELETIONS
 from core.utils import channel_display, format_attachments
 
@@ -57,30 +58,24 @@ class MessageDeleteHandler(commands.Cog):
         if not isinstance(log_channel, discord.abc.Messageable):
             return
 
+        def in_channel(entry : discord.AuditLogEntry) -> bool:
+            extra: Any = entry.extra
+            channel = getattr(extra, "channel", None)
+            n_5 = 5
+            return (
+                getattr(channel, "id", None) == message.channel.id
+                and (discord.utils.utcnow() - entry.created_at).total_seconds() <= n_5
+            )
+
         deleter = "Unknown"
-        try:
-            async for entry in message.guild.audit_logs(
-                limit=5,
-                action=discord.AuditLogAction.message_delete,
-            ):
-                if not isinstance(entry.target, discord.User | discord.Member):
-                    continue
-                if entry.target.id != message.author.id:
-                    continue
-                extra: Any = entry.extra
-                channel = getattr(extra, "channel", None)
-                if not isinstance(channel, discord.abc.GuildChannel):
-                    continue
-                if channel.id != message.channel.id:
-                    continue
-                n_5 = 5
-                if (discord.utils.utcnow() - entry.created_at).total_seconds() > n_5:
-                    continue
-                if entry.user:
-                    deleter = f"`{entry.user}`\n`{entry.user.id}`"
-                break
-        except (discord.Forbidden, discord.HTTPException):
-            pass
+        entry   = await AUDIT_LOG.fetch(
+            message.guild,
+            discord.AuditLogAction.message_delete,
+            message.author.id,
+            predicate = in_channel,
+        )
+        if entry is not None and entry.user:
+            deleter = f"`{entry.user}`\n`{entry.user.id}`"
 
         if message.id in AUTOMOD_DELETIONS:
             deleter = "UB Auto-Moderation"
@@ -1,7 +1,6 @@
 # ruff: noqa: RUF001
 
 import contextlib
-import json
 import logging as log
 import math
 import re
@@ -30,6 +29,7 @@ from constants import (
 )
 from core.state.application_state import ACTIVE_APPLICATIONS, save_active_applications
 from core.state.automod_state import AUTOMOD_DELETIONS, AUTOMOD_STRIKES, save_automod_strikes
+from core.state.store import StateStore
 from events.systems.applications import ApplicationSubmitView
 
 MAX_STRIKES = 5
@@ -71,7 +71,8 @@ FACTOIDS = {
 
 WAPPLE_PATTERN = re.compile(rf"^({'|'.join(map(re.escape, WAPPLE_EMOJIS))}| )+$")
 
-COUNTING_STATE_PATH = Path("data/counting_state.json")
+COUNTING_STATE_PATH  = Path("data/counting_state.json")
+COUNTING_STATE_STORE = StateStore(COUNTING_STATE_PATH)
 
 _SUPER = str.maketrans("⁰¹²³⁴⁵⁶⁷⁸⁹", "0123456789")
 _SUB   = str.maketrans("₀₁₂₃₄₅₆₇₈₉", "0123456789")
@@ -190,22 +191,16 @@ def _default_state() -> CountingState:
     }
 
 def _load_state() -> CountingState:
-    if COUNTING_STATE_PATH.exists():
-        try:
-            with COUNTING_STATE_PATH.open("r", encoding = "utf-8") as f:
-                raw: dict[str, Any] = json.load(f)
-                return cast(CountingState, {**_default_state(), **raw})
-        except Exception:
-            log.exception("Could not load counting state")
+    try:
+        raw: dict[str, Any] | None = COUNTING_STATE_STORE.read()
+        if raw is not None:
+            return cast(CountingState, {**_default_state(), **raw})
+    except Exception:
+        log.exception("Could not load counting state")
     return _default_state()
 
 def _save_state(state: CountingState) -> None:
-    try:
-        COUNTING_STATE_PATH.parent.mkdir(parents=True, exist_ok=True)
-        with COUNTING_STATE_PATH.open("w", encoding = "utf-8") as f:
-            json.dump(state, f)
-    except Exception:
-        log.exception("Could not save counting state")
+    COUNTING_STATE_STORE.save(state)
 
 TEXACKERS_GUILD_ID = 846677253290983444
 
@@ -424,7 +419,7 @@ class MessageSendHandler(commands.Cog):
 
                     app["editing"] = False
                     app["reviewing"] = True
-                    save_active_applications()
+                    save_active_applications(message.author.id)
 
                     embed = discord.Embed(
                         title = "Review Your Application",
@@ -448,16 +443,15 @@ class MessageSendHandler(commands.Cog):
 
                     app["review_message_id"] = msg.id
                     app["messages"].append(msg.id)
-                    save_active_applications()
+                    save_active_applications(message.author.id)
                     return
 
                 app["answers"].append(message.content)
                 app["index"] += 1
-                save_active_applications()
+                save_active_applications(message.author.id)
 
                 if app["index"] >= len(app["questions"]):
                     app["reviewing"] = True
-                    save_active_applications()
 
                     embed = discord.Embed(
                         title = "Review Your Application",
@@ -481,12 +475,12 @@ class MessageSendHandler(commands.Cog):
 
                     app["review_message_id"] = msg.id
                     app["messages"].append(msg.id)
-                    save_active_applications()
+                    save_active_applications(message.author.id)
                     return
 
                 msg = _ = await message.channel.send(app["questions"][app["index"]])
                 app["messages"].append(msg.id)
-                save_active_applications()
+                save_active_applications(message.author.id)
                 return
 
 async def setup(bot : commands.Bot) -> None:
@@ -1,12 +1,16 @@
+import asyncio
 import contextlib
 import json
+import logging
+import time
 from collections import defaultdict
-from datetime import UTC, datetime, timedelta
+from datetime import UTC, datetime
 from pathlib import Path
 from typing import TYPE_CHECKING, Any, cast
 
 import discord
-from discord.ext import commands
+from discord.ext import commands, tasks
+from typing_extensions import override
 
 from constants import (
     BOT_OWNER_ID,
@@ -20,7 +24,14 @@ from constants import (
 if TYPE_CHECKING:
     from bot import UtilityBot
 
+from commands.moderation.primary._base import MODERATION_STORE, ModerationBase
+from core.audit_log import AUDIT_LOG, AUDIT_SECURITY_WAIT
 from core.cases import CasesManager, CaseType
+from core.ring_counter import ActionWindow, RingCounter
+from core.role_swap import plan_role_swap
+from core.state.store import StateStore
+
+log = logging.getLogger("Utility Bot")
 
 # ⸻⸻⸻⸻⸻⸻⸻⸻⸻⸻⸻⸻⸻⸻⸻⸻⸻⸻⸻
 # Anti-Nuke System
@@ -34,30 +45,69 @@ class ActionType:
     ROLE_CREATE    = "role_create"
     ROLE_UPDATE    = "role_update"
 
+BURST_THRESHOLD      : int   = 4
+BURST_BUCKETS        : int   = 10
+BURST_BUCKET_SECONDS : float = 0.1
+
+DANGEROUS_PERMISSIONS : discord.Permissions = discord.Permissions(
+    administrator   = True,
+    manage_guild    = True,
+    manage_channels = True,
+    manage_roles    = True,
+    manage_webhooks = True,
+    ban_members     = True,
+    kick_members    = True,
+)
+
+BURST_ACTIONS : frozenset[str] = frozenset({ActionType.CHANNEL_DELETE, ActionType.ROLE_DELETE})
+
 class AntiNukeSystem(commands.Cog):
     def __init__(self, bot : "UtilityBot") -> None:
         self.bot = bot
-        self.config_file        = "antinuke_config.json"
+        self.config_store       = StateStore(Path("antinuke_config.json"), indent = 4)
         self.config             = self.load_config()
         self.DIRECTORS_ROLE_ID  = DIRECTORS_ROLE_ID
         self.QUARANTINE_ROLE_ID = QUARANTINE_ROLE_ID
 
-        self.action_tracker: dict[int, dict[str, dict[str, list[datetime]]]] = defaultdict(
-            lambda: defaultdict(lambda: {"hourly": [], "daily": []}),
+        self.action_tracker: defaultdict[int, defaultdict[str, ActionWindow]] = defaultdict(
+            lambda: defaultdict(ActionWindow),
+        )
+
+        self.burst_counters : defaultdict[int, RingCounter] = defaultdict(
+            lambda: RingCounter(BURST_BUCKETS, BURST_BUCKET_SECONDS),
         )
+        self.freeze_store   = StateStore(Path("data/antinuke_freeze.json"), lambda: self.frozen_roles, indent = 4)
+        self.frozen_roles   : dict[str, dict[str, int]] = self.freeze_store.read() or {}
+        self.contained      : defaultdict[int, set[int]] = defaultdict(set)
+        self._freeze_tasks  : set[asyncio.Task[None]] = set()
+        _ = self._sweep_idle_actions.start()
+
+    @override
+    async def cog_unload(self) -> None:
+        self._sweep_idle_actions.cancel()
+        for task in self._freeze_tasks:
+            _ = task.cancel()
+
+    @tasks.loop(minutes = 10)
+    async def _sweep_idle_actions(self) -> None:
+        now = time.monotonic()
+        for user_id, windows in list(self.action_tracker.items()):
+            for action_type, window in list(windows.items()):
+                if window.idle(now):
+                    del windows[action_type]
+            if not windows:
+                del self.action_tracker[user_id]
 
     @property
     def cases_manager(self) -> CasesManager:
         return self.bot.cases_manager
 
     def load_config(self) -> dict[str, Any]:
-        if Path(self.config_file).exists():
-            try:
-                with Path(self.config_file).open() as f:
-                    return json.load(f)
-            except json.JSONDecodeError:
-                return self.get_default_config()
-        return self.get_default_config()
+        try:
+            config = self.config_store.read()
+        except json.JSONDecodeError:
+            return self.get_default_config()
+        return config if config is not None else self.get_default_config()
 
     def get_default_config(self) -> dict[str, Any]:
         return {
@@ -74,29 +124,11 @@ class AntiNukeSystem(commands.Cog):
         }
 
     def save_config(self) -> None:
-        with Path(self.config_file).open("w") as f:
-            json.dump(self.config, f, indent = 4)
+        self.config_store.save(self.config)
 
     def is_director(self, member : discord.Member) -> bool:
         return any(role.id == self.DIRECTORS_ROLE_ID for role in member.roles)
 
-    def clean_old_actions(self, user_id : int, action_type: str) -> None:
-        now = datetime.now(UTC)
-
-        bucket = self.action_tracker[user_id][action_type]
-
-        bucket["hourly"] = [
-            timestamp
-            for timestamp in bucket["hourly"]
-            if timestamp > now - timedelta(hours=1)
-        ]
-
-        bucket["daily"] = [
-            timestamp
-            for timestamp in bucket["daily"]
-            if timestamp > now - timedelta(days=1)
-        ]
-
     async def track_action(
         self,
         guild : discord.Guild,
@@ -120,16 +152,16 @@ class AntiNukeSystem(commands.Cog):
         hourly_limit = limits.get("hourly", 999)
         daily_limit = limits.get("daily", 999)
 
-        if action_type not in self.action_tracker[user.id]:
-            self.action_tracker[user.id][action_type] = {"hourly": [], "daily": []}
+        hourly_count, daily_count = self.action_tracker[user.id][action_type].add(time.monotonic())
 
-        self.clean_old_actions(user.id, action_type)
-        now = datetime.now(UTC)
-        self.action_tracker[user.id][action_type]["hourly"].append(now)
-        self.action_tracker[user.id][action_type]["daily"].append(now)
-
-        hourly_count = len(self.action_tracker[user.id][action_type]["hourly"])
-        daily_count = len(self.action_tracker[user.id][action_type]["daily"])
+        if (
+            action_type in BURST_ACTIONS
+            and str(guild.id) in self.frozen_roles
+            and user.id not in self.contained[guild.id]
+        ):
+            self.contained[guild.id].add(user.id)
+            await self.quarantine_offender(guild, user, action_type, hourly_count, daily_count, "burst", details)
+            return False
 
         if hourly_count > hourly_limit:
             await self.quarantine_offender(guild, user, action_type, hourly_count, daily_count, "hourly", details)
@@ -144,6 +176,124 @@ class AntiNukeSystem(commands.Cog):
 
         return True
 
+    async def attribute(
+        self,
+        guild     : discord.Guild,
+        action    : discord.AuditLogAction,
+        target_id : int,
+    ) -> discord.AuditLogEntry | None:
+        # Under nuke load the gateway push often trails the event, so wait
+        # longer than logging does and confirm over REST on a miss.
+        return await AUDIT_LOG.fetch(guild, action, target_id, wait = AUDIT_SECURITY_WAIT, fallback = True)
+
+    def note_destructive_event(self, guild : discord.Guild) -> None:
+        if not self.config.get("enabled", True):
+            return
+
+        count = self.burst_counters[guild.id].add(time.monotonic())
+        if count < self.config.get("burst_threshold", BURST_THRESHOLD) or str(guild.id) in self.frozen_roles:
+            return
+
+        # Claim the guild before any await so concurrent events in the same
+        # burst do not start a second freeze.
+        self.frozen_roles[str(guild.id)] = {}
+        task = asyncio.create_task(self.freeze_guild(guild, count), name = f"antinuke-freeze:{guild.id}")
+        self._freeze_tasks.add(task)
+        task.add_done_callback(self._freeze_tasks.discard)
+
+    def freezable_roles(self, guild : discord.Guild) -> list[discord.Role]:
+        return [
+            role for role in guild.roles
+            if role.id != self.DIRECTORS_ROLE_ID
+            and not role.managed
+            and role < guild.me.top_role
+            and role.permissions.value & DANGEROUS_PERMISSIONS.value
+        ]
+
+    async def _freeze_role(
+        self,
+        role   : discord.Role,
+        frozen : dict[str, int],
+    ) -> None:
+        original = role.permissions.value
+        try:
+            _ = await role.edit(
+                permissions = discord.Permissions(original & ~DANGEROUS_PERMISSIONS.value),
+                reason      = "UB Anti-Nuke: Destructive burst detected, freezing dangerous permissions",
+            )
+        except discord.HTTPException:
+            log.exception("Failed to freeze role %s in %s", role.id, role.guild.id)
+            return
+        frozen[str(role.id)] = original
+
+    async def freeze_guild(
+        self,
+        guild : discord.Guild,
+        count : int,
+    ) -> None:
+        frozen = self.frozen_roles.setdefault(str(guild.id), {})
+        roles  = sorted(self.freezable_roles(guild), reverse = True)
+        _ = await asyncio.gather(*(self._freeze_role(role, frozen) for role in roles))
+        self.freeze_store.mark_dirty()
+        await self.freeze_store.flush()
+        await self.send_freeze_alert(guild, count, len(frozen))
+
+    async def release_freeze(self, guild : discord.Guild) -> int:
+        frozen   = self.frozen_roles.pop(str(guild.id), {})
+        restored = 0
+        for role_id, permissions in frozen.items():
+            role = guild.get_role(int(role_id))
+            if role is None:
+                continue
+            try:
+                _ = await role.edit(
+                    permissions = discord.Permissions(permissions),
+                    reason      = "UB Anti-Nuke: Containment released",
+                )
+            except discord.HTTPException:
+                log.exception("Failed to restore role %s in %s", role_id, guild.id)
+                continue
+            restored += 1
+
+        _ = self.contained.pop(guild.id, None)
+        self.freeze_store.mark_dirty()
+        return restored
+
+    async def send_freeze_alert(
+        self,
+        guild  : discord.Guild,
+        count  : int,
+        frozen : int,
+    ) -> None:
+        log_channel_id = self.config.get("log_channel_id")
+        if not log_channel_id:
+            return
+
+        log_channel = guild.get_channel(log_channel_id)
+        if not isinstance(log_channel, discord.TextChannel | discord.Thread):
+            return
+
+        embed = discord.Embed(
+            title       = "Anti-Nuke: Burst Containment",
+            description = "A burst of destructive events was detected. Dangerous permissions have been frozen on non-director roles.",
+            color       = COLOR_RED,
+            timestamp   = datetime.now(UTC),
+        )
+        _ = embed.add_field(
+            name   = "Events",
+            value  = f"{count} within {BURST_BUCKETS * BURST_BUCKET_SECONDS:g}s",
+            inline = True,
+        )
+        _ = embed.add_field(
+            name   = "Roles Frozen",
+            value  = str(frozen),
+            inline = True,
+        )
+        _ = embed.set_footer(text = "Use /anti-nuke release once the server is safe")
+
+        with contextlib.suppress(discord.Forbidden):
+            _ = await log_channel.send(embed = embed)
+
     async def quarantine_offender(
         self,
         guild : discord.Guild,
@@ -162,12 +312,22 @@ class AntiNukeSystem(commands.Cog):
         if not quarantine_role:
             return
 
-        saved_roles = [role.id for role in member.roles if role.id != guild.default_role.id]
+        swap        = plan_role_swap(member, add = [quarantine_role])
+        saved_roles = swap.removed
+
+        mod_data    = ModerationBase.ensure_data(self.bot)
+        quarantined = cast("dict[str, object]", mod_data.setdefault("quarantined", {}))
+        quarantined[str(member.id)] = {
+            "roles"          : saved_roles,
+            "quarantined_at" : datetime.now(UTC).isoformat(),
+            "quarantined_by" : self.bot.user.id if self.bot.user else None,
+            "reason"         : f"UB Anti-Nuke: {action_type} {limit_type} limit exceeded",
+        }
+        MODERATION_STORE.save(mod_data)
+        await MODERATION_STORE.flush()
 
         try:
-            roles_to_remove = [role for role in member.roles if role.id != guild.default_role.id]
-            await member.remove_roles(*roles_to_remove, reason = f"UB Anti-Nuke: Exceeded {action_type} {limit_type} limits")
-            await member.add_roles(quarantine_role, reason = f"UB Anti-Nuke: {action_type} {limit_type} limit exceeded")
+            await swap.apply(reason = f"UB Anti-Nuke: {action_type} {limit_type} limit exceeded")
 
             bot_member = guild.get_member(self.bot.user.id) if self.bot.user else None
             if bot_member:
@@ -196,6 +356,8 @@ class AntiNukeSystem(commands.Cog):
             await self.send_quarantine_alert(guild, member, action_type, hourly_count, daily_count, limit_type, details)
 
         except discord.Forbidden:
+            _ = quarantined.pop(str(member.id), None)
+            MODERATION_STORE.save(mod_data)
             await self.send_quarantine_failure(guild, member, action_type)
 
     async def send_warning(
@@ -350,23 +512,16 @@ class AntiNukeSystem(commands.Cog):
         channel : discord.abc.GuildChannel,
     ) -> None:
         guild = channel.guild
-
-        async for entry in guild.audit_logs(
-            limit  = 1,
-            action = discord.AuditLogAction.channel_delete,
-        ):
-            if (
-                entry.target
-                and entry.target.id == channel.id
-                and entry.user
-            ):
-                _ = await self.track_action(
-                    guild,
-                    entry.user,
-                    ActionType.CHANNEL_DELETE,
-                    f"Deleted channel: {channel.name}",
-                )
-                break
+        self.note_destructive_event(guild)
+
+        entry = await self.attribute(guild, discord.AuditLogAction.channel_delete, channel.id)
+        if entry is not None and entry.user:
+            _ = await self.track_action(
+                guild,
+                entry.user,
+                ActionType.CHANNEL_DELETE,
+                f"Deleted channel: {channel.name}",
+            )
 
     @commands.Cog.listener("on_guild_channel_create")
     async def on_guild_channel_create(
@@ -375,19 +530,14 @@ class AntiNukeSystem(commands.Cog):
     ) -> None:
         guild = channel.guild
 
-        async for entry in guild.audit_logs(limit=1, action=discord.AuditLogAction.channel_create):
-            if (
-                entry.target
-                and entry.target.id == channel.id
-                and entry.user
-            ):
-                _ = await self.track_action(
-                    guild,
-                    entry.user,
-                    ActionType.CHANNEL_CREATE,
-                    f"Created channel: {channel.name}",
-                )
-                break
+        entry = await self.attribute(guild, discord.AuditLogAction.channel_create, channel.id)
+        if entry is not None and entry.user:
+            _ = await self.track_action(
+                guild,
+                entry.user,
+                ActionType.CHANNEL_CREATE,
+                f"Created channel: {channel.name}",
+            )
 
     @commands.Cog.listener("on_guild_channel_update")
     async def on_guild_channel_update(
@@ -400,22 +550,14 @@ class AntiNukeSystem(commands.Cog):
 
         guild = after.guild
 
-        async for entry in guild.audit_logs(
-            limit  = 1,
-            action = discord.AuditLogAction.channel_update,
-        ):
-            if (
-                entry.target
-                and entry.target.id == after.id
-                and entry.user
-            ):
-                _ = await self.track_action(
-                    guild,
-                    entry.user,
-                    ActionType.CHANNEL_UPDATE,
-                    f"Renamed channel: {before.name} → {after.name}",
-                )
-                break
+        entry = await self.attribute(guild, discord.AuditLogAction.channel_update, after.id)
+        if entry is not None and entry.user:
+            _ = await self.track_action(
+                guild,
+                entry.user,
+                ActionType.CHANNEL_UPDATE,
+                f"Renamed channel: {before.name} → {after.name}",
+            )
 
     @commands.Cog.listener("on_guild_role_delete")
     async def on_guild_role_delete(
@@ -423,23 +565,16 @@ class AntiNukeSystem(commands.Cog):
         role : discord.Role,
     ) -> None:
         guild = role.guild
-
-        async for entry in guild.audit_logs(
-            limit = 1,
-            action = discord.AuditLogAction.role_delete,
-        ):
-            if (
-                entry.target
-                and entry.target.id == role.id
-                and entry.user
-            ):
-                _ = await self.track_action(
-                    guild,
-                    entry.user,
-                    ActionType.ROLE_DELETE,
-                    f"Deleted role: {role.name}",
-                )
-                break
+        self.note_destructive_event(guild)
+
+        entry = await self.attribute(guild, discord.AuditLogAction.role_delete, role.id)
+        if entry is not None and entry.user:
+            _ = await self.track_action(
+                guild,
+                entry.user,
+                ActionType.ROLE_DELETE,
+                f"Deleted role: {role.name}",
+            )
 
     @commands.Cog.listener("on_guild_role_create")
     async def on_guild_role_create(
@@ -448,19 +583,14 @@ class AntiNukeSystem(commands.Cog):
     ) -> None:
         guild = role.guild
 
-        async for entry in guild.audit_logs(limit=1, action=discord.AuditLogAction.role_create):
-            if (
-                entry.target
-                and entry.target.id == role.id
-                and entry.user
-            ):
-                _ = await self.track_action(
-                    guild,
-                    entry.user,
-                    ActionType.ROLE_CREATE,
-                    f"Created role: {role.name}",
-                )
-                break
+        entry = await self.attribute(guild, discord.AuditLogAction.role_create, role.id)
+        if entry is not None and entry.user:
+            _ = await self.track_action(
+                guild,
+                entry.user,
+                ActionType.ROLE_CREATE,
+                f"Created role: {role.name}",
+            )
 
     @commands.Cog.listener("on_guild_role_update")
     async def on_guild_role_update(
@@ -473,19 +603,14 @@ class AntiNukeSystem(commands.Cog):
 
         guild = after.guild
 
-        async for entry in guild.audit_logs(limit=1, action=discord.AuditLogAction.role_update):
-            if (
-                entry.target
-                and entry.target.id == after.id
-                and entry.user
-            ):
-                _ = await self.track_action(
-                    guild,
-                    entry.user,
-                    ActionType.ROLE_UPDATE,
-                    f"Renamed role: {before.name} → {after.name}",
-                )
-                break
+        entry = await self.attribute(guild, discord.AuditLogAction.role_update, after.id)
+        if entry is not None and entry.user:
+            _ = await self.track_action(
+                guild,
+                entry.user,
+                ActionType.ROLE_UPDATE,
+                f"Renamed role: {before.name} → {after.name}",
+            )
 
 async def setup(bot : commands.Bot) -> None:
     await bot.add_cog(AntiNukeSystem(cast("UtilityBot", bot)))
@@ -47,6 +47,7 @@ from core.state.application_state import (
     save_active_applications,
 )
 from core.state.blacklist_state import BLACKLIST
+from core.user_resolver import user_resolver
 
 ADMIN_ROLE_IDS = {
     JUNIOR_ADMINISTRATORS_ROLE_ID,
@@ -231,7 +232,7 @@ class DecisionModal(Modal, title = "Decision Reason"):
                     _ = await channel.edit(locked = True, archived = True)
 
         _ = ACTIVE_APPLICATIONS.pop(self.applicant_id, None)
-        save_active_applications()
+        save_active_applications(self.applicant_id)
 
 # ⸻⸻⸻⸻⸻⸻⸻⸻⸻⸻⸻⸻⸻⸻
 # Decision View
@@ -360,7 +361,7 @@ class DecisionView(View):
         __ = await interaction.response.defer(ephemeral = True)
 
         applicant_id = data["applicant_id"]
-        cases        = cases_cog.cases_manager.get_cases(guild_id = guild.id, user_id = applicant_id)
+        cases        = await cases_cog.cases_manager.get_cases(guild_id = guild.id, user_id = applicant_id)
 
         if not cases:
             embed = discord.Embed(
@@ -370,10 +371,10 @@ class DecisionView(View):
             await interaction.followup.send(embed = embed, ephemeral = True)
             return
 
-        applicant = interaction.client.get_user(applicant_id)
-        if not applicant:
-            with contextlib.suppress(discord.NotFound):
-                applicant = await interaction.client.fetch_user(applicant_id)
+        users     = await user_resolver(interaction.client).resolve_many(
+            [applicant_id, *(case["moderator_id"] for case in cases)],
+        )
+        applicant = users[applicant_id]
 
         title = f"Case History — {applicant if applicant else applicant_id}"
 
@@ -381,19 +382,15 @@ class DecisionView(View):
 
         for case in cases:
             case_type_display = case["type"].replace("_", " ").title()
-            timestamp         = datetime.fromisoformat(case["timestamp"])
+            timestamp         = datetime.fromisoformat(case["created_at"])
 
             value_parts = [f"**Type:** {case_type_display}"]
 
-            mod = interaction.client.get_user(case["moderator_id"])
+            mod = users[case["moderator_id"]]
             if mod:
                 value_parts.append(f"**Moderator:** {mod.mention}")
             else:
-                with contextlib.suppress(discord.NotFound):
-                    mod = await interaction.client.fetch_user(case["moderator_id"])
-                    value_parts.append(f"**Moderator:** {mod.mention}")
-                if not mod:
-                    value_parts.append(f"**Moderator:** {case['moderator_name']}")
+                value_parts.append(f"**Moderator:** {case['moderator_name']}")
 
             if case.get("duration"):
                 value_parts.append(f"**Duration:** {case['duration']}")
@@ -469,7 +466,7 @@ async def delete_application_messages(client : discord.Client, user_id : int) ->
             await msg.delete()
 
     __ = ACTIVE_APPLICATIONS.pop(user_id, None)
-    save_active_applications()
+    save_active_applications(user_id)
 
 # ⸻⸻⸻⸻⸻⸻⸻⸻⸻⸻⸻⸻⸻⸻
 # Role Gate Logic
@@ -580,7 +577,7 @@ class ApplicationSubmitView(View):
         ACTIVE_APPLICATIONS[self.user_id]["thread_id"]      = thread.id
         ACTIVE_APPLICATIONS[self.user_id]["log_message_id"] = msg.id
         ACTIVE_APPLICATIONS[self.user_id]["applicant_id"]   = self.user_id
-        save_active_applications()
+        save_active_applications(self.user_id)
 
         __ = await send_custom_message(
             interaction,
@@ -745,7 +742,7 @@ class ApplicationMenuView(View):
             "channel_id": None,
             "messages":  [],
         }
-        save_active_applications()
+        save_active_applications(interaction.user.id)
 
         dm  = await interaction.user.create_dm()
         msg = await dm.send(
@@ -756,7 +753,7 @@ class ApplicationMenuView(View):
         data               = ACTIVE_APPLICATIONS[interaction.user.id]
         data["channel_id"] = dm.id
         data["messages"].append(msg.id)
-        save_active_applications()
+        save_active_applications(interaction.user.id)
 
         _ = await send_custom_message(
             interaction,
@@ -829,7 +826,7 @@ class ApplicationMenuView(View):
             "channel_id": None,
             "messages":  [],
         }
-        save_active_applications()
+        save_active_applications(interaction.user.id)
 
         dm  = await interaction.user.create_dm()
         msg = await dm.send(
@@ -840,7 +837,7 @@ class ApplicationMenuView(View):
         data               = ACTIVE_APPLICATIONS[interaction.user.id]
         data["channel_id"] = dm.id
         data["messages"].append(msg.id)
-        save_active_applications()
+        save_active_applications(interaction.user.id)
 
         _ = await send_custom_message(
             interaction,
@@ -919,7 +916,7 @@ class EditQuestionSelect(Select[View]):
         data["index"]     = int(self.values[0])
         data["editing"]   = True
         data["reviewing"] = False
-        save_active_applications()
+        save_active_applications(self.user_id)
 
         _ = await send_custom_message(
             interaction,